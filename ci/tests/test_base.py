@@ -1,4 +1,8 @@
+import threading
+import time
+
 import pytest
+from flask import request
 from flask_openapi.openapi import Swagger
 
 
@@ -68,3 +72,287 @@ def test_get_apispecs_with_valid_endpoint(app):
 
     with app.app_context():
         assert swagger.get_apispecs(Swagger.DEFAULT_ENDPOINT)
+
+
+def test_parse_uses_operation_index(app, capsys):
+    swagger = Swagger(app, parse=True)
+
+    @app.route("/items/<int:item_id>", methods=["GET"])
+    def get_item(item_id):
+        """
+        Get an item
+        ---
+        parameters:
+          - name: item_id
+            in: path
+            type: integer
+            required: true
+          - name: limit
+            in: query
+            type: integer
+        responses:
+          200:
+            description: an item
+        """
+        from flask import request
+
+        return {"parsed": request.parsed_data["args"]}
+
+    @app.route("/health")
+    def health():
+        return "ok"
+
+    client = app.test_client()
+    assert client.get("/items/1?limit=3").json == {"parsed": {"limit": 3}}
+    assert client.get("/health").data == b"ok"
+
+    index = swagger.operation_index
+    assert [key[1] for key in index] == ["GET"]
+    assert client.get("/items/2").status_code == 200
+    assert swagger.operation_index is index
+    assert capsys.readouterr().out == ""
+
+
+def test_spec_endpoints_share_one_extraction(app, monkeypatch):
+    from flask_openapi import openapi
+
+    calls = []
+    get_specs = openapi.get_specs
+
+    def counting_get_specs(*args, **kwargs):
+        calls.append(args)
+        return get_specs(*args, **kwargs)
+
+    monkeypatch.setattr(openapi, "get_specs", counting_get_specs)
+
+    config = dict(Swagger.DEFAULT_CONFIG)
+    config["specs"] = [
+        {"endpoint": "all", "route": "/all.json"},
+        {
+            "endpoint": "users",
+            "route": "/users.json",
+            "rule_filter": lambda rule: rule.rule.startswith("/users"),
+        },
+    ]
+    swagger = Swagger(app, config=config)
+
+    @app.route("/users")
+    def users():
+        """
+        List users
+        ---
+        responses:
+          200:
+            description: users
+        """
+
+    @app.route("/pets")
+    def pets():
+        """
+        List pets
+        ---
+        responses:
+          200:
+            description: pets
+        """
+
+    with app.app_context():
+        all_paths = swagger.get_apispecs("all")["paths"]
+        user_paths = swagger.get_apispecs("users")["paths"]
+
+    assert {"/users", "/pets"} <= set(all_paths)
+    assert list(user_paths) == ["/users"]
+    assert len(calls) == 1
+
+
+def test_rules_filtered_out_are_not_extracted(app, monkeypatch):
+    from flask_openapi import openapi
+
+    extracted = []
+    get_specs = openapi.get_specs
+
+    def recording_get_specs(rules, *args, **kwargs):
+        rules = list(rules)
+        extracted.append(sorted(rule.rule for rule in rules))
+        return get_specs(rules, *args, **kwargs)
+
+    monkeypatch.setattr(openapi, "get_specs", recording_get_specs)
+
+    config = dict(Swagger.DEFAULT_CONFIG)
+    config["specs"] = [
+        {
+            "endpoint": prefix,
+            "route": "/{0}.json".format(prefix),
+            "rule_filter": lambda rule, prefix=prefix: rule.rule == "/" + prefix,
+        }
+        for prefix in ("users", "pets")
+    ]
+    swagger = Swagger(app, config=config)
+
+    for path in ("/users", "/pets", "/admin"):
+        app.add_url_rule(path, path, lambda: "ok")
+
+    with app.app_context():
+        swagger.get_apispecs("users")
+        swagger.get_apispecs("pets")
+        swagger.get_apispecs("users")
+
+    assert extracted == [["/users"], ["/pets"]]
+
+
+def test_concurrent_first_requests_build_once(app, monkeypatch):
+    from flask_openapi import openapi
+
+    calls = []
+    get_specs = openapi.get_specs
+
+    def slow_get_specs(*args, **kwargs):
+        calls.append(args)
+        time.sleep(0.1)
+        return get_specs(*args, **kwargs)
+
+    monkeypatch.setattr(openapi, "get_specs", slow_get_specs)
+    swagger = Swagger(app)
+    endpoint = swagger.config["specs"][0]["endpoint"]
+    results = []
+
+    def build():
+        with app.app_context():
+            results.append(swagger.get_apispecs(endpoint))
+
+    threads = [threading.Thread(target=build) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+
+
+@pytest.mark.parametrize("processes", [0, 2])
+def test_parallel_extraction_matches_serial(tmp_path, processes):
+    from flask import Flask
+    from flask_openapi import swag_from
+    from flask_openapi.core.specs import get_specs
+
+    app = Flask(__name__)
+    for index in range(20):
+        spec_file = tmp_path / "op{0}.yml".format(index)
+        spec_file.write_text(
+            "Operation {0}\n---\nparameters:\n  - name: q{0}\n    in: query\n"
+            "    type: string\nresponses:\n  200:\n    description: ok\n".format(index)
+        )
+
+        def view():
+            """
+            Docstring view
+            ---
+            responses:
+              200:
+                description: ok
+            """
+
+        view = swag_from(str(spec_file))(view) if index % 2 else view
+        app.add_url_rule("/op{0}".format(index), "op{0}".format(index), view)
+
+    def extract(**kwargs):
+        with app.app_context():
+            specs = get_specs(
+                app.url_map.iter_rules(), {"HEAD", "OPTIONS"}, [], str, None, **kwargs
+            )
+        return [(rule.rule, verbs) for rule, verbs in specs]
+
+    parallel = extract(workers=4, processes=processes)
+    assert parallel == extract()
+    assert len(parallel) == 20
+
+
+def test_extractions_share_one_spawned_process_pool():
+    from flask_openapi.core.specs import process_pool
+
+    pool = process_pool(2)
+
+    assert process_pool(2) is pool
+    assert pool._mp_context.get_start_method() == "spawn"
+
+
+def test_rules_added_later_are_merged_incrementally(app, monkeypatch):
+    from flask import Blueprint
+    from flask_openapi import openapi
+
+    extracted = []
+    get_specs = openapi.get_specs
+
+    def recording_get_specs(rules, *args, **kwargs):
+        rules = list(rules)
+        extracted.append([rule.rule for rule in rules])
+        return get_specs(rules, *args, **kwargs)
+
+    monkeypatch.setattr(openapi, "get_specs", recording_get_specs)
+    swagger = Swagger(app, parse=True)
+    endpoint = swagger.config["specs"][0]["endpoint"]
+
+    def documented(description):
+        def view(**kwargs):
+            return {"parsed": request.parsed_data["args"]}
+
+        view.__doc__ = """
+        {0}
+        ---
+        parameters:
+          - name: limit
+            in: query
+            type: integer
+        responses:
+          200:
+            description: {0}
+        """.format(description)
+        return view
+
+    app.add_url_rule("/pets", "pets", documented("pets"))
+    with app.app_context():
+        first = swagger.get_apispecs(endpoint)
+    swagger.warm_up()
+
+    blueprint = Blueprint("owners", __name__)
+    blueprint.add_url_rule("/owners/<int:owner_id>", "owner", documented("owner"))
+    app.register_blueprint(blueprint)
+
+    with app.app_context():
+        second = swagger.get_apispecs(endpoint)
+
+    assert extracted[1:] == [["/owners/<int:owner_id>"]]
+    assert "/owners/{owner_id}" in second["paths"]
+    assert "/pets" in second["paths"]
+    assert "/owners/{owner_id}" not in first["paths"]
+
+    client = app.test_client()
+    assert client.get("/owners/1?limit=2").json == {"parsed": {"limit": 2}}
+    assert len(extracted) == 2
+
+
+def test_rules_counted_again_only_once_added(app, monkeypatch):
+    swagger = Swagger(app)
+    endpoint = swagger.config["specs"][0]["endpoint"]
+    with app.app_context():
+        swagger.get_apispecs(endpoint)
+
+    count = swagger.rule_count()
+    walks = []
+    iter_rules = app.url_map.iter_rules
+
+    def counting_iter_rules(*args, **kwargs):
+        walks.append(args)
+        return iter_rules(*args, **kwargs)
+
+    monkeypatch.setattr(app.url_map, "iter_rules", counting_iter_rules)
+    with app.app_context():
+        for _ in range(3):
+            swagger.get_apispecs(endpoint)
+    assert walks == []
+
+    app.add_url_rule("/pets", "pets", lambda: "ok")
+    assert swagger.rule_count() == count + 1
+    assert swagger.specs_outdated()
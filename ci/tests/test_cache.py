@@ -0,0 +1,67 @@
+import threading
+
+from flask_openapi.utils.cache import SingleFlight
+
+
+def run_concurrently(function, count=8):
+    results = []
+    threads = [
+        threading.Thread(target=lambda: results.append(function()))
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return results
+
+
+def test_single_flight_builds_once_for_concurrent_callers():
+    flight = SingleFlight()
+    release = threading.Event()
+    builds = []
+
+    def build():
+        builds.append(1)
+        release.wait(5)
+        return object()
+
+    def call():
+        return flight.do("key", build)
+
+    timer = threading.Timer(0.1, release.set)
+    timer.start()
+    results = run_concurrently(call)
+
+    assert len(builds) == 1
+    assert len(results) == 8
+    assert all(result is results[0] for result in results)
+    # nothing is kept once handed out
+    assert flight.do("key", lambda: 1) == 1
+
+
+def test_single_flight_shares_errors():
+    flight = SingleFlight()
+    release = threading.Event()
+    errors = []
+
+    def build():
+        release.wait(5)
+        raise ValueError("broken")
+
+    def call():
+        try:
+            flight.do("key", build)
+        except ValueError as e:
+            errors.append(e)
+
+    threading.Timer(0.1, release.set).start()
+    run_concurrently(call, 4)
+
+    assert len(errors) == 4
+
+
+def test_single_flight_reentrant_build():
+    flight = SingleFlight()
+
+    assert flight.do("key", lambda: flight.do("key", lambda: 2) + 1) == 3
@@ -0,0 +1,207 @@
+import pytest
+from jsonschema import FormatChecker, SchemaError, ValidationError
+from jsonschema.validators import validator_for
+
+from flask_openapi.core.codegen import (
+    CodegenValidator,
+    UnsupportedSchema,
+    clear_codegen_cache,
+    codegen_validate,
+    codegen_validator_for,
+    generate_module,
+    generate_source,
+)
+
+PET = {
+    "type": "object",
+    "required": ["name"],
+    "additionalProperties": False,
+    "properties": {
+        "name": {"type": "string", "minLength": 1, "pattern": "^[a-z]+$"},
+        "age": {"type": "integer", "minimum": 0, "exclusiveMaximum": 100},
+        "weight": {"type": "number", "multipleOf": 0.5},
+        "kind": {"enum": ["cat", "dog"]},
+        "tags": {
+            "type": "array",
+            "maxItems": 2,
+            "uniqueItems": True,
+            "items": {"type": "string"},
+        },
+        "owner": {"type": ["object", "null"], "properties": {"id": {"const": 1}}},
+        "extra": {"anyOf": [{"type": "string"}, {"type": "boolean"}]},
+        "one": {"oneOf": [{"type": "integer"}, {"minimum": 3}]},
+        "never": {"not": {"type": "string"}},
+        "mixed": {"enum": [1, None, [1]]},
+    },
+}
+
+CASES = [
+    {"name": "rex"},
+    {"name": ""},
+    {"name": "Rex"},
+    {},
+    [],
+    {"name": "rex", "other": 1},
+    {"name": "rex", "age": 3},
+    {"name": "rex", "age": 3.0},
+    {"name": "rex", "age": 3.5},
+    {"name": "rex", "age": True},
+    {"name": "rex", "age": -1},
+    {"name": "rex", "age": 100},
+    {"name": "rex", "weight": 2.5},
+    {"name": "rex", "weight": 2.2},
+    {"name": "rex", "kind": "cat"},
+    {"name": "rex", "kind": "cow"},
+    {"name": "rex", "kind": 1},
+    {"name": "rex", "tags": ["a", "b"]},
+    {"name": "rex", "tags": ["a", "a"]},
+    {"name": "rex", "tags": ["a", 1]},
+    {"name": "rex", "tags": ["a", "b", "c"]},
+    {"name": "rex", "owner": None},
+    {"name": "rex", "owner": {"id": 1}},
+    {"name": "rex", "owner": {"id": True}},
+    {"name": "rex", "owner": {"id": 1.0}},
+    {"name": "rex", "extra": False},
+    {"name": "rex", "extra": 1},
+    {"name": "rex", "one": 1},
+    {"name": "rex", "one": 3.5},
+    {"name": "rex", "one": 4},
+    {"name": "rex", "never": 1},
+    {"name": "rex", "never": "x"},
+    {"name": "rex", "mixed": [1]},
+    {"name": "rex", "mixed": [True]},
+    {"name": "rex", "mixed": False},
+]
+
+TREE = {
+    "type": "object",
+    "required": ["name"],
+    "properties": {
+        "name": {"type": "string"},
+        "children": {"type": "array", "items": {"$ref": "#/definitions/Node"}},
+    },
+    "definitions": {"Node": {"$ref": "#"}},
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_codegen_cache()
+    yield
+    clear_codegen_cache()
+
+
+def jsonschema_error(schema, data):
+    try:
+        validator_for(schema)(schema).validate(data)
+    except ValidationError as error:
+        return error
+    return None
+
+
+@pytest.mark.parametrize("data", CASES)
+def test_matches_jsonschema(data):
+    validator = CodegenValidator(PET)
+    expected = jsonschema_error(PET, data)
+
+    assert validator.generated
+    assert validator.is_valid(data) is (expected is None)
+
+    if expected is None:
+        validator.validate(data)
+    else:
+        with pytest.raises(ValidationError) as error:
+            validator.validate(data)
+        assert error.value.message == expected.message
+        assert error.value.path == expected.path
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"name": "a"},
+        {"name": "a", "children": [{"name": "b", "children": [{"name": "c"}]}]},
+        {"name": "a", "children": [{"name": "b", "children": [{}]}]},
+    ],
+)
+def test_recursive_reference(data):
+    validator = CodegenValidator(TREE)
+
+    assert validator.is_valid(data) is (jsonschema_error(TREE, data) is None)
+
+
+def test_format_checked_with_checker():
+    schema = {"type": "string", "format": "ipv4"}
+
+    assert CodegenValidator(schema).is_valid("nope")
+    assert not CodegenValidator(schema, FormatChecker()).is_valid("nope")
+    assert CodegenValidator(schema, FormatChecker()).is_valid("127.0.0.1")
+
+
+def test_deep_nesting_compiles():
+    schema = {"type": "string"}
+    for _ in range(30):
+        schema = {"type": "array", "items": {"properties": {"a": schema}}}
+
+    def nest(leaf):
+        for _ in range(30):
+            leaf = [{"a": leaf}]
+        return leaf
+
+    validator = CodegenValidator(schema)
+    assert validator.is_valid(nest("x"))
+    assert not validator.is_valid(nest(1))
+
+
+def test_unsupported_keywords_fall_back_to_jsonschema():
+    schema = {"type": "object", "patternProperties": {"^x": {"type": "integer"}}}
+    validator = CodegenValidator(schema)
+
+    assert not validator.generated
+    assert validator.is_valid({"xa": 1})
+    assert not validator.is_valid({"xa": "1"})
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        {"type": "number", "exclusiveMinimum": 0, "exclusiveMaximum": 1},
+        {
+            "$schema": "http://json-schema.org/draft-04/schema#",
+            "minimum": 0,
+            "exclusiveMinimum": True,
+            "maximum": 1,
+            "exclusiveMaximum": False,
+        },
+    ],
+)
+@pytest.mark.parametrize("data", [-1, 0, 0.5, 1, 2])
+def test_exclusive_bounds_match_jsonschema(schema, data):
+    validator = CodegenValidator(schema)
+
+    assert validator.is_valid(data) is (jsonschema_error(schema, data) is None)
+
+
+@pytest.mark.parametrize("bound", [True, False, "0"])
+def test_non_numeric_exclusive_bounds_not_generated(bound):
+    with pytest.raises(UnsupportedSchema):
+        generate_source({"minimum": 0, "exclusiveMinimum": bound})
+
+
+def test_module_leaves_out_invalid_schemas():
+    namespace = {}
+    exec(generate_module([{"type": "number", "multipleOf": -1}, PET]), namespace)
+
+    assert len(namespace["VALIDATORS"]) == 1
+    with pytest.raises(SchemaError):
+        CodegenValidator({"type": "number", "multipleOf": -1})
+
+
+def test_validation_function_caches_validators():
+    schema = {"type": "integer"}
+
+    codegen_validate(1, schema)
+    with pytest.raises(ValidationError):
+        codegen_validate("1", schema)
+
+    assert codegen_validator_for(schema) is codegen_validator_for(schema)
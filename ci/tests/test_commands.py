@@ -1,7 +1,14 @@
 import json
 
 from flask_openapi.openapi import Swagger
-from flask_openapi.core.commands import generate_api_schema
+from flask_openapi.core.codegen import (
+    clear_precompiled,
+    CodegenValidator,
+    load_precompiled,
+)
+from flask_openapi.core.commands import generate_api_schema, generate_validators
+from flask_openapi.core.decorators import swag_from
+from flask_openapi.core.validation import clear_validator_cache, get_compiled_schema
 
 
 def test_default_specs(app, cli_runner):
@@ -49,3 +56,77 @@ def test_definitions_is_removed_for_openapi_3(app, cli_runner):
     result = cli_runner.invoke(generate_api_schema)
     assert result.exit_code == 0
     assert "definitions" not in json.loads(result.output)
+
+
+def test_generate_validators(app, cli_runner, tmp_path, monkeypatch):
+    swagger = Swagger(app)
+    pet = {
+        "parameters": [
+            {
+                "in": "body",
+                "name": "body",
+                "schema": {
+                    "id": "Pet",
+                    "required": ["name"],
+                    "properties": {"name": {"type": "string"}},
+                },
+            }
+        ],
+        "responses": {"200": {"description": "ok"}},
+    }
+
+    @app.route("/pets", methods=["POST"])
+    @swag_from(pet, validation=True)
+    def create_pet():
+        return "ok"
+
+    @app.route("/other_pets", methods=["POST"])
+    @swagger.validate("Pet")
+    @swag_from(pet)
+    def create_other_pet():
+        return "ok"
+
+    module = tmp_path / "pet_validators.py"
+    result = cli_runner.invoke(generate_validators, ["-f", str(module)])
+
+    assert result.exit_code == 0, result.stderr
+    source = module.read_text()
+    assert source.count("def build_") == 1
+
+    monkeypatch.syspath_prepend(str(tmp_path))
+    try:
+        assert load_precompiled("pet_validators") == 1
+        clear_validator_cache()
+
+        client = app.test_client()
+        assert client.post("/pets", json={"name": "rex"}).status_code == 200
+        assert client.post("/pets", json={"name": 1}).status_code == 400
+        assert client.post("/other_pets", json={"name": 1}).status_code == 400
+
+        compiled = get_compiled_schema(specs=pet)
+        assert isinstance(compiled.get_validator(), CodegenValidator)
+    finally:
+        clear_precompiled()
+        clear_validator_cache()
+
+
+def test_check_api_schema(app, cli_runner, tmp_path):
+    Swagger(app)
+    target = tmp_path / "spec.json"
+
+    result = cli_runner.invoke(generate_api_schema, ["-f", str(target)])
+    assert result.exit_code == 0
+    written = target.read_text()
+
+    result = cli_runner.invoke(generate_api_schema, ["--check", "-f", str(target)])
+    assert result.exit_code == 0, result.stderr
+
+    target.write_text(written.replace("paths", "stale_paths"))
+    result = cli_runner.invoke(generate_api_schema, ["--check", "-f", str(target)])
+    assert result.exit_code == 1
+    assert "outdated" in result.stderr
+    # checking never rewrites the file
+    assert "stale_paths" in target.read_text()
+
+    result = cli_runner.invoke(generate_api_schema, ["--check"])
+    assert result.exit_code == 2
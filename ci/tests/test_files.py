@@ -0,0 +1,109 @@
+import os
+
+import pytest
+import yaml
+
+from flask_openapi.utils import files
+from flask_openapi.utils.files import clear_file_cache, load_yaml, read_file
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_file_cache()
+    yield
+    clear_file_cache()
+
+
+@pytest.fixture
+def count_loads(monkeypatch):
+    calls = []
+    original = yaml.safe_load
+
+    def safe_load(content):
+        calls.append(content)
+        return original(content)
+
+    monkeypatch.setattr(files.yaml, "safe_load", safe_load)
+    return calls
+
+
+def test_load_yaml_parses_file_once(tmp_path, count_loads):
+    path = tmp_path / "spec.yml"
+    path.write_text("a: 1\n")
+
+    content = read_file(str(path))
+    assert load_yaml(content, str(path)) == {"a": 1}
+    assert load_yaml(content, str(path)) == {"a": 1}
+    assert len(count_loads) == 1
+
+
+def test_load_yaml_returns_copies(tmp_path):
+    path = tmp_path / "spec.yml"
+    path.write_text("a: [1]\n")
+
+    first = load_yaml(read_file(str(path)), str(path))
+    first["a"].append(2)
+
+    assert load_yaml(read_file(str(path)), str(path)) == {"a": [1]}
+
+
+def test_file_change_invalidates_cache(tmp_path, count_loads):
+    path = tmp_path / "spec.yml"
+    path.write_text("a: 1\n")
+    load_yaml(read_file(str(path)), str(path))
+
+    path.write_text("a: 22\n")
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1000))
+
+    assert load_yaml(read_file(str(path)), str(path)) == {"a": 22}
+    assert len(count_loads) == 2
+
+
+def test_docstring_yaml_cached_by_content(count_loads):
+    assert load_yaml("b: 2") == {"b": 2}
+    assert load_yaml("b: 2") == {"b": 2}
+    assert len(count_loads) == 1
+
+
+def test_preload_yaml_returns_parsed(tmp_path, count_loads):
+    path = tmp_path / "spec.yml"
+    path.write_text("a: 1\n")
+
+    preloaded = files.preload_yaml(
+        [("a: 1\n", str(path)), ("b: 2", None), ("b: [", None)]
+    )
+    loads = len(count_loads)
+
+    assert preloaded == {"a: 1\n": {"a": 1}, "b: 2": {"b": 2}}
+    assert load_yaml(read_file(str(path)), str(path), preloaded=preloaded) == {"a": 1}
+    assert load_yaml("b: 2", preloaded=preloaded) == {"b": 2}
+    assert len(count_loads) == loads
+    with pytest.raises(yaml.YAMLError):
+        load_yaml("b: [", preloaded=preloaded)
+
+
+def test_preloaded_docstrings_parsed_once_beyond_cache_size(monkeypatch, count_loads):
+    from flask import Flask
+    from flask_openapi.core.specs import get_specs
+    from flask_openapi.utils.cache import LRUCache
+
+    monkeypatch.setattr(files, "_yaml_cache", LRUCache(maxsize=2))
+    app = Flask(__name__)
+    for index in range(6):
+
+        def view():
+            pass
+
+        view.__doc__ = "View\n---\nresponses:\n  20{0}:\n    description: ok\n".format(
+            index
+        )
+        app.add_url_rule("/op{0}".format(index), "op{0}".format(index), view)
+
+    with app.app_context():
+        specs = get_specs(
+            app.url_map.iter_rules(), {"HEAD", "OPTIONS"}, [], str, None, workers=4
+        )
+
+    assert len(specs) == 6
+    assert len(count_loads) == 6
@@ -0,0 +1,58 @@
+from flask_openapi.core.marshmallow_apispec import (
+    clear_conversion_cache,
+    convert_schemas,
+    conversion_cache_info,
+    fields,
+    Schema,
+)
+
+
+class TagSchema(Schema):
+    label = fields.Str(required=True)
+
+
+def test_schema_classes_converted_once():
+    clear_conversion_cache()
+    specs = {"parameters": TagSchema, "responses": {"200": {"schema": TagSchema}}}
+
+    first = convert_schemas(specs, {})
+    first["parameters"][0]["name"] = "changed"
+    second_definitions = {}
+    second = convert_schemas(specs, second_definitions)
+
+    assert second["parameters"][0]["name"] != "changed"
+    assert second_definitions["TagSchema"]["required"] == ["label"]
+    assert conversion_cache_info().misses == 2
+    clear_conversion_cache()
+
+
+def test_definitions_default_not_shared():
+    convert_schemas({"responses": {"200": {"schema": TagSchema}}})
+
+    assert convert_schemas.__defaults__[0] is None
+
+
+def test_oas3_specs_keep_2_0_conversions(app):
+    from flask_openapi.core.marshmallow_apispec import SwaggerView
+    from flask_openapi.openapi import Swagger
+
+    class NoteSchema(Schema):
+        author = fields.Str(required=True)
+        text = fields.Str(allow_none=True)
+
+    class NoteView(SwaggerView):
+        parameters = NoteSchema
+        responses = {"200": {"description": "ok"}}
+
+        def post(self):
+            return "ok"
+
+    app.add_url_rule("/notes", view_func=NoteView.as_view("notes"))
+    swagger = Swagger(app, config={"openapi": "3.0.2"}, merge=True)
+
+    with app.app_context():
+        spec = swagger.get_apispecs(swagger.config["specs"][0]["endpoint"])
+
+    text = spec["components"]["schemas"]["NoteSchema"]["properties"]["text"]
+    assert text["x-nullable"] is True
+    assert "nullable" not in text
@@ -0,0 +1,181 @@
+import pytest
+from flask import Flask
+from werkzeug.exceptions import BadRequest
+
+from flask_openapi.core.request_parser import coerce_value, ParameterParser
+
+
+@pytest.mark.parametrize(
+    "value, type_name, expected",
+    [
+        ("3", "integer", 3),
+        ("3.5", "integer", "3.5"),
+        ("3.5", "number", 3.5),
+        ("true", "boolean", True),
+        ("0", "boolean", False),
+        ("maybe", "boolean", "maybe"),
+        ("3", "string", "3"),
+        ("3", None, "3"),
+    ],
+)
+def test_coerce_value(value, type_name, expected):
+    assert coerce_value(value, type_name) == expected
+
+
+def test_parse_args_extracts_and_coerces():
+    parser = ParameterParser("args")
+    parser.add_parameter({"name": "limit", "in": "query", "type": "integer"})
+    parser.add_parameter(
+        {"name": "ids", "in": "query", "type": "array", "items": {"type": "integer"}}
+    )
+    parser.add_parameter(
+        {
+            "name": "tag",
+            "in": "query",
+            "type": "array",
+            "collectionFormat": "multi",
+            "items": {"type": "string"},
+        }
+    )
+    parser.add_parameter({"name": "flag", "in": "query", "type": "boolean"})
+
+    with Flask(__name__).test_request_context("/?limit=2&ids=1,2&tag=a&tag=b"):
+        assert parser.parse_args() == {"limit": 2, "ids": [1, 2], "tag": ["a", "b"]}
+
+
+def test_parse_args_requires_parameters():
+    parser = ParameterParser("headers")
+    parser.add_parameter(
+        {"name": "X-Token", "in": "header", "type": "string", "required": True}
+    )
+
+    with Flask(__name__).test_request_context("/", headers={"x-token": "abc"}):
+        assert parser.parse_args() == {"X-Token": "abc"}
+
+    with Flask(__name__).test_request_context("/"):
+        with pytest.raises(BadRequest):
+            parser.parse_args()
+
+
+@pytest.mark.parametrize(
+    "param, url, expected",
+    [
+        (
+            {"name": "id", "in": "query", "schema": {"type": "array"}},
+            "/?id=3&id=4",
+            ["3", "4"],
+        ),
+        (
+            {
+                "name": "id",
+                "in": "query",
+                "explode": False,
+                "schema": {"type": "array", "items": {"type": "integer"}},
+            },
+            "/?id=3,4",
+            [3, 4],
+        ),
+        (
+            {
+                "name": "id",
+                "in": "query",
+                "style": "pipeDelimited",
+                "explode": False,
+                "schema": {"type": "array"},
+            },
+            "/?id=3|4",
+            ["3", "4"],
+        ),
+        (
+            {
+                "name": "color",
+                "in": "query",
+                "style": "deepObject",
+                "schema": {"type": "object", "properties": {"R": {"type": "integer"}}},
+            },
+            "/?color[R]=100&color[G]=200",
+            {"R": 100, "G": "200"},
+        ),
+        (
+            {
+                "name": "color",
+                "in": "query",
+                "schema": {"type": "object", "properties": {"R": {"type": "integer"}}},
+            },
+            "/?R=100&other=1",
+            {"R": 100},
+        ),
+        (
+            {
+                "name": "color",
+                "in": "query",
+                "explode": False,
+                "schema": {"type": "object"},
+            },
+            "/?color=R,100,G,200",
+            {"R": "100", "G": "200"},
+        ),
+    ],
+)
+def test_openapi3_styles(param, url, expected):
+    parser = ParameterParser("args")
+    parser.add_parameter(param, openapi3=True)
+
+    with Flask(__name__).test_request_context(url):
+        assert parser.parse_args() == {param["name"]: expected}
+
+
+def test_openapi3_parameters_parsed_and_validated(app):
+    from flask import request
+
+    from flask_openapi.openapi import Swagger
+
+    app.config["SWAGGER"] = {"openapi": "3.0.3"}
+    Swagger(app, parse=True)
+
+    @app.route("/items/<ids>")
+    def get_items(ids):
+        """
+        Get items
+        ---
+        parameters:
+          - name: ids
+            in: path
+            required: true
+            schema:
+              type: array
+              items:
+                type: integer
+          - name: X-Tags
+            in: header
+            schema:
+              type: array
+              items:
+                type: string
+          - name: session
+            in: cookie
+            schema:
+              type: string
+          - name: limit
+            in: query
+            schema:
+              type: integer
+              maximum: 10
+        responses:
+          200:
+            description: items
+        """
+        return {key: dict(value) for key, value in request.parsed_data.items()}
+
+    client = app.test_client()
+    client.set_cookie("session", "abc")
+
+    response = client.get("/items/1,2?limit=5", headers={"X-Tags": "a,b"})
+    assert response.json == {
+        "path": {"ids": [1, 2]},
+        "args": {"limit": 5},
+        "headers": {"X-Tags": ["a", "b"]},
+        "cookies": {"session": "abc"},
+    }
+    assert client.get("/items/1,x").status_code == 400
+    assert client.get("/items/1?limit=11").status_code == 400
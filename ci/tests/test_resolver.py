@@ -0,0 +1,135 @@
+import pytest
+from jsonschema import ValidationError
+
+from flask_openapi.core import resolver
+from flask_openapi.core.resolver import SchemaResolver, clear_resolver_cache
+from flask_openapi.core.validation import get_compiled_schema
+from flask_openapi.utils.files import clear_file_cache
+
+
+@pytest.fixture(autouse=True)
+def empty_caches():
+    clear_resolver_cache()
+    clear_file_cache()
+    yield
+    clear_resolver_cache()
+    clear_file_cache()
+
+
+@pytest.fixture
+def schema_dir(tmp_path):
+    (tmp_path / "address.yml").write_text(
+        "type: object\nproperties:\n  city:\n    $ref: 'city.yml'\n"
+    )
+    (tmp_path / "city.yml").write_text("type: string\n")
+    return tmp_path
+
+
+def test_resolves_nested_file_references(schema_dir):
+    schema = {"properties": {"home": {"$ref": "address.yml"}}}
+
+    resolved = SchemaResolver({}, str(schema_dir)).resolve(schema)
+
+    assert resolved == {
+        "properties": {
+            "home": {"type": "object", "properties": {"city": {"type": "string"}}}
+        }
+    }
+
+
+def test_repeated_references_share_resolved_node(schema_dir):
+    swag = {"definitions": {"Address": {"$ref": "address.yml"}}}
+    schema = {
+        "properties": {
+            "home": {"$ref": "#/definitions/Address"},
+            "work": {"$ref": "#/definitions/Address"},
+            "items": [{"$ref": "address.yml"}],
+        }
+    }
+
+    resolved = SchemaResolver(swag, str(schema_dir)).resolve(schema)
+
+    properties = resolved["properties"]
+    assert properties["home"] is properties["work"]
+    assert properties["home"] is properties["items"][0]
+
+
+def test_external_documents_are_not_read_again(schema_dir, monkeypatch):
+    schema = {"$ref": "address.yml"}
+    first = SchemaResolver({}, str(schema_dir)).resolve(schema)
+
+    def fail(path):
+        raise AssertionError("unexpected read of %s" % path)
+
+    monkeypatch.setattr(resolver, "read_file", fail)
+
+    assert SchemaResolver({}, str(schema_dir)).resolve(schema) is first
+
+
+def test_referenced_document_change_invalidates_referencing_one(schema_dir):
+    schema = {"$ref": "address.yml"}
+    SchemaResolver({}, str(schema_dir)).resolve(schema)
+
+    (schema_dir / "city.yml").write_text("type: string\nmaxLength: 64\n")
+    resolved = SchemaResolver({}, str(schema_dir)).resolve(schema)
+
+    assert resolved["properties"]["city"] == {"type": "string", "maxLength": 64}
+
+
+def test_file_reference_with_pointer(schema_dir):
+    (schema_dir / "models.yml").write_text("Pet:\n  type: object\n")
+
+    resolved = SchemaResolver({}, str(schema_dir)).resolve({"$ref": "models.yml#/Pet"})
+
+    assert resolved == {"type": "object"}
+
+
+def test_recursive_local_reference_is_kept_as_pointer():
+    node = {
+        "type": "object",
+        "properties": {"children": {"type": "array", "items": {"$ref": "#/Node"}}},
+    }
+
+    resolved = SchemaResolver({"Node": node}, "").resolve({"$ref": "#/Node"})
+
+    items = resolved["properties"]["children"]["items"]
+    assert items == {"$ref": "#/definitions/Node_recursive"}
+    assert resolved["definitions"]["Node_recursive"]["type"] == "object"
+
+
+def test_recursive_file_reference(schema_dir):
+    (schema_dir / "comment.yml").write_text(
+        "type: object\nproperties:\n  replies:\n"
+        "    type: array\n    items:\n      $ref: 'comment.yml'\n"
+    )
+
+    resolved = SchemaResolver({}, str(schema_dir)).resolve({"$ref": "comment.yml"})
+
+    replies = resolved["properties"]["replies"]["items"]
+    assert replies == {"$ref": "#/definitions/comment_recursive"}
+    assert "comment_recursive" in resolved["definitions"]
+
+
+def test_recursive_schema_validates():
+    specs = {
+        "definitions": {
+            "Node": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {
+                    "name": {"type": "string"},
+                    "children": {
+                        "type": "array",
+                        "items": {"$ref": "#/definitions/Node"},
+                    },
+                },
+            }
+        }
+    }
+    compiled = get_compiled_schema("Node", specs=specs)
+
+    compiled.check({"name": "a", "children": [{"name": "b", "children": []}]})
+    with pytest.raises(ValidationError) as error:
+        compiled.check({"name": "a", "children": [{"children": [{"name": 1}]}]})
+
+    assert list(error.value.path)[:2] == ["children", 0]
@@ -0,0 +1,118 @@
+from flask_openapi import Schema, Swagger, fields
+from flask_openapi.core.decorators import swag_from
+from flask_openapi.core.specs import get_schema_registry, get_schema_specs
+
+
+class PetSchema(Schema):
+    name = fields.Str(required=True)
+
+
+def create_app(app):
+    swagger = Swagger(app)
+
+    @app.route("/users", methods=["POST"])
+    def create_user():
+        """
+        Create a user
+        ---
+        parameters:
+          - name: body
+            in: body
+            schema:
+              id: User
+              properties:
+                username:
+                  type: string
+        responses:
+          200:
+            description: created
+        """
+
+    @app.route("/pets", methods=["POST"])
+    @swag_from({"parameters": [{"in": "body", "name": "body", "schema": PetSchema}]})
+    def create_pet():
+        pass
+
+    @swagger.definition("Tag")
+    class Tag(object):
+        """
+        A tag
+        ---
+        properties:
+          label:
+            type: string
+        """
+
+    return swagger
+
+
+def test_registry_indexes_every_kind_of_schema(app):
+    swagger = create_app(app)
+    registry = get_schema_registry(swagger)
+
+    assert registry.lookup("user").schema["id"] == "User"
+    assert registry.lookup("PetSchema").schema["required"] == ["name"]
+    assert registry.lookup("tag").operation is None
+    assert registry.lookup("unknown") is None
+
+
+def test_get_schema_specs_holds_schema(app):
+    swagger = create_app(app)
+
+    assert get_schema_specs("User", swagger)["parameters"][0]["in"] == "body"
+    assert "PetSchema" in get_schema_specs("PetSchema", swagger)["definitions"]
+    assert swagger.get_schema("Tag")["description"] == "A tag"
+
+
+def test_registry_built_once_and_invalidated(app):
+    swagger = create_app(app)
+    registry = get_schema_registry(swagger)
+    assert get_schema_registry(swagger) is registry and registry.built
+
+    @swagger.definition("Other")
+    class Other(object):
+        """
+        ---
+        type: object
+        """
+
+    assert not registry.built
+    assert get_schema_registry(swagger).lookup("other") is not None
+
+
+def test_registry_picks_up_blueprints_registered_later(app):
+    from flask import Blueprint
+
+    swagger = create_app(app)
+    swagger.warm_up(validators=True)
+    assert get_schema_registry(swagger).lookup("Cat") is None
+
+    blueprint = Blueprint("cats", __name__)
+
+    @blueprint.route("/cats", methods=["POST"])
+    @swagger.validate("Cat")
+    @swag_from(
+        {
+            "definitions": {
+                "Cat": {"type": "object", "required": ["name"]},
+            },
+            "responses": {"200": {"description": "ok"}},
+        }
+    )
+    def create_cat():
+        return "ok"
+
+    app.register_blueprint(blueprint)
+
+    client = app.test_client()
+    assert client.post("/cats", json={"name": "tom"}).status_code == 200
+    assert client.post("/cats", json={}).status_code == 400
+    assert swagger.get_schema("Cat")["required"] == ["name"]
+
+
+def test_get_schema_returns_a_copy(app):
+    swagger = create_app(app)
+
+    swagger.get_schema("User")["properties"].clear()
+
+    assert "username" in swagger.get_schema("User")["properties"]
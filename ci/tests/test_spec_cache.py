@@ -0,0 +1,147 @@
+import json
+
+import pytest
+from flask import Flask
+
+from flask_openapi import openapi
+from flask_openapi.core.spec_cache import spec_fingerprint
+from flask_openapi.openapi import Swagger
+
+
+def create_app(tmp_path, description="pets"):
+    app = Flask(__name__)
+
+    def pets():
+        return "ok"
+
+    pets.__doc__ = """
+    List pets
+    ---
+    responses:
+      200:
+        description: {0}
+    """.format(description)
+    app.add_url_rule("/pets", view_func=pets)
+
+    swagger = Swagger(app, config={"spec_cache_dir": str(tmp_path)}, merge=True)
+    return app, swagger
+
+
+@pytest.fixture
+def extractions(monkeypatch):
+    calls = []
+    get_specs = openapi.get_specs
+
+    def counting_get_specs(*args, **kwargs):
+        calls.append(args)
+        return get_specs(*args, **kwargs)
+
+    monkeypatch.setattr(openapi, "get_specs", counting_get_specs)
+    return calls
+
+
+def get_spec(app, swagger):
+    with app.app_context():
+        return swagger.get_apispecs(swagger.config["specs"][0]["endpoint"])
+
+
+def test_spec_loaded_from_cache(tmp_path, extractions):
+    built = get_spec(*create_app(tmp_path))
+    cached = get_spec(*create_app(tmp_path))
+
+    assert len(extractions) == 1
+    assert cached == json.loads(json.dumps(built))
+    assert list(tmp_path.iterdir()) == [
+        tmp_path / "{0}.json".format(Swagger.DEFAULT_CONFIG["specs"][0]["endpoint"])
+    ]
+
+
+def test_spec_rebuilt_when_sources_change(tmp_path, extractions):
+    first = get_spec(*create_app(tmp_path))
+    second = get_spec(*create_app(tmp_path, description="all the pets"))
+
+    assert len(extractions) == 2
+    assert first["paths"] != second["paths"]
+    assert get_spec(*create_app(tmp_path, description="all the pets")) == second
+    assert len(extractions) == 2
+
+
+def test_corrupt_cache_rebuilt(tmp_path, extractions):
+    app, swagger = create_app(tmp_path)
+    get_spec(app, swagger)
+    for path in tmp_path.iterdir():
+        path.write_text("{")
+
+    assert "/pets" in get_spec(*create_app(tmp_path))["paths"]
+    assert len(extractions) == 2
+
+
+def test_fingerprint_follows_code_and_config(tmp_path):
+    app, swagger = create_app(tmp_path)
+    fingerprint = spec_fingerprint(swagger)
+
+    assert spec_fingerprint(create_app(tmp_path)[1]) == fingerprint
+    swagger.config["title"] = "Pets"
+    assert spec_fingerprint(swagger) != fingerprint
+
+
+def test_fingerprint_follows_marshmallow_schema_fields(tmp_path):
+    from flask_openapi import fields, Schema, swag_from, SwaggerView
+
+    def create_schema_app(with_tag):
+        class Pet(Schema):
+            name = fields.Str(required=True)
+            if with_tag:
+                tag = fields.Str()
+
+        class PetView(SwaggerView):
+            parameters = Pet
+            responses = {200: {"description": "pets", "schema": Pet}}
+
+            def post(self):
+                return "ok"
+
+        app = Flask(__name__)
+
+        @app.route("/pets/<name>")
+        @swag_from({"responses": {200: {"schema": Pet}}})
+        def pet(name):
+            return name
+
+        app.add_url_rule("/pets", view_func=PetView.as_view("pets"))
+        return Swagger(app, config={"spec_cache_dir": str(tmp_path)}, merge=True)
+
+    fingerprint = spec_fingerprint(create_schema_app(False))
+
+    assert spec_fingerprint(create_schema_app(False)) == fingerprint
+    assert spec_fingerprint(create_schema_app(True)) != fingerprint
+
+
+def test_spec_rebuilt_when_imported_file_changes(tmp_path, extractions):
+    responses = tmp_path / "responses.yml"
+    responses.write_text("200:\n  description: pets\n")
+
+    def create_importing_app():
+        app = Flask(__name__)
+
+        def pets():
+            return "ok"
+
+        pets.__doc__ = """
+        List pets
+        ---
+        responses:
+          import: "{0}"
+        """.format(responses)
+        app.add_url_rule("/pets", view_func=pets)
+        cache_dir = str(tmp_path / "cache")
+        return app, Swagger(app, config={"spec_cache_dir": cache_dir}, merge=True)
+
+    get_spec(*create_importing_app())
+    responses.write_text("200:\n  description: all the pets\n")
+    spec = get_spec(*create_importing_app())
+
+    assert len(extractions) == 2
+    assert spec["paths"]["/pets"]["get"]["responses"]["200"] == {
+        "description": "all the pets"
+    }
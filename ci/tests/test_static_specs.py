@@ -0,0 +1,73 @@
+import json
+
+import pytest
+from flask import Flask, request
+
+from flask_openapi import openapi, swag_from
+from flask_openapi.openapi import Swagger
+
+STATIC_SPEC = {
+    "swagger": "2.0",
+    "info": {"title": "Pets", "version": "1.0"},
+    "paths": {
+        "/pets/{pet_id}": {
+            "post": {
+                "parameters": [
+                    {"name": "pet_id", "in": "path", "type": "integer"},
+                    {"name": "limit", "in": "query", "type": "integer"},
+                    {
+                        "name": "body",
+                        "in": "body",
+                        "schema": {"id": "Pet", "$ref": "#/definitions/PetBody"},
+                    },
+                ],
+                "responses": {"200": {"description": "a pet"}},
+            }
+        }
+    },
+    "definitions": {
+        "PetBody": {"required": ["name"], "properties": {"name": {"type": "string"}}}
+    },
+}
+
+
+@pytest.fixture
+def static_app(tmp_path, monkeypatch):
+    def no_get_specs(*args, **kwargs):
+        raise AssertionError("rules introspected")
+
+    monkeypatch.setattr(openapi, "get_specs", no_get_specs)
+    spec_file = tmp_path / "spec.json"
+    spec_file.write_text(json.dumps(STATIC_SPEC))
+
+    app = Flask(__name__)
+    config = {
+        "specs": [
+            {"endpoint": "pets", "route": "/pets.json", "static_file": str(spec_file)}
+        ]
+    }
+    swagger = Swagger(app, config=config, merge=True, parse=True)
+
+    @app.route("/pets/<int:pet_id>", methods=["POST"])
+    @swagger.validate("Pet")
+    def create_pet(pet_id):
+        return {"args": request.parsed_data["args"]}
+
+    return app, swagger
+
+
+def test_static_spec_served(static_app):
+    app, swagger = static_app
+
+    assert swagger.static
+    assert app.test_client().get("/pets.json").json == STATIC_SPEC
+
+
+def test_static_spec_parses_and_validates(static_app):
+    app, swagger = static_app
+    client = app.test_client()
+
+    response = client.post("/pets/1?limit=2", json={"name": "rex"})
+    assert response.status_code == 200
+    assert response.json == {"args": {"limit": 2}}
+    assert client.post("/pets/1", json={}).status_code == 400
@@ -0,0 +1,132 @@
+import io
+import json
+
+import pytest
+from flask import g
+
+from flask_openapi.core.decorators import swag_from
+from flask_openapi.utils.streams import iter_json_array, iter_ndjson
+
+PETS = {
+    "parameters": [
+        {
+            "in": "body",
+            "name": "body",
+            "schema": {
+                "id": "Pets",
+                "type": "array",
+                "maxItems": 3,
+                "items": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {"name": {"type": "string"}},
+                },
+            },
+        }
+    ],
+    "responses": {"200": {"description": "ok"}},
+}
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 1024])
+def test_iter_json_array(chunk_size):
+    data = [1, 23.5, "a,]", {"b": [1, {"c": None}]}, [], True, "é"]
+    stream = io.BytesIO(json.dumps(data).encode("utf-8"))
+
+    assert list(iter_json_array(stream, chunk_size)) == data
+
+
+@pytest.mark.parametrize("body", [b"", b"{}", b"[1,", b"[1 2]", b"[1,]", b"[1] 2"])
+def test_iter_json_array_rejects_malformed(body):
+    with pytest.raises(ValueError):
+        list(iter_json_array(io.BytesIO(body), 2))
+
+
+@pytest.mark.parametrize(
+    "iterate, body",
+    [
+        (iter_json_array, b'[1, "' + b"x" * 100),
+        (iter_json_array, b'[1, "' + b"x" * 100 + b'"]'),
+        (iter_ndjson, b"1\n" + b"2" * 100),
+    ],
+)
+def test_items_larger_than_limit_rejected(iterate, body):
+    with pytest.raises(ValueError, match="larger than 50"):
+        list(iterate(io.BytesIO(body), 8, max_item_size=50))
+
+
+def test_iter_ndjson():
+    stream = io.BytesIO(b'{"a": 1}\n\n[2]\r\n"x"')
+
+    assert list(iter_ndjson(stream, 4)) == [{"a": 1}, [2], "x"]
+
+
+def create_app(app):
+    @app.route("/pets", methods=["POST"])
+    @swag_from(PETS, validation=True, stream=True)
+    def bulk_create():
+        return {"names": [pet["name"] for pet in g.validated_items]}
+
+    return app.test_client()
+
+
+def test_swag_from_stream(app):
+    client = create_app(app)
+
+    response = client.post("/pets", json=[{"name": "a"}, {"name": "b"}])
+    assert response.json == {"names": ["a", "b"]}
+
+    assert client.post("/pets", json=[{"name": "a"}, {"name": 1}]).status_code == 400
+    assert client.post("/pets", json=[{"name": "a"}] * 4).status_code == 400
+    assert (
+        client.post("/pets", data="[{", content_type="application/json").status_code
+        == 400
+    )
+
+
+def test_swag_from_stream_ndjson(app):
+    client = create_app(app)
+    body = '{"name": "a"}\n{"name": "b"}\n'
+
+    response = client.post("/pets", data=body, content_type="application/x-ndjson")
+    assert response.json == {"names": ["a", "b"]}
+
+
+def test_stream_errors_reach_handler(app):
+    errors = []
+
+    @app.route("/pets", methods=["POST"])
+    @swag_from(
+        PETS,
+        validation=True,
+        stream=True,
+        validation_error_handler=lambda err, data, schema: errors.append(err),
+    )
+    def bulk_create():
+        return {"count": len(list(g.validated_items))}
+
+    response = app.test_client().post("/pets", json=[{"name": "a"}, {}, {"name": "c"}])
+
+    assert response.json == {"count": 2}
+    assert list(errors[0].path) == [1]
+
+
+def test_malformed_stream_handled_by_swagger_handler(app):
+    from flask_openapi import Swagger
+
+    @app.route("/pets", methods=["POST"])
+    @swag_from(
+        PETS,
+        validation=True,
+        stream=True,
+        validation_error_handler=Swagger(app).validation_error_handler,
+    )
+    def bulk_create():
+        return {"count": len(list(g.validated_items))}
+
+    response = app.test_client().post(
+        "/pets", data="[{", content_type="application/json"
+    )
+
+    assert response.status_code == 400
+    assert b"Malformed JSON body" in response.data
@@ -1,3 +1,6 @@
+import os
+
+from flask_openapi.utils import memory
 from flask_openapi.utils.version import is_openapi3
 
 
@@ -14,3 +17,29 @@ def test_isopenapi_3_true():
     assert is_openapi3("3.3.3.3")
     assert is_openapi3(3)
     assert is_openapi3(3.0)
+
+
+def test_process_uss():
+    uss = memory.process_uss()
+
+    assert uss is None or uss > 0
+    assert list(memory.workers_uss([os.getpid()])) == [os.getpid()]
+
+
+def test_process_uss_from_smaps_rollup(monkeypatch, tmp_path):
+    rollup = tmp_path / "smaps_rollup"
+    rollup.write_text(
+        "Rss:                2048 kB\n"
+        "Shared_Clean:       1024 kB\n"
+        "Private_Clean:       256 kB\n"
+        "Private_Dirty:       512 kB\n"
+    )
+    real_open = open
+    monkeypatch.setattr(
+        memory,
+        "open",
+        lambda path, *args: real_open(rollup, *args),
+        raising=False,
+    )
+
+    assert memory.process_uss(1) == 768 * 1024
@@ -0,0 +1,206 @@
+import pytest
+from werkzeug.exceptions import HTTPException
+
+from flask_openapi import openapi
+from flask_openapi.core.decorators import swag_from
+from flask_openapi.core import validation
+from flask_openapi.core.specs import get_schema_registry
+from flask_openapi.core.validation import (
+    clear_validator_cache,
+    get_compiled_schema,
+    validate,
+    validate_many,
+    validator_cache_info,
+)
+from flask_openapi.openapi import Swagger
+
+SPECS = {
+    "parameters": [
+        {
+            "name": "body",
+            "in": "body",
+            "schema": {
+                "id": "User",
+                "required": ["username"],
+                "properties": {"username": {"type": "string"}},
+            },
+        }
+    ]
+}
+
+
+@pytest.fixture(autouse=True)
+def empty_cache():
+    clear_validator_cache()
+    yield
+    clear_validator_cache()
+
+
+def test_validate_reuses_compiled_schema(app):
+    with app.test_request_context(method="POST"):
+        validate({"username": "a"}, "User", specs=SPECS)
+        validate({"username": "b"}, "User", specs=SPECS)
+
+    info = validator_cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
+    assert info.currsize == 1
+
+
+def test_validate_rejects_with_cached_schema(app):
+    with app.test_request_context(method="POST"):
+        validate({"username": "a"}, "User", specs=SPECS)
+
+        with pytest.raises(HTTPException):
+            validate({"username": 1}, "User", specs=SPECS)
+
+
+def test_compiled_schema_keyed_by_schema_id_and_version():
+    first = get_compiled_schema("User", specs=SPECS)
+
+    assert get_compiled_schema("User", specs=SPECS) is first
+    assert (
+        get_compiled_schema("User", specs=SPECS, openapi_version="3.0.0") is not first
+    )
+
+
+def test_clear_validator_cache():
+    first = get_compiled_schema("User", specs=SPECS)
+    clear_validator_cache()
+
+    assert validator_cache_info().currsize == 0
+    assert get_compiled_schema("User", specs=SPECS) is not first
+
+
+def test_swagger_validate_compiles_once(app, monkeypatch):
+    swagger = Swagger(app)
+    calls = []
+
+    def counting_get_schema_registry(swag):
+        calls.append(swag)
+        return get_schema_registry(swag)
+
+    monkeypatch.setattr(openapi, "get_schema_registry", counting_get_schema_registry)
+
+    @app.route("/users", methods=["POST"])
+    @swagger.validate("User")
+    @swag_from(SPECS)
+    def create_user():
+        return "ok"
+
+    client = app.test_client()
+    assert client.post("/users", json={"username": "a"}).status_code == 200
+    assert client.post("/users", json={"username": 1}).status_code == 400
+    assert client.post("/users", json={"username": "b"}).status_code == 200
+    assert calls == [swagger]
+
+
+def test_swagger_validate_schema_id_case_insensitive(app):
+    swagger = Swagger(app)
+
+    @app.route("/pets", methods=["POST"])
+    @swagger.validate("pet")
+    @swag_from(
+        {
+            "definitions": {
+                "Pet": {
+                    "type": "object",
+                    "required": ["name"],
+                    "properties": {"name": {"type": "string"}},
+                }
+            },
+            "responses": {"200": {"description": "ok"}},
+        }
+    )
+    def create_pet():
+        return "ok"
+
+    client = app.test_client()
+    assert client.post("/pets", json={"name": "rex"}).status_code == 200
+    assert client.post("/pets", json={"x": 1}).status_code == 400
+
+
+def test_validate_many_isolates_errors(monkeypatch):
+    specs = {
+        "definitions": {
+            "User": {
+                "type": "object",
+                "required": ["name"],
+                "properties": {"name": {"type": "string"}},
+            }
+        }
+    }
+    calls = []
+    original = validation.compile_schema
+
+    def compile_schema(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(validation, "compile_schema", compile_schema)
+    records = [{"name": "a"}, {}, {"name": 1}, {"name": "d"}]
+
+    result = validate_many(records, "User", specs=specs)
+
+    assert result.accepted == [{"name": "a"}, {"name": "d"}]
+    assert sorted(result.errors) == [1, 2]
+    assert result.errors[1][0].validator == "required"
+    assert list(result.errors[2][0].path) == ["name"]
+    assert len(calls) == 1
+
+
+def test_swagger_view_compiles_once_per_class(app, monkeypatch):
+    from flask_openapi.core import marshmallow_apispec
+    from flask_openapi.core.marshmallow_apispec import Schema, SwaggerView, fields
+
+    class UserSchema(Schema):
+        username = fields.Str(required=True)
+
+    class UserView(SwaggerView):
+        parameters = [{"in": "body", "name": "body", "schema": UserSchema}]
+        validation = True
+
+        def post(self):
+            return "ok"
+
+    calls = []
+    original = marshmallow_apispec.compile_schema
+
+    def compile_schema(*args, **kwargs):
+        calls.append(kwargs)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(marshmallow_apispec, "compile_schema", compile_schema)
+    app.add_url_rule("/users", view_func=UserView.as_view("users"))
+    client = app.test_client()
+
+    assert client.post("/users", json={"username": "a"}).status_code == 200
+    assert client.post("/users", json={"username": 1}).status_code == 400
+    assert client.post("/users", json={"username": "b"}).status_code == 200
+    assert len(calls) == 1
+    assert SwaggerView._compiled_validation is None
+
+
+def test_annotation_validation_planned_at_registration(app, monkeypatch):
+    from flask_openapi.core import decorators
+    from flask_openapi.core.marshmallow_apispec import Schema, fields
+
+    class PetSchema(Schema):
+        name = fields.Str(required=True)
+
+    Swagger(app)
+
+    def create_pet(pet: PetSchema):
+        return {"name": pet["name"]}
+
+    app.add_url_rule("/pets", "pets", create_pet, methods=["POST"], swag=True)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("schema compiled per request")
+
+    monkeypatch.setattr(decorators, "compile_schema", fail)
+    client = app.test_client()
+
+    assert client.post("/pets", json={"name": "rex"}).json == {"name": "rex"}
+    assert client.post("/pets", json={"name": 1}).status_code == 400
+    assert PetSchema().to_specs_dict() is not PetSchema().to_specs_dict()
@@ -0,0 +1,102 @@
+import gzip
+import json
+import types
+
+import pytest
+
+from flask_openapi.core import views
+from flask_openapi.openapi import Swagger
+
+
+@pytest.fixture
+def spec_app(app):
+    swagger = Swagger(app)
+
+    def pets():
+        pass
+
+    pets.__doc__ = """
+    List pets
+    ---
+    responses:
+      200:
+        description: {0}
+    """.format("a long description " * 100)
+    app.add_url_rule("/pets", view_func=pets)
+
+    endpoint = swagger.config["specs"][0]["endpoint"]
+    with app.test_request_context():
+        from flask import url_for
+
+        url = url_for("flask_openapi." + endpoint)
+    return app, swagger, url
+
+
+def test_spec_served_with_etag_and_gzip(spec_app):
+    app, swagger, url = spec_app
+    client = app.test_client()
+
+    plain = client.get(url)
+    assert plain.status_code == 200
+    assert plain.headers["Cache-Control"] == "no-cache"
+    assert "Accept-Encoding" in plain.headers["Vary"]
+    assert "/pets" in plain.json["paths"]
+
+    compressed = client.get(url, headers={"Accept-Encoding": "gzip"})
+    assert compressed.headers["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(compressed.data)) == plain.json
+    assert compressed.headers["ETag"] != plain.headers["ETag"]
+
+    cached = client.get(url, headers={"If-None-Match": plain.headers["ETag"]})
+    assert cached.status_code == 304
+    assert cached.data == b""
+
+
+def test_spec_serialized_once_until_rebuilt(spec_app, monkeypatch):
+    app, swagger, _ = spec_app
+    serialized = []
+    serialize_spec = views.serialize_spec
+
+    def counting_serialize_spec(spec):
+        serialized.append(spec)
+        return serialize_spec(spec)
+
+    monkeypatch.setattr(views, "serialize_spec", counting_serialize_spec)
+    endpoint = swagger.config["specs"][0]["endpoint"]
+
+    with app.app_context():
+        etag = views.get_serialized_spec(swagger.get_apispecs(endpoint)).etag
+        assert views.get_serialized_spec(swagger.get_apispecs(endpoint)).etag == etag
+        assert len(serialized) == 1
+
+        @app.route("/owners")
+        def owners():
+            """
+            List owners
+            ---
+            responses:
+              200:
+                description: owners
+            """
+
+        assert views.get_serialized_spec(swagger.get_apispecs(endpoint)).etag != etag
+        assert len(serialized) == 2
+
+
+def test_brotli_preferred_when_installed(spec_app, monkeypatch):
+    app, swagger, url = spec_app
+    qualities = []
+
+    def compress(data, quality=11):
+        qualities.append(quality)
+        return b"br" + data[:10]
+
+    fake_brotli = types.SimpleNamespace(compress=compress)
+    monkeypatch.setattr(views, "brotli", fake_brotli)
+    views._serialized_specs.cache_clear()
+
+    response = app.test_client().get(url, headers={"Accept-Encoding": "gzip, br"})
+
+    assert response.headers["Content-Encoding"] == "br"
+    assert response.data.startswith(b"br")
+    assert qualities == [views.BROTLI_QUALITY]
@@ -0,0 +1,181 @@
+import pytest
+from flask import Flask
+
+from flask_openapi import swag_from
+from flask_openapi.openapi import Swagger
+
+PET = {
+    "parameters": [
+        {
+            "in": "body",
+            "name": "body",
+            "schema": {"properties": {"name": {"type": "string"}}},
+        }
+    ],
+    "responses": {"200": {"description": "ok"}},
+}
+
+
+def create_app():
+    app = Flask(__name__)
+
+    @app.route("/pets", methods=["POST"])
+    @swag_from(PET, validation=True)
+    def create_pet():
+        return "ok"
+
+    return app
+
+
+def test_eager_warm_up_builds_at_init_app(monkeypatch):
+    app = create_app()
+    compiled = []
+    compile_validation = app.view_functions["create_pet"].compile_validation
+    monkeypatch.setattr(
+        app.view_functions["create_pet"],
+        "compile_validation",
+        lambda: compiled.append(compile_validation()) or compiled[-1],
+    )
+
+    swagger = Swagger(
+        app, config={"warm_up": True, "warm_up_validators": True}, merge=True
+    )
+
+    assert swagger.ready.is_set()
+    assert "/pets" in swagger.apispecs[swagger.config["specs"][0]["endpoint"]]["paths"]
+    assert len(compiled) == 1
+    # the validator requests use is built too
+    assert compiled[0]._validators
+
+
+def test_background_warm_up_starts_once_routes_are_registered():
+    app = create_app()
+    swagger = Swagger(app, config={"warm_up": "background"}, merge=True, parse=True)
+
+    @app.route("/owners")
+    @swag_from({"responses": {"200": {"description": "ok"}}})
+    def owners():
+        return "ok"
+
+    assert swagger.warm_up_thread is None
+    assert not swagger.ready.is_set()
+
+    app.test_client().get("/owners")
+
+    assert swagger.ready.wait(5)
+    assert swagger.warm_up_errors == []
+    assert sorted(key[1] for key in swagger.operation_index) == ["GET", "POST"]
+
+
+def test_background_warm_up_started_by_app():
+    app = create_app()
+    swagger = Swagger(app, config={"warm_up": "background"}, merge=True)
+
+    thread = swagger.start_warm_up()
+
+    assert swagger.start_warm_up() is thread
+    assert swagger.ready.wait(5)
+    assert "/pets" in swagger.apispecs[swagger.config["specs"][0]["endpoint"]]["paths"]
+
+
+def test_warm_up_errors_raised_at_boot():
+    app = create_app()
+    config = {
+        "warm_up": True,
+        "specs": [
+            {
+                "endpoint": "broken",
+                "route": "/broken.json",
+                "rule_filter": lambda rule: rule.unknown,
+            }
+        ],
+    }
+
+    with pytest.raises(AttributeError):
+        Swagger(app, config=config, merge=True)
+
+
+def test_routes_added_after_warm_up_are_documented():
+    app = create_app()
+    swagger = Swagger(app, config={"warm_up": True}, merge=True)
+
+    @app.route("/owners")
+    def owners():
+        """
+        List owners
+        ---
+        responses:
+          200:
+            description: owners
+        """
+
+    with app.app_context():
+        assert (
+            "/owners"
+            in swagger.get_apispecs(swagger.config["specs"][0]["endpoint"])["paths"]
+        )
+
+
+def test_ready_without_warm_up(app):
+    assert Swagger(app).ready.is_set()
+
+
+def test_prepare_fork_builds_then_freezes(monkeypatch):
+    from flask_openapi.core import views
+    from flask_openapi import openapi
+
+    app = create_app()
+    swagger = Swagger(app)
+    frozen = []
+    calls = []
+    monkeypatch.setattr(
+        openapi.gc, "freeze", lambda: frozen.append(swagger.apispecs.copy())
+    )
+    monkeypatch.setattr(openapi.gc, "disable", lambda: calls.append("disable"))
+    monkeypatch.setattr(openapi.gc, "collect", lambda: calls.append("collect"))
+
+    swagger.prepare_fork()
+
+    assert len(frozen) == 1
+    assert calls == ["disable"]
+    compiled = app.view_functions["create_pet"].compile_validation()
+    assert compiled._validators
+    endpoint = swagger.config["specs"][0]["endpoint"]
+    spec = frozen[0][endpoint]
+    assert "/pets" in spec["paths"]
+    assert endpoint in swagger.apispecs
+    assert views._serialized_specs.get(id(spec)).spec is spec
+    assert swagger.schema_registry.built
+
+
+def test_warm_up_builds_validators_swagger_validate_uses(monkeypatch):
+    from flask_openapi import openapi
+    from flask_openapi.core import validation
+
+    app = Flask(__name__)
+    swagger = Swagger(app)
+
+    @app.route("/pets", methods=["POST"])
+    @swagger.validate("Pet")
+    @swag_from(
+        {
+            "definitions": {"Pet": {"type": "object", "required": ["name"]}},
+            "responses": {"200": {"description": "ok"}},
+        }
+    )
+    def create_pet():
+        return "ok"
+
+    swagger.warm_up(validators=True)
+    compiled = app.view_functions["create_pet"].compile_validation()
+    assert list(compiled._validators) == [id(swagger.format_checker)]
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validator built on request")
+
+    monkeypatch.setattr(validation.jsonschema.validators, "validator_for", fail)
+    monkeypatch.setattr(openapi, "compiled_schema_for", fail)
+
+    client = app.test_client()
+    assert client.post("/pets", json={"name": "rex"}).status_code == 200
+    assert client.post("/pets", json={}).status_code == 400
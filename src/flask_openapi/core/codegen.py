@@ -0,0 +1,811 @@
+"""
+Validation engine compiling resolved schemas to Python source
+
+The generated code only answers "is this data valid?", checking types,
+required keys and properties in specialised straight-line code. Errors
+for invalid data are produced by jsonschema itself, so they are the very
+`jsonschema.ValidationError` (best match included) the default engine
+raises. Schemas using keywords outside of the Draft 4 / OpenAPI subset
+this project emits fall back to jsonschema for validity checks as well.
+
+Use it through the `validation_function` hook:
+
+    swagger = Swagger(app, validation_function=codegen_validate)
+"""
+
+import hashlib
+import importlib
+import json
+import math
+import threading
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+import jsonschema
+from flask_openapi.core.resolver import follow_pointer
+from flask_openapi.utils.cache import CacheInfo, LRUCache
+
+CODEGEN_CACHE_SIZE: int = 512
+
+# nesting above these limits moves a subschema to its own function
+MAX_INDENT: int = 40
+MAX_LOOPS: int = 8
+
+UNSUPPORTED_KEYWORDS = frozenset(
+    [
+        "$anchor",
+        "$dynamicAnchor",
+        "$dynamicRef",
+        "$id",
+        "$recursiveAnchor",
+        "$recursiveRef",
+        "$schema",
+        "contains",
+        "dependencies",
+        "dependentRequired",
+        "dependentSchemas",
+        "else",
+        "if",
+        "maxContains",
+        "minContains",
+        "patternProperties",
+        "prefixItems",
+        "propertyNames",
+        "then",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    ]
+)
+
+NUMBER_KEYWORDS = ("minimum", "maximum", "exclusiveMinimum", "exclusiveMaximum")
+STRING_KEYWORDS = ("minLength", "maxLength", "pattern")
+ARRAY_KEYWORDS = ("minItems", "maxItems", "uniqueItems", "items")
+OBJECT_KEYWORDS = (
+    "required",
+    "properties",
+    "additionalProperties",
+    "minProperties",
+    "maxProperties",
+)
+VALIDATION_KEYWORDS = frozenset(
+    NUMBER_KEYWORDS
+    + STRING_KEYWORDS
+    + ARRAY_KEYWORDS
+    + OBJECT_KEYWORDS
+    + ("$ref", "type", "enum", "const", "format", "multipleOf")
+    + ("allOf", "anyOf", "oneOf", "not")
+)
+
+TYPE_CHECKS: Dict[str, str] = {
+    "string": "isinstance({v}, str)",
+    "integer": (
+        "isinstance({v}, int) and not isinstance({v}, bool)"
+        " or isinstance({v}, float) and {v}.is_integer()"
+    ),
+    "number": "isinstance({v}, (int, float)) and not isinstance({v}, bool)",
+    "boolean": "isinstance({v}, bool)",
+    "object": "isinstance({v}, dict)",
+    "array": "isinstance({v}, list)",
+    "null": "{v} is None",
+}
+
+GUARDS: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "number": (TYPE_CHECKS["number"], ("number", "integer")),
+    "string": (TYPE_CHECKS["string"], ("string",)),
+    "array": (TYPE_CHECKS["array"], ("array",)),
+    "object": (TYPE_CHECKS["object"], ("object",)),
+}
+
+HELPERS_IMPORT: str = (
+    "import re\n"
+    "from flask_openapi.core.codegen import (\n"
+    "    MISSING,\n"
+    "    is_multiple_of,\n"
+    "    is_unique,\n"
+    "    json_enum,\n"
+    "    json_equal,\n"
+    ")\n"
+)
+
+MODULE_HEADER: str = (
+    '"""\n'
+    "Precompiled request validators\n"
+    "\n"
+    "Generated by `flask generate-validators`, do not edit.\n"
+    '"""\n'
+)
+
+MISSING: Any = object()
+
+# build functions of generated modules, by schema fingerprint
+_precompiled: Dict[str, Callable] = {}
+_precompiled_lock = threading.Lock()
+
+
+class UnsupportedSchema(Exception):
+    """
+    Raised when a schema can't be compiled to Python source
+    """
+
+
+def json_equal(one: Any, two: Any) -> bool:
+    """
+    Equality as JSON Schema sees it: booleans are not numbers
+    """
+    if one is two:
+        return True
+    if isinstance(one, str) or isinstance(two, str):
+        return one == two
+    if isinstance(one, list) and isinstance(two, list):
+        return len(one) == len(two) and all(map(json_equal, one, two))
+    if isinstance(one, dict) and isinstance(two, dict):
+        return one.keys() == two.keys() and all(
+            json_equal(one[key], two[key]) for key in one
+        )
+    if isinstance(one, bool) or isinstance(two, bool):
+        return isinstance(one, bool) and isinstance(two, bool) and one == two
+    return one == two
+
+
+def json_enum(instance: Any, values: List) -> bool:
+    """
+    Returns True if instance equals one of values
+    """
+    return any(json_equal(instance, value) for value in values)
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, bool):
+        return (bool, value)
+    if isinstance(value, dict):
+        return (dict, frozenset((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, list):
+        return (list, tuple(_freeze(item) for item in value))
+    return value
+
+
+def is_unique(items: List) -> bool:
+    """
+    Returns True if no two items are equal
+    """
+    try:
+        return len(set(_freeze(item) for item in items)) == len(items)
+    except TypeError:
+        seen: List = []
+        for item in items:
+            if json_enum(item, seen):
+                return False
+            seen.append(item)
+        return True
+
+
+def is_multiple_of(instance: Any, factor: Any) -> bool:
+    """
+    Returns True if instance is a multiple of factor, as jsonschema does
+    """
+    if isinstance(factor, float):
+        quotient: float = instance / factor
+        try:
+            return int(quotient) == quotient
+        except OverflowError:
+            from fractions import Fraction
+
+            return (Fraction(instance) / Fraction(factor)).denominator == 1
+    return not instance % factor
+
+
+def _literal(value: Any) -> str:
+    """
+    Python source for a JSON value
+    """
+    if isinstance(value, float) and not math.isfinite(value):
+        return "float({0!r})".format(str(value))
+    if isinstance(value, list):
+        return "[{0}]".format(", ".join(_literal(item) for item in value))
+    if isinstance(value, dict):
+        return "{{{0}}}".format(
+            ", ".join(
+                "{0}: {1}".format(_literal(key), _literal(item))
+                for key, item in value.items()
+            )
+        )
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return repr(value)
+    raise UnsupportedSchema("Can't write {0!r} as a literal".format(value))
+
+
+def _is_trivial(schema: Any) -> bool:
+    """
+    Returns True if schema accepts anything
+    """
+    if schema is True:
+        return True
+    return isinstance(schema, dict) and not VALIDATION_KEYWORDS.intersection(schema)
+
+
+class SourceGenerator(object):
+    """
+    Writes the source of a `build(_fc)` function returning a predicate
+    which tells whether data is valid against the schema
+    """
+
+    def __init__(self, root: Any, name: str = "build"):
+        self.root = root
+        self.name = name
+        self.constants: List[str] = []
+        self.lines: List[str] = []
+        self.functions: Dict[int, str] = {}
+        self.pending: List[Tuple[str, Any]] = []
+        self.counter: int = 0
+
+    def generate(self) -> str:
+        """
+        Returns the source of the build function
+
+        :raise UnsupportedSchema: when the schema can't be compiled
+        """
+        entry: str = self.function_for(self.root)
+        while self.pending:
+            name, schema = self.pending.pop(0)
+            self.line(1, "def {0}(v0):".format(name))
+            self.emit_block(schema, "v0", 2, 0)
+            self.line(2, "return True")
+
+        header: List[str] = ["def {0}(_fc):".format(self.name)]
+        footer: List[str] = ["    return {0}".format(entry), ""]
+        return "\n".join(header + self.constants + self.lines + footer)
+
+    def unique(self, prefix: str) -> str:
+        self.counter += 1
+        return "{0}{1}".format(prefix, self.counter)
+
+    def constant(self, source: str) -> str:
+        name: str = self.unique("_c")
+        self.constants.append("    {0} = {1}".format(name, source))
+        return name
+
+    def function_for(self, schema: Any) -> str:
+        if id(schema) not in self.functions:
+            self.functions[id(schema)] = self.unique("_v")
+            self.pending.append((self.functions[id(schema)], schema))
+        return self.functions[id(schema)]
+
+    def line(self, indent: int, text: str) -> None:
+        self.lines.append("    " * indent + text)
+
+    def emit_block(self, schema: Any, var: str, indent: int, loops: int) -> None:
+        """
+        Emits the checks of schema, or `pass` when there are none
+        """
+        size: int = len(self.lines)
+        self.emit(schema, var, indent, loops)
+        if len(self.lines) == size:
+            self.line(indent, "pass")
+
+    def emit(self, schema: Any, var: str, indent: int, loops: int) -> None:
+        if _is_trivial(schema):
+            return
+        if schema is False:
+            self.line(indent, "return False")
+            return
+        if not isinstance(schema, dict):
+            raise UnsupportedSchema("Schemas must be objects or booleans")
+
+        unsupported = UNSUPPORTED_KEYWORDS.intersection(schema)
+        if unsupported:
+            raise UnsupportedSchema("Unsupported keywords {0}".format(unsupported))
+
+        if indent > MAX_INDENT or loops > MAX_LOOPS:
+            self.line(
+                indent,
+                "if not {0}({1}): return False".format(self.function_for(schema), var),
+            )
+            return
+
+        if "$ref" in schema:
+            ref: Any = schema["$ref"]
+            if not isinstance(ref, str) or not ref.startswith("#"):
+                raise UnsupportedSchema("Only local references are supported")
+            target: Any = follow_pointer(self.root, ref[1:])
+            self.line(
+                indent,
+                "if not {0}({1}): return False".format(self.function_for(target), var),
+            )
+
+        known: Optional[str] = self.emit_type(schema, var, indent)
+
+        if "enum" in schema:
+            values: List = schema["enum"]
+            if values and all(isinstance(value, str) for value in values):
+                self.line(
+                    indent,
+                    "if not (isinstance({0}, str) and {0} in {1}): return False".format(
+                        var,
+                        self.constant("frozenset({0})".format(_literal(values))),
+                    ),
+                )
+            else:
+                self.line(
+                    indent,
+                    "if not json_enum({0}, {1}): return False".format(
+                        var, self.constant(_literal(values))
+                    ),
+                )
+
+        if "const" in schema:
+            self.line(
+                indent,
+                "if not json_equal({0}, {1}): return False".format(
+                    var, self.constant(_literal(schema["const"]))
+                ),
+            )
+
+        if "format" in schema:
+            self.line(
+                indent,
+                "if _fc is not None and not _fc.conforms({0}, {1}): return False".format(
+                    var, _literal(schema["format"])
+                ),
+            )
+
+        self.emit_guarded("number", known, schema, var, indent, loops)
+        self.emit_guarded("string", known, schema, var, indent, loops)
+        self.emit_guarded("array", known, schema, var, indent, loops)
+        self.emit_guarded("object", known, schema, var, indent, loops)
+
+        for subschema in schema.get("allOf", []):
+            self.emit(subschema, var, indent, loops)
+
+        if "anyOf" in schema:
+            calls: List[str] = [
+                "{0}({1})".format(self.function_for(sub), var)
+                for sub in schema["anyOf"]
+            ]
+            self.line(indent, "if not ({0}): return False".format(" or ".join(calls)))
+
+        if "oneOf" in schema:
+            calls = [
+                "{0}({1})".format(self.function_for(sub), var)
+                for sub in schema["oneOf"]
+            ]
+            self.line(indent, "if ({0}) != 1: return False".format(" + ".join(calls)))
+
+        if "not" in schema:
+            self.line(
+                indent,
+                "if {0}({1}): return False".format(
+                    self.function_for(schema["not"]), var
+                ),
+            )
+
+    def emit_type(self, schema: Dict, var: str, indent: int) -> Optional[str]:
+        """
+        Emits the type check, returns the type when a single one is allowed
+        """
+        if "type" not in schema:
+            return None
+
+        types: List[str] = schema["type"]
+        if isinstance(types, str):
+            types = [types]
+
+        checks: List[str] = []
+        for type_name in types:
+            if type_name not in TYPE_CHECKS:
+                raise UnsupportedSchema("Unknown type {0!r}".format(type_name))
+            checks.append("(" + TYPE_CHECKS[type_name].format(v=var) + ")")
+
+        self.line(indent, "if not ({0}): return False".format(" or ".join(checks)))
+        return types[0] if len(types) == 1 else None
+
+    def emit_guarded(
+        self,
+        kind: str,
+        known: Optional[str],
+        schema: Dict,
+        var: str,
+        indent: int,
+        loops: int,
+    ) -> None:
+        """
+        Emits the keywords applying to one kind of instance, under an
+        isinstance guard unless the type check already ensured it
+        """
+        keywords: Tuple[str, ...] = {
+            "number": NUMBER_KEYWORDS + ("multipleOf",),
+            "string": STRING_KEYWORDS,
+            "array": ARRAY_KEYWORDS,
+            "object": OBJECT_KEYWORDS,
+        }[kind]
+        if not any(keyword in schema for keyword in keywords):
+            return
+
+        guard, covered = GUARDS[kind]
+        if known not in covered:
+            self.line(indent, "if {0}:".format(guard.format(v=var)))
+            indent += 1
+
+        size: int = len(self.lines)
+        getattr(self, "emit_" + kind)(schema, var, indent, loops)
+        if len(self.lines) == size:
+            self.line(indent, "pass")
+
+    def emit_number(self, schema: Dict, var: str, indent: int, loops: int) -> None:
+        comparisons: Dict[str, str] = {
+            "minimum": "<",
+            "maximum": ">",
+            "exclusiveMinimum": "<=",
+            "exclusiveMaximum": ">=",
+        }
+        for keyword, operator in comparisons.items():
+            if keyword in schema:
+                bound: Any = schema[keyword]
+                # Draft 4 style boolean exclusive bounds are left to jsonschema
+                if isinstance(bound, bool) or not isinstance(bound, (int, float)):
+                    raise UnsupportedSchema(
+                        "{0} must be a number, not {1!r}".format(keyword, bound)
+                    )
+                self.line(
+                    indent,
+                    "if {0} {1} {2}: return False".format(
+                        var, operator, self.constant(_literal(bound))
+                    ),
+                )
+
+        if "multipleOf" in schema:
+            self.line(
+                indent,
+                "if not is_multiple_of({0}, {1}): return False".format(
+                    var, self.constant(_literal(schema["multipleOf"]))
+                ),
+            )
+
+    def emit_string(self, schema: Dict, var: str, indent: int, loops: int) -> None:
+        if "minLength" in schema:
+            self.line(
+                indent,
+                "if len({0}) < {1}: return False".format(var, int(schema["minLength"])),
+            )
+        if "maxLength" in schema:
+            self.line(
+                indent,
+                "if len({0}) > {1}: return False".format(var, int(schema["maxLength"])),
+            )
+        if "pattern" in schema:
+            self.line(
+                indent,
+                "if not {0}.search({1}): return False".format(
+                    self.constant(
+                        "re.compile({0})".format(_literal(schema["pattern"]))
+                    ),
+                    var,
+                ),
+            )
+
+    def emit_array(self, schema: Dict, var: str, indent: int, loops: int) -> None:
+        if "minItems" in schema:
+            self.line(
+                indent,
+                "if len({0}) < {1}: return False".format(var, int(schema["minItems"])),
+            )
+        if "maxItems" in schema:
+            self.line(
+                indent,
+                "if len({0}) > {1}: return False".format(var, int(schema["maxItems"])),
+            )
+        if schema.get("uniqueItems"):
+            self.line(indent, "if not is_unique({0}): return False".format(var))
+
+        items: Any = schema.get("items", True)
+        if isinstance(items, list):
+            raise UnsupportedSchema("Tuple items are not supported")
+        if not _is_trivial(items):
+            item_var: str = self.unique("v")
+            self.line(indent, "for {0} in {1}:".format(item_var, var))
+            self.emit_block(items, item_var, indent + 1, loops + 1)
+
+    def emit_object(self, schema: Dict, var: str, indent: int, loops: int) -> None:
+        required: List[str] = schema.get("required", [])
+        if required:
+            checks: List[str] = ["{0!r} in {1}".format(name, var) for name in required]
+            self.line(indent, "if not ({0}): return False".format(" and ".join(checks)))
+
+        if "minProperties" in schema:
+            self.line(
+                indent,
+                "if len({0}) < {1}: return False".format(
+                    var, int(schema["minProperties"])
+                ),
+            )
+        if "maxProperties" in schema:
+            self.line(
+                indent,
+                "if len({0}) > {1}: return False".format(
+                    var, int(schema["maxProperties"])
+                ),
+            )
+
+        properties: Dict = schema.get("properties", {})
+        for name, subschema in properties.items():
+            if _is_trivial(subschema):
+                continue
+            value_var: str = self.unique("v")
+            self.line(
+                indent, "{0} = {1}.get({2!r}, MISSING)".format(value_var, var, name)
+            )
+            self.line(indent, "if {0} is not MISSING:".format(value_var))
+            self.emit_block(subschema, value_var, indent + 1, loops)
+
+        additional: Any = schema.get("additionalProperties", True)
+        if _is_trivial(additional):
+            return
+
+        key_var: str = self.unique("k")
+        self.line(indent, "for {0} in {1}:".format(key_var, var))
+        self.line(
+            indent + 1,
+            "if {0} not in {1}:".format(
+                key_var,
+                self.constant("frozenset({0})".format(_literal(list(properties)))),
+            ),
+        )
+        if additional is False:
+            self.line(indent + 2, "return False")
+        else:
+            value_var = self.unique("v")
+            self.line(indent + 2, "{0} = {1}[{2}]".format(value_var, var, key_var))
+            self.emit_block(additional, value_var, indent + 2, loops + 1)
+
+
+def generate_source(schema: Any, name: str = "build") -> str:
+    """
+    Returns the source of a `name(_fc)` function building a predicate
+    for schema, `_fc` being an optional jsonschema.FormatChecker
+
+    :param schema: resolved schema
+    :type schema: Any
+
+    :param name: name of the generated function
+    :type name: str
+
+    :raise UnsupportedSchema: when the schema can't be compiled
+
+    :return: python source
+    :rtype: str
+    """
+    return SourceGenerator(schema, name).generate()
+
+
+def load_builder(source: str, name: str = "build") -> Callable:
+    """
+    Executes generated source once and returns its build function
+    """
+    namespace: Dict[str, Any] = {}
+    exec(compile(HELPERS_IMPORT + source, "<flask_openapi.codegen>", "exec"), namespace)
+    return namespace[name]
+
+
+class CodegenValidator(object):
+    """
+    Validates data against a resolved schema with generated Python code
+
+    The schema is checked against its metaschema once, like jsonschema
+    does before validating, unless a build function generated beforehand
+    is given or registered for it. Invalid data is handed to jsonschema to build
+    the error, so `validation_error_handler`s receive the usual
+    `jsonschema.ValidationError`.
+    """
+
+    def __init__(
+        self,
+        schema: Any,
+        format_checker: Optional[Any] = None,
+        builder: Optional[Callable] = None,
+    ):
+        self.schema = schema
+        self.format_checker = format_checker
+        self.source: Optional[str] = None
+
+        cls: Any = jsonschema.validators.validator_for(schema)
+        self._validator: Any = cls(schema, format_checker=format_checker)
+
+        if builder is None:
+            builder = precompiled_builder(schema)
+
+        # generated builders come from schemas which passed check_schema
+        if builder is None:
+            cls.check_schema(schema)
+            try:
+                self.source = generate_source(schema)
+                builder = load_builder(self.source)
+            except UnsupportedSchema:
+                builder = None
+
+        # True when validity checks run generated code
+        self.generated: bool = builder is not None
+        self._is_valid: Callable[[Any], bool] = (
+            builder(format_checker) if builder is not None else self._validator.is_valid
+        )
+
+    def is_valid(self, data: Any) -> bool:
+        return self._is_valid(data)
+
+    def iter_errors(self, data: Any):
+        if self._is_valid(data):
+            return iter(())
+        return self._validator.iter_errors(data)
+
+    def validate(self, data: Any) -> None:
+        """
+        Raises the best matching jsonschema.ValidationError for invalid data
+        """
+        if self._is_valid(data):
+            return
+
+        error = jsonschema.exceptions.best_match(self._validator.iter_errors(data))
+        if error is not None:
+            raise error
+
+
+_codegen_cache: LRUCache = LRUCache(maxsize=CODEGEN_CACHE_SIZE)
+
+
+def codegen_validator_for(
+    schema: Any, format_checker: Optional[Any] = None
+) -> CodegenValidator:
+    """
+    Returns the CodegenValidator of a resolved schema, generating it once
+
+    Lookups are by identity of the schema and of the format checker.
+    """
+    key: Tuple[int, int] = (id(schema), id(format_checker))
+    cached: Optional[CodegenValidator] = _codegen_cache.get(key)
+
+    # the validator keeps both alive, so their ids stay unique
+    if (
+        cached is None
+        or cached.schema is not schema
+        or cached.format_checker is not format_checker
+    ):
+        cached = CodegenValidator(schema, format_checker)
+        _codegen_cache.set(key, cached)
+
+    return cached
+
+
+def make_codegen_validation_function(
+    format_checker: Optional[Any] = None,
+) -> Callable[[Any, Any], None]:
+    """
+    Returns a `validation_function` running the generated validators
+
+    :param format_checker: format checker used for `format` keywords
+    :type format_checker: Optional[jsonschema.FormatChecker]
+
+    :return: validation function taking the data and the schema
+    :rtype: Callable
+    """
+
+    def codegen_validation_function(data: Any, schema: Any) -> None:
+        codegen_validator_for(schema, format_checker).validate(data)
+
+    return codegen_validation_function
+
+
+codegen_validate = make_codegen_validation_function()
+
+
+def codegen_cache_info() -> CacheInfo:
+    """
+    Returns hits, misses, maxsize and current size of the validator cache
+    """
+    return _codegen_cache.cache_info()
+
+
+def clear_codegen_cache() -> None:
+    """
+    Drops every generated validator
+    """
+    _codegen_cache.cache_clear()
+
+
+def schema_fingerprint(schema: Any) -> str:
+    """
+    Returns a digest identifying the content of a resolved schema
+
+    :param schema: resolved schema
+    :type schema: Any
+
+    :return: hex sha256 of the schema as canonical JSON
+    :rtype: str
+    """
+    canonical: str = json.dumps(
+        schema, sort_keys=True, separators=(",", ":"), default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def generate_module(schemas: Iterable[Any]) -> str:
+    """
+    Returns the source of a module holding the build functions of schemas
+
+    The module maps schema fingerprints to build functions in
+    `VALIDATORS`, see `load_precompiled`. Schemas are checked against
+    their metaschema here, as registered builders are used without it;
+    those which fail or can't be compiled are left out and keep being
+    validated, and rejected, by jsonschema.
+
+    :param schemas: resolved schemas
+    :type schemas: Iterable[Any]
+
+    :return: python source
+    :rtype: str
+    """
+    names: Dict[str, str] = {}
+    sources: List[str] = []
+
+    for schema in schemas:
+        fingerprint: str = schema_fingerprint(schema)
+        if fingerprint in names:
+            continue
+
+        name: str = "build_{0}".format(fingerprint[:16])
+        try:
+            jsonschema.validators.validator_for(schema).check_schema(schema)
+            sources.append(generate_source(schema, name))
+        except (jsonschema.SchemaError, UnsupportedSchema):
+            continue
+        names[fingerprint] = name
+
+    mapping: List[str] = [
+        "    {0!r}: {1},".format(fingerprint, name)
+        for fingerprint, name in sorted(names.items())
+    ]
+    parts: List[str] = [MODULE_HEADER + HELPERS_IMPORT] + sources
+    parts.append("VALIDATORS = {{\n{0}\n}}\n".format("\n".join(mapping)))
+    return "\n\n".join(parts)
+
+
+def register_precompiled(builders: Dict[str, Callable]) -> None:
+    """
+    Registers build functions by schema fingerprint
+    """
+    with _precompiled_lock:
+        _precompiled.update(builders)
+
+
+def load_precompiled(module: Union[str, ModuleType]) -> int:
+    """
+    Imports a module written by `flask generate-validators` and registers
+    its validators, so they are used instead of compiling schemas
+
+    :param module: the module or its dotted name
+    :type module: Union[str, ModuleType]
+
+    :return: number of validators registered
+    :rtype: int
+    """
+    if isinstance(module, str):
+        module = importlib.import_module(module)
+
+    builders: Dict[str, Callable] = getattr(module, "VALIDATORS")
+    register_precompiled(builders)
+    return len(builders)
+
+
+def precompiled_builder(schema: Any) -> Optional[Callable]:
+    """
+    Returns the registered build function for schema, if any
+    """
+    if not _precompiled:
+        return None
+
+    return _precompiled.get(schema_fingerprint(schema))
+
+
+def clear_precompiled() -> None:
+    """
+    Forgets every registered build function
+    """
+    with _precompiled_lock:
+        _precompiled.clear()
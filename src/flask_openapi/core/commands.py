@@ -1,23 +1,34 @@
 import json
+import os
+from typing import Any, Callable, Dict, Iterator, List, Optional
 
 import click
-from flask import current_app
+import yaml
+from flask import current_app, Flask
 from flask.cli import with_appcontext
+from werkzeug.exceptions import HTTPException
 
+from flask_openapi.core.codegen import generate_module
 from flask_openapi.utils.version import is_openapi3
 
 
 @click.command()
 @click.option("-f", "--file", type=click.File("w"), default="-")
 @click.option("-e", "--endpoint", default=None)
+@click.option(
+    "--check",
+    is_flag=True,
+    help="Fail if the file, or the static_file of the spec, is outdated.",
+)
 @with_appcontext
-def generate_api_schema(file, endpoint):
+def generate_api_schema(file, endpoint, check):
     """Generate the swagger schema for your api."""
     try:
         if endpoint is None:
             endpoint = current_app.swag.config["specs"][0]["endpoint"]
 
-        spec = current_app.swag.get_apispecs(endpoint)
+        # built from the rules even when served from a static_file
+        spec = current_app.swag.build_apispecs(endpoint)
     except RuntimeError as e:
         click.echo(e, err=True)
         click.echo(
@@ -39,6 +50,94 @@ def generate_api_schema(file, endpoint):
         if "definitions" in spec:
             del spec["definitions"]
 
+    if check:
+        check_api_schema(spec, endpoint, file)
+        return spec
+
     json.dump(spec, file, indent=4)
 
     return spec
+
+
+def check_api_schema(spec: Dict, endpoint: str, file: Any) -> None:
+    """
+    Exits with status 1 when the spec written to file, or to the
+    static_file of endpoint when writing to stdout, isn't spec
+
+    The lazy file is never opened for writing, so it isn't truncated.
+    """
+    # "-" gives stdout, files are opened lazily
+    path: Optional[str] = (
+        os.path.abspath(file.name) if isinstance(file, click.utils.LazyFile) else None
+    )
+    if path is None:
+        for spec_config in current_app.swag.config["specs"]:
+            if spec_config["endpoint"] == endpoint and spec_config.get("static_file"):
+                path = os.path.join(current_app.root_path, spec_config["static_file"])
+    if path is None:
+        raise click.UsageError("--check needs --file or a static_file for the spec")
+
+    try:
+        written: Any = current_app.swag.load_swagger_file(path)
+    except (OSError, ValueError, yaml.YAMLError) as e:
+        click.echo("Cannot read {0}: {1}".format(path, e), err=True)
+        raise click.exceptions.Exit(1)
+
+    # compared as JSON, as written by this command
+    if written != json.loads(json.dumps(spec)):
+        click.echo(
+            "{0} is outdated, run generate-api-schema to update it".format(path),
+            err=True,
+        )
+        raise click.exceptions.Exit(1)
+
+    click.echo("{0} is up to date".format(path), err=True)
+
+
+def iter_validation_compilers(app: Flask) -> Iterator[Callable]:
+    """
+    Yields the `compile_validation` callables of every view validating
+    its requests: `swag_from(validation=True)`, `Swagger.validate`,
+    annotation `Schema`s and `SwaggerView.validation`
+    """
+    seen: List[Callable] = []
+
+    def unwrap(function: Any) -> Iterator[Callable]:
+        # decorators copy the attribute outwards, hence the seen list
+        while function is not None:
+            compiler: Any = getattr(function, "__dict__", {}).get("compile_validation")
+            if compiler is not None and compiler not in seen:
+                seen.append(compiler)
+                yield compiler
+            function = getattr(function, "__wrapped__", None)
+
+    for view in app.view_functions.values():
+        yield from unwrap(view)
+
+        view_class: Any = getattr(view, "view_class", None)
+        if view_class is None:
+            continue
+
+        if getattr(view_class, "validation", False) and hasattr(
+            view_class, "compile_validation"
+        ):
+            yield view_class.compile_validation
+
+        for method in getattr(view_class, "methods", None) or []:
+            yield from unwrap(getattr(view_class, method.lower(), None))
+
+
+@click.command()
+@click.option("-f", "--file", type=click.File("w"), default="-")
+@with_appcontext
+def generate_validators(file):
+    """Generate a module of precompiled validators for your api."""
+    schemas: List[Any] = []
+
+    for compiler in iter_validation_compilers(current_app):
+        try:
+            schemas.append(compiler().schema)
+        except HTTPException as e:
+            click.echo("Skipping a validator: {}".format(e.description), err=True)
+
+    file.write(generate_module(schemas))
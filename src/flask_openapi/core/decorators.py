@@ -1,9 +1,15 @@
 import os
 from functools import wraps
 
-from flask import request
+from flask import g, request
 from flask_openapi.core.marshmallow_apispec import Schema
-from flask_openapi.core.validation import validate
+from flask_openapi.core.validation import (
+    compile_schema,
+    get_compiled_schema,
+    validate,
+    validate_compiled,
+    validate_stream,
+)
 from flask_openapi.utils.constants import DEFAULT_FIELDS
 from flask_openapi.utils.paths import get_root_path
 from six import string_types
@@ -20,6 +26,7 @@ def swag_from(
     definition=None,
     validation_function=None,
     validation_error_handler=None,
+    stream=False,
 ):
     """
     Takes a filename.yml, a dictionary or object and loads swagger specs.
@@ -40,6 +47,9 @@ def swag_from(
         exceptions thrown when validating which takes the exception
         thrown as the first, the data being validated as the second and
         the schema being used to validate as the third argument
+    :param stream: validate a JSON array or NDJSON body item by item
+        while the view reads them from `flask.g.validated_items`,
+        see `flask_openapi.core.validation.validate_stream`
     """
 
     def resolve_path(function, filepath):
@@ -92,6 +102,7 @@ def swag_from(
             return is_str_path
 
     def decorator(function):
+        validate_args = {}
         if is_path(specs):
             set_from_filepath(function)
             # function must have or a single swag_path or a list of them
@@ -107,7 +118,14 @@ def swag_from(
 
         @wraps(function)
         def wrapper(*args, **kwargs):
-            if validation is True:
+            if validation is True and stream:
+                g.validated_items = validate_stream(
+                    schema_id or definition,
+                    validation_function=validation_function,
+                    validation_error_handler=validation_error_handler,
+                    **validate_args,  # type: ignore
+                )
+            elif validation is True:
                 validate(
                     data,
                     schema_id or definition,
@@ -117,35 +135,72 @@ def swag_from(
                 )
             return function(*args, **kwargs)
 
+        filepath = validate_args.get("filepath")
+        if validation is True and (
+            isinstance(filepath, str) or "specs" in validate_args
+        ):
+
+            def compile_validation():
+                """
+                Lets `flask generate-validators` find the schema
+                """
+                compiled = get_compiled_schema(
+                    schema_id or definition,
+                    filepath=filepath,
+                    specs=validate_args.get("specs"),
+                )
+                return compiled.item_schema() if stream else compiled
+
+            wrapper.compile_validation = compile_validation
+
         return wrapper
 
     return decorator
 
 
 def validate_annotation(an, var):
+    """
+    Validates the request data of an annotation `Schema` and hands it to
+    the view as `var`. The specs are converted and compiled once, when
+    the route is registered.
+    """
+    if an.swag_in == "query":
+
+        def extract_payload():
+            return dict(request.args)
+
+    elif an.swag_in == "body":
+
+        def extract_payload():
+            return request.json if request.is_json else None
+
+    else:
+
+        def extract_payload():
+            return None
+
+    compiled = compile_schema(specs=an.to_specs_dict()) if an.swag_validate else None
+
     def decorator(f):
         @wraps(f)
         def wrapper(*args, **kwargs):
-            if an.swag_validate:
-                payload = None
-
-                if an.swag_in == "query":
-                    payload = dict(request.args)
-
-                elif an.swag_in == "body" and request.is_json:
-                    payload = request.json
+            payload = extract_payload()
 
-                validate(
+            if compiled is not None:
+                validate_compiled(
+                    compiled,
                     payload,
-                    specs=an.to_specs_dict(),
                     validation_function=an.swag_validation_function,
                     validation_error_handler=an.swag_validation_error_handler,
-                    require_data=an.swag_require_data
+                    require_data=an.swag_require_data,
                     # handle openapiversion later
                 )
 
             return f(*args, **kwargs, **{var: payload})
 
+        if compiled is not None:
+            wrapper.compile_validation = lambda: compiled
+
         return wrapper
 
     return decorator
@@ -1,12 +1,24 @@
 # coding: utf-8
+import copy
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type, Union
 
 from flask import Flask
 from flask.views import MethodView
-from flask_openapi.core.validation import validate
+from flask_openapi.core.validation import (
+    compile_schema,
+    CompiledSchema,
+    validate_compiled,
+)
+from flask_openapi.utils.cache import CacheInfo, LRUCache
 from flask_openapi.utils.constants import OPTIONAL_FIELDS
 
+DEFAULT_OPENAPI_VERSION: str = "2.0"
+CONVERSION_CACHE_SIZE: int = 512
+
+# converted schema classes, by (kind, class, openapi version)
+_conversion_cache: LRUCache = LRUCache(maxsize=CONVERSION_CACHE_SIZE)
+
 try:
     import marshmallow
     from apispec import APISpec as BaseAPISpec
@@ -20,6 +32,24 @@ try:
     )
     schema2jsonschema = openapi_converter.schema2jsonschema
     schema2parameters = openapi_converter.schema2parameters
+    _converters: Dict[str, openapi.OpenAPIConverter] = {
+        DEFAULT_OPENAPI_VERSION: openapi_converter
+    }
+
+    def get_converter(
+        openapi_version: Optional[Union[str, int]] = None,
+    ) -> openapi.OpenAPIConverter:
+        """
+        Returns the apispec converter for an OpenAPI version, 2.0 by default
+        """
+        version: str = str(openapi_version or DEFAULT_OPENAPI_VERSION)
+        if version not in _converters:
+            _converters[version] = openapi.OpenAPIConverter(
+                openapi_version=version,
+                schema_name_resolver=lambda schema: None,
+                spec=BaseAPISpec,  # type: ignore
+            )
+        return _converters[version]
 
     class Schema(marshmallow.Schema):
         swag_in: str = "body"
@@ -29,17 +59,28 @@ try:
         swag_require_data: bool = True
 
         def to_specs_dict(self) -> Dict[str, Type["Schema"]]:
-            specs = {"parameters": self.__class__}
-            definitions: Dict = {}
-            specs.update(convert_schemas(specs, definitions))
-            specs["definitions"] = definitions  # type: ignore
-            return specs
+            """
+            Returns the parameters and definitions of this schema class,
+            converted once per class; callers get their own copy
+            """
+            cls: Type = type(self)
+            specs: Optional[Dict] = cls.__dict__.get("_specs_dict")
+
+            if specs is None:
+                specs = {"parameters": cls}
+                definitions: Dict = {}
+                specs.update(convert_schemas(specs, definitions))
+                specs["definitions"] = definitions  # type: ignore
+                cls._specs_dict = specs
+
+            return copy.deepcopy(specs)
 
 except ImportError:
     Schema = None  # type: ignore
     fields = None  # type: ignore
     schema2jsonschema = lambda schema: {}  # type: ignore  # noqa
     schema2parameters = lambda schema, location: []  # type: ignore  # noqa
+    get_converter = None  # type: ignore
     BaseAPISpec = object  # type: ignore
 
 
@@ -99,34 +140,110 @@ class SwaggerView(MethodView):
     validation: bool = False
     validation_function: Optional[Callable] = None
     validation_error_handler: Optional[Callable] = None
+    _compiled_validation: Optional[CompiledSchema] = None
+
+    @classmethod
+    def validation_specs(cls) -> Dict:
+        """
+        Returns the specs the request data is validated against
+        """
+        specs: Dict = {}
+        attrs: List[str] = OPTIONAL_FIELDS + [
+            "parameters",
+            "definitions",
+            "responses",
+            "summary",
+            "description",
+        ]
+        for attr in attrs:
+            specs[attr] = getattr(cls, attr)
+        definitions: Dict = {}
+        specs.update(convert_schemas(specs, definitions))
+        specs["definitions"] = definitions
+        return specs
+
+    @classmethod
+    def compile_validation(cls) -> CompiledSchema:
+        """
+        Returns the compiled schema used by `dispatch_request`, built on
+        first use and kept on the class (subclasses get their own)
+        """
+        compiled: Optional[CompiledSchema] = cls.__dict__.get("_compiled_validation")
+
+        if compiled is None:
+            compiled = compile_schema(specs=cls.validation_specs())
+            cls._compiled_validation = compiled
+
+        return compiled
 
     def dispatch_request(self, *args, **kwargs):
         """
         If validation=True perform validation
         """
         if self.validation:
-            specs: Dict = {}
-            attrs: List[str] = OPTIONAL_FIELDS + [
-                "parameters",
-                "definitions",
-                "responses",
-                "summary",
-                "description",
-            ]
-            for attr in attrs:
-                specs[attr] = getattr(self, attr)
-            definitions: Dict = {}
-            specs.update(convert_schemas(specs, definitions))
-            specs["definitions"] = definitions
-            validate(
-                specs=specs,
+            validate_compiled(
+                self.compile_validation(),
                 validation_function=self.validation_function,
                 validation_error_handler=self.validation_error_handler,
             )
         return super(SwaggerView, self).dispatch_request(*args, **kwargs)
 
 
-def convert_schemas(d: Dict, definitions: Dict = {}) -> Dict:
+def convert_schema_class(
+    schema: Type,
+    kind: str = "definition",
+    openapi_version: Optional[Union[str, int]] = None,
+) -> Any:
+    """
+    Converts a Marshmallow schema class to its JSON schema ("definition")
+    or to its list of parameters ("parameters")
+
+    Conversions are done once per class and OpenAPI version and kept in a
+    bounded cache, see `conversion_cache_info`. Callers get their own copy.
+
+    :param schema: Marshmallow schema class
+    :type schema: Type[Schema]
+
+    :param kind: "definition" or "parameters"
+    :type kind: str
+
+    :param openapi_version: OpenAPI version, 2.0 by default
+    :type openapi_version: Optional[str]
+
+    :return: converted schema
+    :rtype: Any
+    """
+    version: str = str(openapi_version or DEFAULT_OPENAPI_VERSION)
+    key: Tuple[str, Type, str] = (kind, schema, version)
+
+    def convert() -> Any:
+        converter: Any = get_converter(version)
+        if kind == "parameters":
+            return converter.schema2parameters(schema, location=schema.swag_in)
+        return converter.schema2jsonschema(schema)
+
+    return copy.deepcopy(_conversion_cache.get_or_set(key, convert))
+
+
+def conversion_cache_info() -> CacheInfo:
+    """
+    Returns hits, misses, maxsize and current size of the conversion cache
+    """
+    return _conversion_cache.cache_info()
+
+
+def clear_conversion_cache() -> None:
+    """
+    Drops every converted schema class
+    """
+    _conversion_cache.cache_clear()
+
+
+def convert_schemas(
+    d: Dict,
+    definitions: Optional[Dict] = None,
+    openapi_version: Optional[Union[str, int]] = None,
+) -> Dict:
     """
     Convert Marshmallow schemas to dict definitions
 
@@ -139,20 +256,26 @@ def convert_schemas(d: Dict, definitions: Dict = {}) -> Dict:
     :param definitions: dict of definitions
     :type definitions: dict
 
+    :param openapi_version: OpenAPI version, 2.0 by default
+    :type openapi_version: Optional[str]
+
     :return: converted dict
     :rtype: dict
     """
+    if definitions is None:
+        definitions = {}
+
     definitions.update(d.get("definitions", {}))
     new: Dict = {}
 
     for k, v in d.items():
         if isinstance(v, dict):
-            v = convert_schemas(v, definitions)
+            v = convert_schemas(v, definitions, openapi_version)
         if isinstance(v, (list, tuple)):
             new_v: List = []
             for item in v:
                 if isinstance(item, dict):
-                    new_v.append(convert_schemas(item, definitions))
+                    new_v.append(convert_schemas(item, definitions, openapi_version))
                 else:
                     new_v.append(item)
             v = new_v
@@ -160,10 +283,12 @@ def convert_schemas(d: Dict, definitions: Dict = {}) -> Dict:
             if Schema is None:
                 raise RuntimeError("Please install marshmallow and apispec")
 
-            definitions[v.__name__] = schema2jsonschema(v)
+            definitions[v.__name__] = convert_schema_class(
+                v, openapi_version=openapi_version
+            )
             ref: Dict[str, str] = {"$ref": "#/definitions/{0}".format(v.__name__)}
             if k == "parameters":
-                new[k] = schema2parameters(v, location=v.swag_in)
+                new[k] = convert_schema_class(v, "parameters", openapi_version)
                 new[k][0]["schema"] = ref
                 if len(definitions[v.__name__]["required"]) != 0:
                     new[k][0]["required"] = True
@@ -4,9 +4,8 @@ import re
 from collections import defaultdict
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
-import yaml
 from flask import request
-from flask_openapi.utils.files import load_from_file
+from flask_openapi.utils.files import load_from_file, load_yaml
 from flask_openapi.utils.paths import get_path_from_doc, get_root_path
 from flask_openapi.utils.version import is_openapi3
 
@@ -45,22 +44,19 @@ def parse_imports(doc_string: str, root_path: Optional[str] = None):
     return doc_string
 
 
-def parse_docstring(
+def load_docstring(
     obj: Any,
-    process_doc: Callable,
     endpoint: Optional[str] = None,
     verb: Optional[str] = None,
     swag_path: Optional[str] = None,
-) -> Tuple[str, str, Dict]:
+) -> Tuple[str, bool, Optional[str]]:
     """
-    Gets swag data for method/view docstring
+    Reads the swag document of a method/view, from its docstring or its
+    file, with its `import:`s resolved
 
     :param obj: method/view
     :type obj: Any
 
-    :param process_doc: function to process docstring
-    :type process_doc: Callable
-
     :param endpoint: endpoint name
     :type endpoint: Optional[str]
 
@@ -70,13 +66,9 @@ def parse_docstring(
     :param swag_path: path to swagger file
     :type swag_path: Optional[str]
 
-    :return: first line, other lines, swag
-    :rtype: Tuple[str, str, dict]
+    :return: document, whether it was read from a file, file path
+    :rtype: Tuple[str, bool, Optional[str]]
     """
-
-    first_line: str = ""
-    other_lines: str = ""
-    swag: Dict = {}
     full_doc: str = ""
 
     if not swag_path:
@@ -86,15 +78,18 @@ def parse_docstring(
     swag_paths: List[str] = getattr(obj, "swag_paths", [])
     root_path: str = get_root_path(obj)
     from_file: bool = False
+    doc_path: Optional[str] = None
 
     if swag_path:
         full_doc = load_from_file(swag_path, swag_type)
         from_file = True
+        doc_path = swag_path
     elif swag_paths and verb:
         for key in (f"{endpoint}_{verb}", endpoint, verb.lower()):
             if key and key in swag_paths:
                 path: str = swag_paths[key]  # type: ignore  # this is a str i promise...
                 full_doc = load_from_file(path, swag_type)
+                doc_path = path
                 break
         from_file = True
     else:
@@ -108,9 +103,77 @@ def parse_docstring(
             doc_filepath = os.path.join(obj.root_path, swag_path)
             full_doc = load_from_file(doc_filepath, swag_type)
             from_file = True
+            doc_path = doc_filepath
 
         full_doc = parse_imports(full_doc, root_path)
 
+    return full_doc, from_file, doc_path
+
+
+def docstring_yaml(full_doc: str, from_file: bool) -> Optional[str]:
+    """
+    Returns the YAML part of a swag document: what follows `---`, or the
+    whole document for files without it
+
+    :param full_doc: document from `load_docstring`
+    :type full_doc: str
+
+    :param from_file: whether the document was read from a file
+    :type from_file: bool
+
+    :return: YAML content, None when there is none
+    :rtype: Optional[str]
+    """
+    yaml_sep: int = full_doc.find("---")
+
+    if yaml_sep != -1:
+        if full_doc.find("\n") != -1:
+            return full_doc[yaml_sep + 4 :]
+        return None
+
+    return full_doc if from_file and full_doc else None
+
+
+def parse_docstring(
+    obj: Any,
+    process_doc: Callable,
+    endpoint: Optional[str] = None,
+    verb: Optional[str] = None,
+    swag_path: Optional[str] = None,
+    preloaded: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, str, Dict]:
+    """
+    Gets swag data for method/view docstring
+
+    :param obj: method/view
+    :type obj: Any
+
+    :param process_doc: function to process docstring
+    :type process_doc: Callable
+
+    :param endpoint: endpoint name
+    :type endpoint: Optional[str]
+
+    :param verb: http verb
+    :type verb: Optional[str]
+
+    :param swag_path: path to swagger file
+    :type swag_path: Optional[str]
+
+    :param preloaded: YAML parsed ahead by `preload_yaml`
+    :type preloaded: Optional[Dict[str, Any]]
+
+    :return: first line, other lines, swag
+    :rtype: Tuple[str, str, dict]
+    """
+
+    first_line: str = ""
+    other_lines: str = ""
+    swag: Dict = {}
+
+    full_doc, from_file, doc_path = load_docstring(obj, endpoint, verb, swag_path)
+
+    if full_doc:
         yaml_sep: int = full_doc.find("---")
 
         if yaml_sep != -1:
@@ -118,12 +181,12 @@ def parse_docstring(
             if line_feed != -1:
                 first_line = process_doc(full_doc[:line_feed])
                 other_lines = process_doc(full_doc[line_feed + 1 : yaml_sep])
-                swag = yaml.safe_load(full_doc[yaml_sep + 4 :])
-        else:
-            if from_file:
-                swag = yaml.safe_load(full_doc)
-            else:
-                first_line = full_doc
+        elif not from_file:
+            first_line = full_doc
+
+        content: Optional[str] = docstring_yaml(full_doc, from_file)
+        if content is not None:
+            swag = load_yaml(content, doc_path, preloaded=preloaded)
 
     return first_line, other_lines, swag
 
@@ -149,9 +212,11 @@ def parse_definition_docstring(obj: Any, process_doc: Callable) -> Tuple[str, Di
     full_doc: str = ""
     swag_path: str = getattr(obj, "swag_path", "")
     swag_type: Literal["yml", "yaml"] = getattr(obj, "swag_type", "yml")
+    doc_path: Optional[str] = None
 
     if swag_path:
         full_doc = load_from_file(swag_path, swag_type)
+        doc_path = swag_path
     else:
         full_doc = inspect.getdoc(obj) or ""
 
@@ -162,11 +227,12 @@ def parse_definition_docstring(obj: Any, process_doc: Callable) -> Tuple[str, Di
             swag_path, swag_type = get_path_from_doc(full_doc)
             doc_filepath: str = os.path.join(obj.root_path, swag_path)
             full_doc = load_from_file(doc_filepath, swag_type)
+            doc_path = doc_filepath
 
         yaml_sep: int = full_doc.find("---")
         if yaml_sep != -1:
             doc_lines = process_doc(full_doc[: yaml_sep - 1]) if yaml_sep else None
-            swag = yaml.safe_load(full_doc[yaml_sep:])
+            swag = load_yaml(full_doc[yaml_sep:], doc_path)
         else:
             doc_lines = process_doc(full_doc)
 
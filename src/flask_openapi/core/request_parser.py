@@ -0,0 +1,316 @@
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from flask import abort, request
+
+COLLECTION_DELIMITERS: Dict[str, str] = {
+    "csv": ",",
+    "ssv": " ",
+    "tsv": "\t",
+    "pipes": "|",
+}
+# OpenAPI 3 styles: default per location, delimiter of non exploded arrays
+DEFAULT_STYLES: Dict[str, str] = {
+    "query": "form",
+    "cookie": "form",
+    "path": "simple",
+    "header": "simple",
+}
+STYLE_DELIMITERS: Dict[str, str] = {
+    "form": ",",
+    "simple": ",",
+    "spaceDelimited": " ",
+    "pipeDelimited": "|",
+}
+TRUE_VALUES = frozenset(["true", "1"])
+FALSE_VALUES = frozenset(["false", "0"])
+
+MISSING: Any = object()
+
+
+def coerce_value(value: Any, type_name: Optional[str]) -> Any:
+    """
+    Converts a raw request string to the parameter type, leaving values
+    which don't convert as they are so validation reports them
+
+    :param value: raw value
+    :type value: Any
+
+    :param type_name: JSON schema type of the parameter
+    :type type_name: Optional[str]
+
+    :return: converted value
+    :rtype: Any
+    """
+    if not isinstance(value, str):
+        return value
+
+    try:
+        if type_name == "integer":
+            return int(value)
+        if type_name == "number":
+            return float(value)
+    except ValueError:
+        return value
+
+    if type_name == "boolean":
+        lowered: str = value.lower()
+        if lowered in TRUE_VALUES:
+            return True
+        if lowered in FALSE_VALUES:
+            return False
+
+    return value
+
+
+def get_values(source: Any, name: str) -> List[Any]:
+    """
+    Returns every value of name, for multi dicts, or a single value list
+    """
+    if hasattr(source, "getlist"):
+        return source.getlist(name)
+    return [source[name]]
+
+
+def split_pairs(values: List[str], exploded: bool) -> List[Tuple[str, str]]:
+    """
+    Reads object properties serialized as "k=v" items (exploded) or as
+    alternating keys and values
+    """
+    if exploded:
+        return [tuple(item.partition("=")[::2]) for item in values]  # type: ignore
+    return list(zip(values[::2], values[1::2]))
+
+
+class ParameterParser(object):
+    """
+    Extracts the parameters of one request location and converts them to
+    their declared types, following the plan compiled from their OpenAPI
+    definitions when the operation is prepared
+
+    Values are validated afterwards against the location schema, in a
+    single jsonschema pass.
+    """
+
+    def __init__(self, location: str):
+        self.location = location
+        self.extractors: List[Tuple[str, Callable[[Any], Any]]] = []
+        self.required: List[str] = []
+
+    def add_parameter(self, param: Dict, openapi3: bool = False) -> None:
+        """
+        Compiles the extraction of a parameter
+
+        :param param: OpenAPI parameter, its type either inline or in `schema`
+        :type param: dict
+
+        :param openapi3: deserialize following `style` and `explode`
+            instead of `collectionFormat`
+        :type openapi3: bool
+        """
+        name: str = param["name"]
+        schema: Dict = param["schema"] if "schema" in param else param
+
+        if param.get("required", False):
+            self.required.append(name)
+
+        if openapi3:
+            style: str = param.get("style") or DEFAULT_STYLES.get(
+                param.get("in"), "form"
+            )
+            explode: bool = param.get("explode", style == "form")
+            extractor: Callable[[Any], Any] = self.styled_extractor(
+                name, schema, style, explode
+            )
+        elif schema.get("type") == "array":
+            extractor = self.array_extractor(
+                name,
+                (schema.get("items") or {}).get("type"),
+                param.get("collectionFormat", "csv"),
+            )
+        else:
+            extractor = self.value_extractor(name, schema.get("type"))
+
+        self.extractors.append((name, extractor))
+
+    @staticmethod
+    def value_extractor(
+        name: str, type_name: Optional[str], prefix: str = ""
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function reading a single value
+        """
+
+        def extract_value(source: Any) -> Any:
+            if name not in source:
+                return MISSING
+            value: Any = get_values(source, name)[0]
+            if prefix and isinstance(value, str) and value.startswith(prefix):
+                value = value[len(prefix) :]
+            return coerce_value(value, type_name)
+
+        return extract_value
+
+    @staticmethod
+    def array_extractor(
+        name: str,
+        items_type: Optional[str],
+        collection_format: str,
+        prefix: str = "",
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function reading an array from its serialized form
+        """
+        if collection_format == "multi":
+
+            def extract_multi(source: Any) -> Any:
+                if name not in source:
+                    return MISSING
+                return [coerce_value(v, items_type) for v in get_values(source, name)]
+
+            return extract_multi
+
+        delimiter: str = COLLECTION_DELIMITERS.get(collection_format, collection_format)
+
+        def extract_delimited(source: Any) -> Any:
+            if name not in source:
+                return MISSING
+            value: Any = get_values(source, name)[0]
+            if not isinstance(value, str):
+                return value
+            if prefix and value.startswith(prefix):
+                value = value[len(prefix) :]
+            return [coerce_value(item, items_type) for item in value.split(delimiter)]
+
+        return extract_delimited
+
+    @classmethod
+    def styled_extractor(
+        cls, name: str, schema: Dict, style: str, explode: bool
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function deserializing an OpenAPI 3 parameter
+        """
+        type_name: Optional[str] = schema.get("type")
+        # path styles prefixing the value: ".a" (label) and ";name=a" (matrix)
+        prefix: str = {"label": ".", "matrix": ";{0}=".format(name)}.get(style, "")
+
+        if type_name == "array":
+            items_type: Optional[str] = (schema.get("items") or {}).get("type")
+            if explode and style in ("form", "spaceDelimited", "pipeDelimited"):
+                return cls.array_extractor(name, items_type, "multi")
+            if style == "label":
+                return cls.array_extractor(
+                    name, items_type, "." if explode else ",", "."
+                )
+            if style == "matrix":
+                delimiter: str = prefix if explode else ","
+                return cls.array_extractor(name, items_type, delimiter, prefix)
+            return cls.array_extractor(
+                name, items_type, STYLE_DELIMITERS.get(style, ","), prefix
+            )
+
+        if type_name == "object":
+            return cls.object_extractor(name, schema, style, explode, prefix)
+
+        return cls.value_extractor(name, type_name, prefix)
+
+    @staticmethod
+    def object_extractor(
+        name: str, schema: Dict, style: str, explode: bool, prefix: str
+    ) -> Callable[[Any], Any]:
+        """
+        Returns a function deserializing an OpenAPI 3 object parameter
+        """
+        properties: Dict[str, Dict] = schema.get("properties") or {}
+
+        def build(pairs: Any) -> Any:
+            converted: Dict[str, Any] = {
+                key: coerce_value(value, properties.get(key, {}).get("type"))
+                for key, value in pairs
+            }
+            return converted if converted else MISSING
+
+        if style == "deepObject":
+            start: str = name + "["
+
+            def extract_deep(source: Any) -> Any:
+                return build(
+                    (key[len(start) : -1], get_values(source, key)[0])
+                    for key in source
+                    if key.startswith(start) and key.endswith("]")
+                )
+
+            return extract_deep
+
+        if style == "form" and explode:
+
+            def extract_exploded(source: Any) -> Any:
+                return build(
+                    (key, get_values(source, key)[0])
+                    for key in properties
+                    if key in source
+                )
+
+            return extract_exploded
+
+        delimiter: str = STYLE_DELIMITERS.get(style, ",")
+        if style == "label" and explode:
+            delimiter = "."
+        elif style == "matrix" and explode:
+            delimiter, prefix = ";", ";"
+
+        def extract_serialized(source: Any) -> Any:
+            if name not in source:
+                return MISSING
+            value: Any = get_values(source, name)[0]
+            if not isinstance(value, str):
+                return value
+            if prefix and value.startswith(prefix):
+                value = value[len(prefix) :]
+            return build(split_pairs(value.split(delimiter), explode))
+
+        return extract_serialized
+
+    def get_source(self) -> Any:
+        """
+        Returns the request data of this location
+        """
+        if self.location == "json":
+            return request.get_json(silent=True) or {}
+        if self.location == "path":
+            return request.view_args or {}
+        return getattr(request, self.location)
+
+    def parse_args(self) -> Dict[str, Any]:
+        """
+        Returns the parameters present in the request, converted
+
+        Aborts with 400 when a required parameter is missing.
+        """
+        source: Any = self.get_source()
+        data: Dict[str, Any] = {}
+
+        for name, extract in self.extractors:
+            value: Any = extract(source)
+            if value is not MISSING:
+                data[name] = value
+
+        for name in self.required:
+            if name not in data:
+                abort(
+                    400,
+                    "Missing required parameter {0} in {1}".format(name, self.location),
+                )
+
+        return data
+
+
+class ParserMap(dict):
+    """
+    Parameter parsers of an operation by location, created on first use
+    """
+
+    def __missing__(self, location: str) -> ParameterParser:
+        parser: ParameterParser = ParameterParser(location)
+        self[location] = parser
+        return parser
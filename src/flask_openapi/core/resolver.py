@@ -0,0 +1,265 @@
+import os
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from flask_openapi.utils.cache import CacheInfo, LRUCache
+from flask_openapi.utils.files import (
+    file_signature,
+    load_yaml,
+    note_reads,
+    read_file,
+)
+
+DOCUMENT_CACHE_SIZE: int = 256
+RECURSIVE_DEFINITIONS_KEY: str = "definitions"
+
+# resolved external documents which don't point back into a spec, with
+# the signatures of every file they were resolved from
+_document_cache: LRUCache = LRUCache(maxsize=DOCUMENT_CACHE_SIZE)
+
+
+def files_unchanged(signatures: Dict[str, Optional[Tuple[int, int]]]) -> bool:
+    """
+    Tells if none of the files changed since their signatures were taken
+
+    :param signatures: `file_signature` by path
+    :type signatures: dict
+
+    :return: whether every signature still matches
+    :rtype: bool
+    """
+    for path, signature in signatures.items():
+        try:
+            if file_signature(path) != signature:
+                return False
+        except OSError:
+            return False
+
+    return True
+
+
+def follow_pointer(document: Any, pointer: str) -> Any:
+    """
+    Walks a JSON pointer (without the leading `#/`) into a document
+
+    :param document: document to walk
+    :type document: Any
+
+    :param pointer: JSON pointer, segments separated by `/`
+    :type pointer: str
+
+    :return: referenced node
+    :rtype: Any
+    """
+    for segment in pointer.split("/"):
+        if not segment:
+            continue
+        segment = segment.replace("~1", "/").replace("~0", "~")
+        if isinstance(document, list):
+            document = document[int(segment)]
+        else:
+            document = document[segment]
+
+    return document
+
+
+class SchemaResolver(object):
+    """
+    Inlines the `$ref`s of a schema
+
+    Local references (`#/...`) are looked up in the spec, anything else
+    is loaded as a YAML file relative to the document referencing it.
+    Each reference is resolved once and the result is shared by every
+    place using it; external documents which don't point back into the
+    spec are also shared between resolvers, until any of the files they
+    were resolved from changes. The resolved graph is shared and must be
+    treated as read-only.
+
+    A reference met again while it is still being resolved (a tree node
+    holding its children, say) is kept as a `$ref` into the definitions
+    of the resolved root schema, so recursive schemas stay finite.
+    """
+
+    def __init__(self, swag: Dict, relative_path: str):
+        self.swag = swag
+        self.relative_path = relative_path
+        self._resolved: Dict[Tuple[str, str], Tuple[Tuple[Any, bool], Dict]] = {}
+        # signatures of the files read by the references being resolved
+        self._collecting: List[Dict[str, Optional[Tuple[int, int]]]] = []
+        self._in_progress: Dict[Tuple[str, str], Optional[str]] = {}
+        self._recursive: Dict[str, Any] = {}
+
+    def resolve(self, schema: Any) -> Any:
+        """
+        Returns schema with every reference inlined
+
+        :param schema: schema to resolve
+        :type schema: Any
+
+        :return: resolved schema
+        :rtype: Any
+        """
+        resolved: Any = self._resolve(schema, self.relative_path)[0]
+
+        if self._recursive:
+            if not isinstance(resolved, dict):
+                raise RuntimeError("Recursive references need an object schema")
+            resolved = dict(resolved)
+            definitions: Dict = dict(resolved.get(RECURSIVE_DEFINITIONS_KEY) or {})
+            definitions.update(self._recursive)
+            resolved[RECURSIVE_DEFINITIONS_KEY] = definitions
+
+        return resolved
+
+    def _resolve(self, node: Any, relative_path: str) -> Tuple[Any, bool]:
+        """
+        Returns the resolved node and whether it depends on the spec,
+        i.e. whether a local reference was followed to build it
+        """
+        dependent: bool = False
+
+        if isinstance(node, dict):
+            ref: Any = node.get("$ref")
+            if isinstance(ref, str):
+                return self._resolve_ref(ref, relative_path)
+
+            new_dict: Dict = {}
+            for key, value in node.items():
+                new_dict[key], value_dependent = self._resolve(value, relative_path)
+                dependent = dependent or value_dependent
+            return new_dict, dependent
+
+        if isinstance(node, list):
+            new_list: List = []
+            for item in node:
+                resolved, item_dependent = self._resolve(item, relative_path)
+                new_list.append(resolved)
+                dependent = dependent or item_dependent
+            return new_list, dependent
+
+        return node, False
+
+    def _record(self, signatures: Dict[str, Optional[Tuple[int, int]]]) -> None:
+        """
+        Adds files to those read by the references being resolved
+        """
+        for collected in self._collecting:
+            collected.update(signatures)
+
+    def _resolve_ref(self, ref: str, relative_path: str) -> Tuple[Any, bool]:
+        key: Tuple[str, str] = (relative_path, ref)
+
+        if key in self._resolved:
+            resolved, signatures = self._resolved[key]
+            self._record(signatures)
+            return resolved
+
+        if key in self._in_progress:
+            name: Optional[str] = self._in_progress[key]
+            if name is None:
+                name = self._in_progress[key] = self._definition_name(ref)
+            pointer: str = "#/{0}/{1}".format(RECURSIVE_DEFINITIONS_KEY, name)
+            # points into the root schema, so never shared between resolvers
+            return {"$ref": pointer}, True
+
+        signatures: Dict[str, Optional[Tuple[int, int]]] = {}
+        self._collecting.append(signatures)
+        self._in_progress[key] = None
+        try:
+            if len(ref) > 2 and ref.startswith("#/"):  # $ref is local
+                content: Any = follow_pointer(self.swag, ref[2:])
+                resolved: Tuple[Any, bool] = (
+                    self._resolve(content, relative_path)[0],
+                    True,
+                )
+            else:
+                resolved = self._resolve_file(ref, relative_path)
+        finally:
+            name = self._in_progress.pop(key)
+            self._collecting.pop()
+
+        if name is not None:
+            self._recursive[name] = resolved[0]
+            resolved = (resolved[0], True)
+
+        self._resolved[key] = (resolved, signatures)
+        return resolved
+
+    def _definition_name(self, ref: str) -> str:
+        """
+        Picks a unique definitions key for a recursive reference
+        """
+        base: str = ref.rstrip("/").split("/")[-1].split("#")[0] or "schema"
+        base = os.path.splitext(base)[0] or "schema"
+        taken: set = set(self._recursive) | set(self._in_progress.values())
+
+        name: str = "{0}_recursive".format(base)
+        index: int = 1
+        while name in taken:
+            index += 1
+            name = "{0}_recursive_{1}".format(base, index)
+
+        return name
+
+    def _resolve_file(self, ref: str, relative_path: str) -> Tuple[Any, bool]:
+        path, _, pointer = ref.partition("#")
+
+        if path.startswith("/"):
+            path = os.path.dirname(sys.argv[0]) + path
+        else:
+            path = os.path.join(relative_path, path)
+        path = os.path.normpath(path)
+
+        try:
+            signature: Optional[Tuple[int, int]] = file_signature(path)
+        except OSError:
+            signature = None
+
+        doc_key: Tuple[str, str] = (path, pointer)
+        cached: Any = _document_cache.get(doc_key)
+        if cached is not None and files_unchanged(cached[1]):
+            self._record(cached[1])
+            note_reads(cached[1])
+            return cached[0], False
+
+        signatures: Dict[str, Optional[Tuple[int, int]]] = {path: signature}
+        self._collecting.append(signatures)
+        try:
+            self._record(signatures)
+            resolved, dependent = self._load_file(path, pointer)
+        finally:
+            self._collecting.pop()
+
+        if not dependent:
+            _document_cache.set(doc_key, (resolved, signatures))
+
+        return resolved, dependent
+
+    def _load_file(self, path: str, pointer: str) -> Tuple[Any, bool]:
+        file_content: str = read_file(path)
+        comment_index: int = file_content.rfind("---")
+
+        if comment_index > 0:
+            comment_index = comment_index + 3
+        else:
+            comment_index = 0
+
+        document: Any = load_yaml(file_content[comment_index:], path, shared=True)
+        if pointer:
+            document = follow_pointer(document, pointer)
+
+        return self._resolve(document, os.path.dirname(path))
+
+
+def resolver_cache_info() -> CacheInfo:
+    """
+    Returns hits, misses, maxsize and current size of the document cache
+    """
+    return _document_cache.cache_info()
+
+
+def clear_resolver_cache() -> None:
+    """
+    Drops every resolved external document
+    """
+    _document_cache.cache_clear()
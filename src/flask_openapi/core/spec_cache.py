@@ -0,0 +1,282 @@
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import types
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from flask_openapi import __version__
+from flask_openapi.core.marshmallow_apispec import convert_schema_class
+from flask_openapi.utils.paths import get_path_from_doc, get_root_path
+
+try:
+    from marshmallow import Schema as MarshmallowSchema
+except ImportError:
+    MarshmallowSchema = None  # type: ignore
+
+VIEW_CLASS_METHODS = (
+    "dispatch_request",
+    "verb",
+    "get",
+    "post",
+    "put",
+    "patch",
+    "delete",
+)
+
+
+def update_code_digest(digest: Any, code: types.CodeType) -> None:
+    """
+    Feeds the bytecode, names and constants of code (nested functions
+    included) to digest, leaving out what differs between processes
+    such as addresses and set ordering
+    """
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode("utf-8"))
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            update_code_digest(digest, const)
+        elif isinstance(const, frozenset):
+            digest.update(repr(sorted(map(repr, const))).encode("utf-8"))
+        else:
+            digest.update(repr(const).encode("utf-8"))
+
+
+def schema_repr(schema: type) -> Any:
+    """
+    Describes a marshmallow schema class by its JSON schema, nested
+    schemas included, falling back to its declared fields when apispec
+    can't convert it
+    """
+    try:
+        converted: Any = convert_schema_class(schema)
+    except Exception:
+        converted = {
+            name: [type(field).__module__, type(field).__qualname__]
+            for name, field in schema._declared_fields.items()
+        }
+    return [
+        "{0}.{1}".format(schema.__module__, schema.__qualname__),
+        getattr(schema, "swag_in", None),
+        converted,
+    ]
+
+
+def stable_repr(value: Any) -> Any:
+    """
+    `json.dumps` default for config and specs values which aren't JSON:
+    functions are described by their code, marshmallow schemas by their
+    fields, other objects by their type
+    """
+    code: Optional[types.CodeType] = getattr(value, "__code__", None)
+    if code is not None:
+        digest = hashlib.sha256()
+        update_code_digest(digest, code)
+        return digest.hexdigest()
+    if isinstance(value, (set, frozenset)):
+        return sorted(map(repr, value))
+    if MarshmallowSchema is not None:
+        if isinstance(value, MarshmallowSchema):
+            value = type(value)
+        if isinstance(value, type) and issubclass(value, MarshmallowSchema):
+            return schema_repr(value)
+    if isinstance(value, type):
+        return "{0}.{1}".format(value.__module__, value.__qualname__)
+    return "{0}.{1}".format(type(value).__module__, type(value).__qualname__)
+
+
+def iter_view_functions(view: Any) -> Iterator[Any]:
+    """
+    Yields the functions documenting a view: its decorator chain and,
+    for class based views, the methods of the class
+    """
+    function: Any = view
+    while function is not None:
+        yield function
+        function = getattr(function, "__wrapped__", None)
+
+    view_class: Any = getattr(view, "view_class", None)
+    if view_class is not None:
+        yield view_class
+        for name in VIEW_CLASS_METHODS:
+            method: Any = getattr(view_class, name, None)
+            while method is not None:
+                yield method
+                method = getattr(method, "__wrapped__", None)
+
+
+def iter_source_files(function: Any, doc_dir: Optional[str]) -> Iterator[str]:
+    """
+    Yields the YAML files a documented function is read from
+    """
+    swag_path: Optional[str] = getattr(function, "swag_path", None)
+    if swag_path:
+        yield swag_path
+    yield from (getattr(function, "swag_paths", None) or {}).values()
+
+    doc: str = (getattr(function, "__doc__", None) or "").strip()
+    if doc.startswith("file:"):
+        path: str = get_path_from_doc(doc)[0]
+        try:
+            root: str = getattr(function, "root_path", None) or get_root_path(function)
+        except TypeError:
+            return
+        yield os.path.join(root, path)
+
+
+def update_file_digest(digest: Any, path: str) -> None:
+    """
+    Feeds the path and contents of a file to digest
+    """
+    digest.update(path.encode("utf-8"))
+    try:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    except OSError:
+        digest.update(b"\0missing")
+
+
+def spec_fingerprint(swagger: Any) -> str:
+    """
+    Fingerprints everything the specs of swagger are built from: the
+    rules of the app and the code, docstrings and YAML files of their
+    views, the definitions, the template and the config
+
+    Files pulled in by `import:` directives or `$ref`s only show once the
+    spec is built: they are recorded with it, see `save_cached_spec`.
+
+    :param swagger: Swagger instance
+    :type swagger: flask_openapi.Swagger
+
+    :return: hexadecimal sha256
+    :rtype: str
+    """
+    digest = hashlib.sha256(__version__.encode("utf-8"))
+    doc_dir: Optional[str] = swagger.config.get("doc_dir")
+
+    def update_json(value: Any) -> None:
+        try:
+            dumped: str = json.dumps(value, sort_keys=True, default=stable_repr)
+        except TypeError:  # keys of mixed types, like 200 and "default"
+            dumped = json.dumps(value, default=stable_repr)
+        digest.update(dumped.encode("utf-8"))
+
+    update_json(swagger.config)
+    update_json(swagger.template)
+
+    for definition in swagger.definition_models:
+        update_json([definition.name, definition.tags, definition.obj.__doc__])
+
+    for rule in swagger.app.url_map.iter_rules():
+        update_json([rule.rule, rule.endpoint, sorted(rule.methods or ())])
+        view: Any = swagger.app.view_functions.get(rule.endpoint)
+
+        for function in iter_view_functions(view):
+            update_json([function.__doc__, getattr(function, "specs_dict", None)])
+            code: Optional[types.CodeType] = getattr(function, "__code__", None)
+            if code is not None:
+                update_code_digest(digest, code)
+            elif isinstance(function, type):
+                update_json(
+                    {
+                        key: value
+                        for key, value in vars(function).items()
+                        if not key.startswith("__") and not callable(value)
+                    }
+                )
+            for path in iter_source_files(function, doc_dir):
+                update_file_digest(digest, path)
+
+    if doc_dir and os.path.isdir(doc_dir):
+        for root, dirs, files in os.walk(doc_dir):
+            dirs.sort()
+            for name in sorted(files):
+                update_file_digest(digest, os.path.join(root, name))
+
+    return digest.hexdigest()
+
+
+def file_digest(path: str) -> Optional[str]:
+    """
+    Returns the sha256 of the contents of a file, None when unreadable
+    """
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def load_cached_spec(path: str, fingerprint: str) -> Optional[Dict]:
+    """
+    Returns the spec cached in path when it was built from fingerprint
+    and the files read building it are unchanged
+
+    :param path: cache file
+    :type path: str
+
+    :param fingerprint: fingerprint of the current sources
+    :type fingerprint: str
+
+    :return: cached spec, None when missing, unreadable or stale
+    :rtype: Optional[dict]
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cached: Any = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get("fingerprint") != fingerprint:
+        return None
+
+    files: Any = cached.get("files") or {}
+    if not isinstance(files, dict):
+        return None
+    for source, digest in files.items():
+        if file_digest(source) != digest:
+            return None
+
+    return cached.get("spec")
+
+
+def save_cached_spec(
+    path: str, fingerprint: str, spec: Dict, files: Iterable[str] = ()
+) -> None:
+    """
+    Writes spec to the cache file, atomically so concurrent workers
+    never read a partial file; failures are logged, the spec being
+    built again next time
+
+    :param path: cache file
+    :type path: str
+
+    :param fingerprint: fingerprint of the sources spec was built from
+    :type fingerprint: str
+
+    :param spec: built spec
+    :type spec: dict
+
+    :param files: files read building spec, the cache is stale once
+        any changes
+    :type files: Iterable[str]
+    """
+    cached: Dict = {
+        "fingerprint": fingerprint,
+        "files": {source: file_digest(source) for source in sorted(files)},
+        "spec": spec,
+    }
+    directory: str = os.path.dirname(os.path.abspath(path))
+    try:
+        os.makedirs(directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(cached, f)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+    except (OSError, TypeError, ValueError):
+        logging.exception("Could not write the spec cache {0}".format(path))
@@ -1,10 +1,29 @@
+import multiprocessing
+import threading
+from concurrent.futures import BrokenExecutor, ProcessPoolExecutor, ThreadPoolExecutor
 from copy import deepcopy
-from typing import Any, Callable, Iterator, Optional, Union, Dict, Set, List
+from typing import (
+    Any,
+    Callable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Union,
+    Dict,
+    Set,
+    List,
+    Tuple,
+)
 
 from flask import current_app
 from flask_openapi.core.marshmallow_apispec import convert_schemas, SwaggerView
-from flask_openapi.core.parser import parse_docstring
-from flask_openapi.utils.constants import OPTIONAL_FIELDS
+from flask_openapi.core.parser import (
+    docstring_yaml,
+    load_docstring,
+    parse_definition_docstring,
+    parse_docstring,
+)
+from flask_openapi.utils.files import preload_yaml
 from flask_openapi.utils.paths import get_swag_path_from_doc_dir
 from flask_openapi.utils.types import ordered_dict_to_dict
 from flask_openapi.utils.version import is_openapi3
@@ -42,6 +61,159 @@ def merge_specs(target: Dict, source: Dict):
             target[key] = value
 
 
+def resolve_view_methods(rule: Rule, ignore_verbs: Set[str]) -> Tuple[Callable, List]:
+    """
+    Finds the view of a rule and the method documenting each of its verbs
+
+    :param rule: Flask url rule
+    :type rule: werkzeug.routing.Rule
+
+    :param ignore_verbs: Verbs to ignore
+    :type ignore_verbs: set
+
+    :return: view, list of (verb, method)
+    :rtype: Tuple[Callable, list]
+    """
+    endpoint: Callable = current_app.view_functions[rule.endpoint]
+    methods: Dict = {}
+    is_mv: bool = is_valid_method_view(endpoint)
+
+    if rule.methods:
+        for verb in rule.methods.difference(ignore_verbs):
+            if not is_mv and has_valid_dispatch_view_docs(endpoint):
+                endpoint.methods = endpoint.methods or ["GET"]
+                if verb in endpoint.methods:
+                    methods[verb.lower()] = endpoint
+            elif getattr(endpoint, "methods", None) is not None:
+                if isinstance(endpoint.methods, set):
+                    if verb in endpoint.methods:
+                        verb = verb.lower()
+                        methods[verb] = getattr(endpoint.view_class, verb)
+                elif fmr_methods is not None:  # flask-mongorest
+                    endpoint_methods: Set = set(m.method for m in endpoint.methods)
+                    if verb in endpoint_methods:
+                        proxy_verb = rule.endpoint.replace(endpoint.__name__, "")
+                        if proxy_verb:
+                            methods[verb.lower()] = getattr(fmr_methods, proxy_verb)
+                else:
+                    raise TypeError
+            else:
+                methods[verb.lower()] = endpoint
+
+    verbs: List = []
+
+    for verb, method in methods.items():
+        klass: Optional[Callable] = method.__dict__.get("view_class", None)
+        if not is_mv and klass and hasattr(klass, "verb"):
+            method = getattr(klass, "verb", None)
+        elif klass and hasattr(klass, "dispatch_request"):
+            method = getattr(klass, "dispatch_request", None)
+        if method is None:  # for MethodView
+            method = getattr(klass, verb, None)
+
+        if method is None:
+            if is_mv:  # #76 Empty MethodViews
+                continue
+            raise RuntimeError("Cannot detect view_func for rule {0}".format(rule))
+
+        verbs.append((verb, method))
+
+    return endpoint, verbs
+
+
+def doc_dir_swag_path(
+    method: Callable, endpoint: Callable, doc_dir: Optional[str]
+) -> Optional[str]:
+    """
+    Returns the file documenting method in doc_dir, if any
+    """
+    if not doc_dir:
+        return None
+    view_class: Optional[Callable] = getattr(endpoint, "view_class", None)
+    return get_swag_path_from_doc_dir(method, view_class, doc_dir, endpoint)
+
+
+_process_pools: Dict[int, ProcessPoolExecutor] = {}
+_process_pools_lock = threading.Lock()
+
+
+def process_pool(processes: int) -> ProcessPoolExecutor:
+    """
+    Pool of `processes` parsing YAML, created once and shared by every
+    extraction. Its processes are spawned rather than forked: by the time
+    specs are extracted this process runs threads (the warm-up thread,
+    the server's), and a forked child may inherit one of their locks held.
+    """
+    with _process_pools_lock:
+        pool: Optional[ProcessPoolExecutor] = _process_pools.get(processes)
+        if pool is None:
+            pool = ProcessPoolExecutor(
+                max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            _process_pools[processes] = pool
+        return pool
+
+
+def preload_docstrings(
+    resolved: List, doc_dir: Optional[str], workers: int, processes: int = 0
+) -> Dict[str, Any]:
+    """
+    Reads the swag documents of every resolved method in a thread pool,
+    then parses their YAML, in a process pool when `processes` is set,
+    for `parse_docstring` to read back
+
+    Failures are left for `parse_docstring` to raise in order.
+
+    :param resolved: list of (rule, view, [(verb, method)])
+    :type resolved: list
+
+    :param doc_dir: Directory containing docstrings
+    :type doc_dir: str
+
+    :param workers: threads reading files
+    :type workers: int
+
+    :param processes: processes parsing YAML, 0 to parse in this process
+    :type processes: int
+
+    :return: parsed documents by content
+    :rtype: Dict[str, Any]
+    """
+    tasks: List = [
+        (method, rule.endpoint, verb, endpoint)
+        for rule, endpoint, verbs in resolved
+        for verb, method in verbs
+    ]
+
+    def load(task: Tuple) -> Optional[Tuple[str, Optional[str]]]:
+        method, rule_endpoint, verb, endpoint = task
+        try:
+            full_doc, from_file, doc_path = load_docstring(
+                method,
+                endpoint=rule_endpoint,
+                verb=verb,
+                swag_path=doc_dir_swag_path(method, endpoint, doc_dir),
+            )
+        except Exception:
+            return None
+        content: Optional[str] = docstring_yaml(full_doc, from_file)
+        return None if content is None else (content, doc_path)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        contents: List = [content for content in pool.map(load, tasks) if content]
+
+    if processes:
+        pool: ProcessPoolExecutor = process_pool(processes)
+        try:
+            return preload_yaml(contents, pool)
+        except BrokenExecutor:
+            # a process died; the next extraction gets a new pool
+            with _process_pools_lock:
+                if _process_pools.get(processes) is pool:
+                    del _process_pools[processes]
+    return preload_yaml(contents)
+
+
 def get_specs(
     rules: Iterator[Rule],
     ignore_verbs: Set[str],
@@ -49,6 +221,8 @@ def get_specs(
     sanitizer: Callable,
     openapi_version: Union[str, int],
     doc_dir: Optional[str] = None,
+    workers: int = 0,
+    processes: int = 0,
 ):
     """
     Extracts specs from rules
@@ -70,57 +244,34 @@ def get_specs(
 
     :param doc_dir: Directory containing docstrings
     :type doc_dir: str
+
+    :param workers: threads reading docstrings and files ahead of the
+        extraction, which stays serial so its output is unchanged
+    :type workers: int
+
+    :param processes: processes parsing their YAML, with workers
+    :type processes: int
     """
     specs: List = []
+    resolved: List = [
+        (rule,) + resolve_view_methods(rule, ignore_verbs) for rule in rules
+    ]
 
-    for rule in rules:
-        endpoint: Callable = current_app.view_functions[rule.endpoint]
-        methods: Dict = {}
-        is_mv: bool = is_valid_method_view(endpoint)
-
-        if rule.methods:
-            for verb in rule.methods.difference(ignore_verbs):
-                if not is_mv and has_valid_dispatch_view_docs(endpoint):
-                    endpoint.methods = endpoint.methods or ["GET"]
-                    if verb in endpoint.methods:
-                        methods[verb.lower()] = endpoint
-                elif getattr(endpoint, "methods", None) is not None:
-                    if isinstance(endpoint.methods, set):
-                        if verb in endpoint.methods:
-                            verb = verb.lower()
-                            methods[verb] = getattr(endpoint.view_class, verb)
-                    elif fmr_methods is not None:  # flask-mongorest
-                        endpoint_methods: Set = set(m.method for m in endpoint.methods)
-                        if verb in endpoint_methods:
-                            proxy_verb = rule.endpoint.replace(endpoint.__name__, "")
-                            if proxy_verb:
-                                methods[verb.lower()] = getattr(fmr_methods, proxy_verb)
-                    else:
-                        raise TypeError
-                else:
-                    methods[verb.lower()] = endpoint
+    preloaded: Optional[Dict[str, Any]] = None
+    if workers > 1:
+        preloaded = preload_docstrings(resolved, doc_dir, workers, processes)
 
+    for rule, endpoint, methods in resolved:
         verbs: List = []
 
-        for verb, method in methods.items():
-            klass: Optional[Callable] = method.__dict__.get("view_class", None)
-            if not is_mv and klass and hasattr(klass, "verb"):
-                method = getattr(klass, "verb", None)
-            elif klass and hasattr(klass, "dispatch_request"):
-                method = getattr(klass, "dispatch_request", None)
-            if method is None:  # for MethodView
-                method = getattr(klass, verb, None)
-
-            if method is None:
-                if is_mv:  # #76 Empty MethodViews
-                    continue
-                raise RuntimeError("Cannot detect view_func for rule {0}".format(rule))
-
+        for verb, method in methods:
             swag: Dict = {}
             swag_def: Dict = {}
 
             swagged: bool = False
 
+            # marshmallow schemas get the 2.0 conversion whatever the
+            # version, as published specs always had
             if getattr(method, "specs_dict", None):
                 definition: Dict = {}
                 merge_specs(
@@ -154,18 +305,13 @@ def get_specs(
 
                 swagged = True
 
-            swag_path = None
-            if doc_dir:
-                swag_path = get_swag_path_from_doc_dir(
-                    method, view_class, doc_dir, endpoint
-                )
-
             doc_summary, doc_description, doc_swag = parse_docstring(
                 method,
                 sanitizer,
                 endpoint=rule.endpoint,
                 verb=verb,
-                swag_path=swag_path,
+                swag_path=doc_dir_swag_path(method, endpoint, doc_dir),
+                preloaded=preloaded,
             )
 
             if is_openapi3(openapi_version):
@@ -192,30 +338,166 @@ def get_specs(
     return specs
 
 
-def get_schema_specs(schema_id, swagger):
-    ignore_verbs = set(swagger.config.get("ignore_verbs", ("HEAD", "OPTIONS")))
+class RegistryEntry(NamedTuple):
+    name: str
+    schema: Dict
+    operation: Optional[Dict]
+    specs: Dict
 
-    # technically only responses is non-optional
-    optional_fields = swagger.config.get("optional_fields") or OPTIONAL_FIELDS
 
-    openapi_version = swagger.config.get("openapi")
+class SchemaRegistry(object):
+    """
+    Index of the schemas known to a Swagger instance by normalized id
 
-    with swagger.app.app_context():
-        specs = get_specs(
-            current_app.url_map.iter_rules(),
-            ignore_verbs,
-            optional_fields,
-            swagger.sanitizer,
-            openapi_version,
-        )
+    Built in one extraction pass, it holds the `id` schemas of docstring
+    parameters, the (marshmallow and docstring) definitions of each
+    operation and the `Swagger.definition` models, each with the operation
+    owning it and the specs to validate against. Ids of docstring
+    parameters win over definitions, and the first operation wins.
+    """
 
-        swags = (swag for _, verbs in specs for _, swag in verbs if swag is not None)
+    def __init__(self):
+        self._entries: Optional[Dict[str, RegistryEntry]] = None
+        # rule count of the app when built
+        self.rules: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def normalize(schema_id: str) -> str:
+        return schema_id.lower()
+
+    @property
+    def built(self) -> bool:
+        return self._entries is not None
+
+    def build(
+        self,
+        specs: List,
+        definition_models: Optional[Dict[str, Dict]] = None,
+        rules: Optional[int] = None,
+    ) -> None:
+        """
+        Indexes the output of `get_specs` and the definition models
+
+        :param specs: list of (rule, [(verb, swag)]) from `get_specs`
+        :type specs: list
+
+        :param definition_models: parsed `Swagger.definition` models by name
+        :type definition_models: Optional[dict]
+
+        :param rules: rule count of the app specs were extracted from
+        :type rules: Optional[int]
+
+        :return: None
+        """
+        entries: Dict[str, RegistryEntry] = {}
+        swags: List[Dict] = [swag for _, verbs in specs for _, swag in verbs if swag]
+
+        def add(name: str, schema: Dict, operation: Optional[Dict], specs: Dict):
+            key: str = self.normalize(name)
+            if key not in entries:
+                entries[key] = RegistryEntry(name, schema, operation, specs)
+
+        for swag in swags:
+            for param in swag.get("parameters", []):
+                schema: Any = param.get("schema") if isinstance(param, dict) else None
+                if isinstance(schema, dict) and schema.get("id") is not None:
+                    add(schema["id"], schema, swag, swag)
+
+        for swag in swags:
+            definitions: Dict = swag.get("definitions") or swag.get(
+                "components", {}
+            ).get("schemas", {})
+            for name, schema in definitions.items():
+                add(name, schema, swag, definitions_specs(definitions))
+
+        models: Dict[str, Dict] = definition_models or {}
+        for name, schema in models.items():
+            add(name, schema, None, definitions_specs(models))
+
+        self.rules = rules
+        self._entries = entries
+
+    def lookup(self, schema_id: str) -> Optional[RegistryEntry]:
+        """
+        Returns the entry for schema_id, if any
+
+        :param schema_id: schema id, compared case insensitively
+        :type schema_id: str
+
+        :return: registry entry
+        :rtype: Optional[RegistryEntry]
+        """
+        return (self._entries or {}).get(self.normalize(schema_id))
+
+    def invalidate(self) -> None:
+        """
+        Forgets every entry, the registry is built again on next use
+        """
+        self._entries = None
+
+
+def definitions_specs(definitions: Dict) -> Dict:
+    """
+    Specs holding definitions under both openapi 2 and 3 locations, so
+    references of either style resolve when validating against them
+    """
+    return {"definitions": definitions, "components": {"schemas": definitions}}
+
+
+def get_schema_registry(swagger) -> SchemaRegistry:
+    """
+    Returns the schema registry of swagger, building it if needed or
+    when rules were added to the app since
+
+    :param swagger: Swagger instance
+    :type swagger: flask_openapi.Swagger
+
+    :return: schema registry
+    :rtype: SchemaRegistry
+    """
+    registry: SchemaRegistry = swagger.schema_registry
+    if registry.built and registry.rules == swagger.rule_count():
+        return registry
+
+    with registry._lock:
+        rules: int = swagger.rule_count()
+        if registry.built and registry.rules == rules:
+            return registry
+
+        # prebuilt spec files stand for the rules, which aren't introspected
+        specs = swagger.static_specs() if swagger.static else swagger.extract_specs()
+
+        models: Dict[str, Dict] = {}
+        for definition in swagger.definition_models:
+            description, swag = parse_definition_docstring(
+                definition.obj, swagger.sanitizer
+            )
+            if definition.name and swag:
+                if description:
+                    swag["description"] = description
+                models[definition.name] = swag
 
-    for swag in swags:
-        for d in swag.get("parameters", []):
-            d_schema_id = d.get("schema", {}).get("id")
-            if d_schema_id is not None and d_schema_id.lower() == schema_id.lower():
-                return swag
+        registry.build(specs, models, rules)
+
+    return registry
+
+
+def get_schema_specs(schema_id, swagger):
+    """
+    Returns the specs to validate schema_id against, from the registry
+
+    :param schema_id: schema id, compared case insensitively
+    :type schema_id: str
+
+    :param swagger: Swagger instance
+    :type swagger: flask_openapi.Swagger
+
+    :return: specs holding the schema, None if it is unknown
+    :rtype: Optional[dict]
+    """
+    entry: Optional[RegistryEntry] = get_schema_registry(swagger).lookup(schema_id)
+    return entry.specs if entry is not None else None
 
 
 def apispec_to_template(app, spec, definitions=None, paths=None):
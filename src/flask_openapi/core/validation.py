@@ -1,74 +1,489 @@
 import copy
-import inspect
 import os
 import sys
-from typing import Any, Callable, Optional, Union, Dict, List
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+)
 
 import jsonschema
-import yaml
-from flask import abort, request, Response
+from flask import abort, has_request_context, request, Response
+from flask_openapi.core.codegen import CodegenValidator, precompiled_builder
 from flask_openapi.core.parser import parse_definitions, parse_schema
-from flask_openapi.utils.files import load_from_file
+from flask_openapi.core.resolver import SchemaResolver
+from flask_openapi.utils.cache import CacheInfo, LRUCache
+from flask_openapi.utils.files import file_signature, load_from_file, load_yaml
+from flask_openapi.utils.streams import iter_json_array, iter_ndjson
+
+VALIDATOR_CACHE_SIZE: int = 512
+NDJSON_MIMETYPE: str = "application/x-ndjson"
+
+# array keywords which need every item at once
+UNSTREAMABLE_KEYWORDS = frozenset(
+    [
+        "$ref",
+        "additionalItems",
+        "allOf",
+        "anyOf",
+        "const",
+        "contains",
+        "enum",
+        "not",
+        "oneOf",
+        "prefixItems",
+        "unevaluatedItems",
+        "uniqueItems",
+    ]
+)
+
+_validator_cache: LRUCache = LRUCache(maxsize=VALIDATOR_CACHE_SIZE)
+# compiled validators for schemas which are already resolved, by identity
+_schema_cache: LRUCache = LRUCache(maxsize=VALIDATOR_CACHE_SIZE)
+
+
+class BatchResult(NamedTuple):
+    """
+    Outcome of `validate_many`: the valid items, in order, and the
+    errors of the invalid ones by their index, most relevant first
+    """
 
+    accepted: List[Any]
+    errors: Dict[int, List[Exception]]
 
-def __replace_ref(schema: Dict, relative_path: str, swag: Dict) -> Dict:
+
+class CompiledSchema(object):
     """
-    Replace $ref in schema
+    A resolved schema together with the jsonschema validators built for it
 
-    :param schema: schema
-    :type schema: dict
+    Building a validator picks the validator class and checks the schema
+    against its metaschema, so this is done once per schema and format
+    checker and then reused for every piece of data validated. Schemas
+    precompiled by `flask generate-validators` use the generated code.
+    """
 
-    :param relative_path: relative path
-    :type relative_path: str
-
-    :param swag: swagger
-    :type swag: dict
-
-    :return: new value
-    :rtype: dict
-    """
-    absolute_path: str = os.path.dirname(sys.argv[0])
-    new_value: Dict = {}
-
-    for key, value in schema.items():
-        if isinstance(value, dict):
-            new_value[key] = __replace_ref(value, relative_path, swag)
-        elif key == "$ref":
-            if len(value) > 2 and value.startswith("#/"):  # $ref is local
-                content: Dict = swag
-                for id in value.split("/")[1:]:
-                    content = content[id]
-                return (
-                    __replace_ref(content, relative_path, swag)
-                    if isinstance(content, dict)
-                    else content
+    def __init__(self, schema: Dict):
+        self.schema = schema
+        self._validators: Dict[int, Tuple[Any, Any]] = {}
+        self._items: Optional["CompiledSchema"] = None
+
+    @property
+    def is_array(self) -> bool:
+        """
+        True for schemas of arrays of items
+        """
+        return isinstance(self.schema, dict) and self.schema.get("type") == "array"
+
+    def item_schema(self) -> "CompiledSchema":
+        """
+        Returns the schema streamed items are validated against: the
+        items of an array schema, the schema itself otherwise
+
+        :raise ValueError: when the array can't be validated item by item
+
+        :return: compiled item schema
+        :rtype: CompiledSchema
+        """
+        if not self.is_array:
+            return self
+
+        if self._items is None:
+            unstreamable = UNSTREAMABLE_KEYWORDS.intersection(self.schema)
+            items: Any = self.schema.get("items", {})
+            if unstreamable or not isinstance(items, dict):
+                raise ValueError(
+                    "Can't validate {0} item by item".format(
+                        sorted(unstreamable) or "tuple items"
+                    )
                 )
 
-            if len(value) > 0 and value[0] == "/":
-                file_ref_path: str = absolute_path + value
-            else:
-                file_ref_path = relative_path + "/" + value
+            # recursive references point into the root definitions
+            if "definitions" in self.schema:
+                items = dict(items)
+                items["definitions"] = dict(
+                    self.schema["definitions"], **items.get("definitions", {})
+                )
+            self._items = CompiledSchema(items)
+
+        return self._items
 
-            relative_path = os.path.dirname(file_ref_path)
+    def get_validator(self, format_checker: Optional[Any] = None) -> Any:
+        """
+        Returns the jsonschema validator for this schema
 
-            with open(file_ref_path) as file:
-                file_content: str = file.read()
-                comment_index: int = file_content.rfind("---")
+        :param format_checker: format checker handed to the validator
+        :type format_checker: Optional[jsonschema.FormatChecker]
 
-                if comment_index > 0:
-                    comment_index = comment_index + 3
+        :return: validator instance
+        :rtype: jsonschema.protocols.Validator
+        """
+        # keep a reference to the checker so its id can't be reused
+        cached: Optional[Tuple[Any, Any]] = self._validators.get(id(format_checker))
+
+        if cached is None:
+            builder: Optional[Callable] = precompiled_builder(self.schema)
+            if builder is not None:
+                validator: Any = CodegenValidator(
+                    self.schema, format_checker, builder=builder
+                )
+            else:
+                cls: Any = jsonschema.validators.validator_for(self.schema)
+                cls.check_schema(self.schema)
+                validator = cls(self.schema, format_checker=format_checker)
+            cached = (format_checker, validator)
+            self._validators[id(format_checker)] = cached
+
+        return cached[1]
+
+    def check(
+        self,
+        data: Any,
+        validation_function: Optional[Callable] = None,
+        format_checker: Optional[Any] = None,
+    ) -> None:
+        """
+        Validates data, raising on the first (best matching) error
+
+        :param data: data to validate
+        :type data: Any
+
+        :param validation_function: custom validation function which takes
+            the data and the schema, used instead of the compiled validator
+        :type validation_function: Optional[Callable]
+
+        :param format_checker: format checker for the compiled validator
+        :type format_checker: Optional[jsonschema.FormatChecker]
+
+        :return: None
+        """
+        if validation_function is not None:
+            validation_function(data, self.schema)
+            return
+
+        validator: Any = self.get_validator(format_checker)
+        error = jsonschema.exceptions.best_match(validator.iter_errors(data))
+
+        if error is not None:
+            raise error
+
+    def check_many(
+        self,
+        items: Iterable[Any],
+        validation_function: Optional[Callable] = None,
+        format_checker: Optional[Any] = None,
+    ) -> BatchResult:
+        """
+        Validates every item, collecting errors instead of raising
+
+        :param items: items to validate
+        :type items: Iterable[Any]
+
+        :param validation_function: custom validation function, see `check`;
+            the exception it raises is the only error of an item
+        :type validation_function: Optional[Callable]
+
+        :param format_checker: format checker for the compiled validator
+        :type format_checker: Optional[jsonschema.FormatChecker]
+
+        :return: accepted items and errors by index
+        :rtype: BatchResult
+        """
+        result: BatchResult = BatchResult([], {})
+
+        if validation_function is not None:
+            for index, item in enumerate(items):
+                try:
+                    validation_function(item, self.schema)
+                except Exception as err:
+                    result.errors[index] = [err]
                 else:
-                    comment_index = 0
+                    result.accepted.append(item)
+            return result
+
+        validator: Any = self.get_validator(format_checker)
+        is_valid: Callable[[Any], bool] = validator.is_valid
+
+        for index, item in enumerate(items):
+            if is_valid(item):
+                result.accepted.append(item)
+                continue
+
+            errors: List[Exception] = sorted(
+                validator.iter_errors(item),
+                key=jsonschema.exceptions.relevance,
+                reverse=True,
+            )
+            if errors:
+                result.errors[index] = errors
+            else:
+                result.accepted.append(item)
+
+        return result
+
+
+def compile_schema(
+    schema_id: Optional[str] = None,
+    filepath: Optional[str] = None,
+    specs: Optional[Dict] = None,
+    openapi_version: Optional[Union[str, int]] = None,
+) -> CompiledSchema:
+    """
+    Extracts the schema identified by schema_id from a YAML file or specs,
+    inlines its references and wraps it in a CompiledSchema
+
+    :param schema_id: The definition id to use to validate (from specs)
+    :type schema_id: Optional[str]
+
+    :param filepath: absolute path of the definition file
+    :type filepath: Optional[str]
+
+    :param specs: definitions dict used when filepath is not given
+    :type specs: Optional[dict]
+
+    :param openapi_version: openapi version to use
+    :type openapi_version: Optional[str]
+
+    :return: compiled schema
+    :rtype: CompiledSchema
+    """
+    if has_request_context() and request.endpoint:
+        endpoint: str = request.endpoint.lower().replace(".", "_")
+        verb: str = request.method.lower()
+    else:
+        endpoint, verb = "validate", "post"
+
+    if filepath:
+        full_doc: str = load_from_file(filepath)
+        yaml_start: int = full_doc.find("---")
+        swag: Dict = load_yaml(
+            full_doc[yaml_start if yaml_start >= 0 else 0 :], filepath
+        )
+        relative_path: str = os.path.dirname(filepath)
+    else:
+        swag = copy.deepcopy(specs or {})
+        relative_path = os.path.dirname(sys.argv[0])
 
-                content = yaml.safe_load((file_content[comment_index:]))
-                new_value = content
+    params: List = [item for item in swag.get("parameters", []) if item.get("schema")]
+    definitions: Dict = {}
+    main_def: Dict = {}
+    raw_definitions: List[dict] = parse_definitions(
+        params, endpoint=endpoint, verb=verb, openapi_version=openapi_version
+    )
 
-                if isinstance(content, dict):
-                    new_value = __replace_ref(content, relative_path, swag)
+    if schema_id is None:
+        for param in params:
+            if param.get("in") == "body":
+                schema_id = param.get("schema", {}).get("$ref")
+                if schema_id:
+                    schema_id = schema_id.split("/")[-1]
+                    break  # consider only the first
+
+    if schema_id is None:
+        # if it is still none use first raw_definition extracted
+        if raw_definitions:
+            schema_id = raw_definitions[0].get("id")
+
+    for defi in raw_definitions:
+        if defi["id"].lower() == schema_id.lower():  # type: ignore
+            main_def = defi.copy()
         else:
-            new_value[key] = value
+            definitions[defi["id"]] = defi
 
-    return new_value
+    # support definitions informed in dict, ids compared case insensitively
+    schemas: Dict = parse_schema(swag)
+    if schema_id in schemas:
+        main_def = schemas[schema_id]
+    elif schema_id is not None:
+        for name, schema in schemas.items():
+            if isinstance(name, str) and name.lower() == schema_id.lower():
+                main_def = schema
+                break
+
+    # Doensn't need to alter 'definitions' according to open api
+    # Since it main_def exists only in this function
+    main_def["definitions"] = definitions
+
+    for _, value in definitions.items():
+        if "id" in value:
+            del value["id"]
+
+    return CompiledSchema(SchemaResolver(swag, relative_path).resolve(main_def))
+
+
+def get_compiled_schema(
+    schema_id: Optional[str] = None,
+    filepath: Optional[str] = None,
+    specs: Optional[Dict] = None,
+    openapi_version: Optional[Union[str, int]] = None,
+) -> CompiledSchema:
+    """
+    Cached version of `compile_schema`
+
+    Entries are keyed by the spec source (the file path and its mtime and
+    size, or the identity of the specs dict), the schema id and the openapi
+    version. A specs dict mutated after its first use needs
+    `clear_validator_cache`.
+
+    :return: compiled schema
+    :rtype: CompiledSchema
+    """
+    source: Hashable = ("specs", id(specs))
+
+    if filepath:
+        try:
+            source = ("file", filepath, file_signature(filepath))
+        except OSError:
+            source = ("file", filepath, None)
+
+    key: Tuple = (source, schema_id, str(openapi_version))
+    cached: Optional[Tuple[Any, CompiledSchema]] = _validator_cache.get(key)
+
+    # the specs dict is stored with the entry so its id stays unique
+    if cached is None or (not filepath and cached[0] is not specs):
+        compiled: CompiledSchema = compile_schema(
+            schema_id, filepath=filepath, specs=specs, openapi_version=openapi_version
+        )
+        cached = (None if filepath else specs, compiled)
+        _validator_cache.set(key, cached)
+
+    return cached[1]
+
+
+def compiled_schema_for(schema: Dict) -> CompiledSchema:
+    """
+    Returns a CompiledSchema wrapping an already resolved schema
+
+    Lookups are by identity, so schemas which are built once and reused
+    (the compiled and parsed request schemas) share a single validator.
+
+    :param schema: resolved schema
+    :type schema: dict
+
+    :return: compiled schema
+    :rtype: CompiledSchema
+    """
+    cached: Optional[CompiledSchema] = _schema_cache.get(id(schema))
+
+    # the compiled schema keeps the schema alive, so its id stays unique
+    if cached is None or cached.schema is not schema:
+        cached = CompiledSchema(schema)
+        _schema_cache.set(id(schema), cached)
+
+    return cached
+
+
+def validator_cache_info() -> CacheInfo:
+    """
+    Returns hits, misses, maxsize and current size of the validator cache
+    """
+    return _validator_cache.cache_info()
+
+
+def clear_validator_cache() -> None:
+    """
+    Drops every compiled validator, forcing them to be rebuilt
+    """
+    _validator_cache.cache_clear()
+    _schema_cache.cache_clear()
+
+
+def _load_data(data: Optional[Any], require_data: bool) -> Any:
+    if data is None:
+        data = request.json  # defaults
+    elif callable(data):
+        data = data()
+
+    if not data and require_data:
+        abort(Response("No data to validate", status=400))
+
+    return data
+
+
+def _handle_error(
+    err: Exception,
+    data: Any,
+    schema: Any,
+    validation_error_handler: Optional[Callable],
+) -> None:
+    if validation_error_handler is not None:
+        validation_error_handler(err, data, schema)
+    else:
+        abort(Response("Fatal error", status=400))
+
+
+def _check_data(
+    compiled: CompiledSchema,
+    data: Any,
+    validation_function: Optional[Callable],
+    validation_error_handler: Optional[Callable],
+    format_checker: Optional[Any] = None,
+) -> None:
+    try:
+        compiled.check(data, validation_function, format_checker)
+    except Exception as err:
+        _handle_error(err, data, compiled.schema, validation_error_handler)
+
+
+def _final_filepath(filepath: str, root: Optional[str], caller: str) -> str:
+    if not root:
+        root = os.path.dirname(os.path.abspath(caller))
+    else:
+        root = os.path.dirname(root)
+
+    if not filepath.startswith("/"):
+        return os.path.join(root, filepath)
+
+    return filepath
+
+
+def validate_compiled(
+    compiled: CompiledSchema,
+    data: Optional[Any] = None,
+    validation_function: Optional[Callable] = None,
+    validation_error_handler: Optional[Callable] = None,
+    require_data: bool = True,
+    format_checker: Optional[Any] = None,
+) -> None:
+    """
+    Same as `validate` for a schema compiled beforehand, so only the data
+    is looked at per call
+
+    :param compiled: schema to validate against
+    :type compiled: CompiledSchema
+
+    :param data: data to validate, by default is request.json
+    :type data: Optional[Any]
+
+    :param validation_function: custom validation function, see `validate`
+    :type validation_function: Optional[Callable]
+
+    :param validation_error_handler: custom error handler, see `validate`
+    :type validation_error_handler: Optional[Callable]
+
+    :param require_data: is the data param required?
+    :type require_data: bool
+
+    :param format_checker: format checker for the compiled validator
+    :type format_checker: Optional[jsonschema.FormatChecker]
+
+    :return: None
+    """
+    _check_data(
+        compiled,
+        _load_data(data, require_data),
+        validation_function,
+        validation_error_handler,
+        format_checker,
+    )
 
 
 def validate(
@@ -87,6 +502,9 @@ def validate(
     This method is available to use YAML swagger definitions file
     or specs (dict or object) to validate data against its jsonschema.
 
+    The schema is prepared and compiled on first use and then served from
+    a cache, see `validator_cache_info` and `clear_validator_cache`.
+
     example:
         validate({"item": 1}, 'item_schema', 'defs.yml', root=__file__)
         validate(request.json, 'User', specs={'definitions': {'User': ...}})
@@ -137,93 +555,219 @@ def validate(
     if filepath is None and specs is None:
         abort(Response("Filepath or specs is needed to validate", status=500))
 
-    if data is None:
-        data = request.json  # defaults
-    elif callable(data):
-        data = data()
+    data = _load_data(data, require_data)
+    final_filepath: Optional[str] = None
 
-    if not data and require_data:
-        abort(Response("No data to validate", status=400))
+    if filepath:
+        # the caller's file, without the cost of inspect.stack()
+        final_filepath = _final_filepath(
+            filepath, root, sys._getframe(1).f_code.co_filename
+        )
+
+    compiled: CompiledSchema = get_compiled_schema(
+        schema_id,
+        filepath=final_filepath,
+        specs=specs,
+        openapi_version=openapi_version,
+    )
 
-    # not used anymore but kept to reuse with marshmallow
-    endpoint: str = (request.endpoint or "").lower().replace(".", "_")
-    verb: str = request.method.lower()
+    _check_data(compiled, data, validation_function, validation_error_handler)
 
-    if filepath:
-        if not root:
-            try:
-                frame_info: inspect.FrameInfo = inspect.stack()[1]
-                root = os.path.dirname(os.path.abspath(frame_info[1]))
-            except Exception:
-                root = None
-        else:
-            root = os.path.dirname(root)
 
-        if not filepath.startswith("/"):
-            final_filepath: str = os.path.join(root, filepath)  # type: ignore
-        else:
-            final_filepath = filepath
+def validate_many(
+    items: Iterable[Any],
+    schema_id: Optional[str] = None,
+    filepath: Optional[str] = None,
+    root: Optional[str] = None,
+    definition: Optional[str] = None,
+    specs: Optional[Dict] = None,
+    validation_function: Optional[Callable] = None,
+    openapi_version: Optional[Union[str, int]] = None,
+    format_checker: Optional[Any] = None,
+) -> BatchResult:
+    """
+    Validates a batch of records against one schema, prepared once for
+    the whole batch. Invalid records don't stop the others from being
+    checked, their errors are returned by index instead.
 
-        full_doc: str = load_from_file(final_filepath)
-        yaml_start: int = full_doc.find("---")
-        swag: Dict = yaml.safe_load(full_doc[yaml_start if yaml_start >= 0 else 0 :])
-    else:
-        swag = copy.deepcopy(specs or {})
+    example:
+        result = validate_many(records, 'User', 'defs.yml', root=__file__)
+        db.insert_many(result.accepted)
+        for index, errors in result.errors.items():
+            log.warning("record %s: %s", index, errors[0].message)
 
-    params: List = [item for item in swag.get("parameters", []) if item.get("schema")]
-    definitions: Dict = {}
-    main_def: Dict = {}
-    raw_definitions: List[dict] = parse_definitions(
-        params, endpoint=endpoint, verb=verb, openapi_version=openapi_version
+    Parameters are the same as `validate`, plus:
+
+    :param items: records to validate
+    :type items: Iterable[Any]
+
+    :param format_checker: format checker for the compiled validator
+    :type format_checker: Optional[jsonschema.FormatChecker]
+
+    :return: accepted items and errors by index
+    :rtype: BatchResult
+    """
+    if filepath is None and specs is None:
+        abort(Response("Filepath or specs is needed to validate", status=500))
+
+    final_filepath: Optional[str] = None
+    if filepath:
+        final_filepath = _final_filepath(
+            filepath, root, sys._getframe(1).f_code.co_filename
+        )
+
+    compiled: CompiledSchema = get_compiled_schema(
+        schema_id or definition,
+        filepath=final_filepath,
+        specs=specs,
+        openapi_version=openapi_version,
     )
 
-    if schema_id is None:
-        for param in params:
-            if param.get("in") == "body":
-                schema_id = param.get("schema", {}).get("$ref")
-                if schema_id:
-                    schema_id = schema_id.split("/")[-1]
-                    break  # consider only the first
+    return compiled.check_many(items, validation_function, format_checker)
 
-    if schema_id is None:
-        # if it is still none use first raw_definition extracted
-        if raw_definitions:
-            schema_id = raw_definitions[0].get("id")
 
-    for defi in raw_definitions:
-        if defi["id"].lower() == schema_id.lower():  # type: ignore
-            main_def = defi.copy()
-        else:
-            definitions[defi["id"]] = defi
+def iter_validated(
+    compiled: CompiledSchema,
+    stream: Optional[BinaryIO] = None,
+    ndjson: Optional[bool] = None,
+    validation_function: Optional[Callable] = None,
+    validation_error_handler: Optional[Callable] = None,
+    format_checker: Optional[Any] = None,
+) -> Iterator[Any]:
+    """
+    Parses a JSON array or NDJSON body item by item, validating each
+    item as it is read, so memory use doesn't grow with the body
 
-    # support definitions informed in dict
-    if schema_id in parse_schema(swag):
-        main_def = parse_schema(swag).get(schema_id)  # type: ignore
+    Items are yielded once they are valid. Errors go through the
+    validation_error_handler (with the item as data and its index
+    prepended to the error path) or abort with 400, so items before
+    the failing one have already been handed out.
 
-    # Doensn't need to alter 'definitions' according to open api
-    # Since it main_def exists only in this function
-    main_def["definitions"] = definitions
+    :param compiled: schema of the whole array or, for NDJSON, of each item
+    :type compiled: CompiledSchema
 
-    for _, value in definitions.items():
-        if "id" in value:
-            del value["id"]
+    :param stream: binary stream of the body, by default request.stream
+    :type stream: Optional[BinaryIO]
 
-    if validation_function is None:
-        validation_function = jsonschema.validate
+    :param ndjson: one JSON document per line? by default guessed from
+        the request mimetype
+    :type ndjson: Optional[bool]
 
-    absolute_path: str = os.path.dirname(sys.argv[0])
+    :param validation_function: custom validation function, see `validate`
+    :type validation_function: Optional[Callable]
 
-    if filepath is None:
-        relative_path = absolute_path
-    else:
-        relative_path = os.path.dirname(filepath)
+    :param validation_error_handler: custom error handler, see `validate`
+    :type validation_error_handler: Optional[Callable]
 
-    main_def = __replace_ref(main_def, relative_path, swag)
+    :param format_checker: format checker for the compiled validator
+    :type format_checker: Optional[jsonschema.FormatChecker]
 
-    try:
-        validation_function(data, main_def)
-    except Exception as err:
-        if validation_error_handler is not None:
-            validation_error_handler(err, data, main_def)
+    :return: iterator of valid items
+    :rtype: Iterator[Any]
+    """
+    if ndjson is None:
+        ndjson = request.mimetype == NDJSON_MIMETYPE
+    if stream is None:
+        stream = request.stream
+
+    if not ndjson and not compiled.is_array:
+        raise ValueError("Streaming a JSON body needs an array schema")
+
+    items: CompiledSchema = compiled.item_schema()
+    schema: Dict = compiled.schema if compiled.is_array else {}
+    max_items: Optional[int] = schema.get("maxItems")
+    parsed: Iterator[Any] = iter_ndjson(stream) if ndjson else iter_json_array(stream)
+    count: int = 0
+
+    while True:
+        try:
+            item: Any = next(parsed)
+        except StopIteration:
+            break
+        except ValueError as err:
+            # handlers expect a ValidationError, with its message
+            error = jsonschema.ValidationError(
+                "Malformed JSON body: {0}".format(err), cause=err
+            )
+            _handle_error(error, None, compiled.schema, validation_error_handler)
+            return
+
+        try:
+            items.check(item, validation_function, format_checker)
+            if max_items is not None and count >= max_items:
+                raise jsonschema.ValidationError(
+                    "Expected at most {0} items".format(max_items),
+                    validator="maxItems",
+                    validator_value=max_items,
+                    schema=schema,
+                )
+        except Exception as err:
+            if isinstance(err, jsonschema.ValidationError):
+                err.path.appendleft(count)
+            _handle_error(err, item, items.schema, validation_error_handler)
         else:
-            abort(Response("Fatal error", status=400))
+            yield item
+        count += 1
+
+    if count < schema.get("minItems", 0):
+        err = jsonschema.ValidationError(
+            "Expected at least {0} items".format(schema["minItems"]),
+            validator="minItems",
+            validator_value=schema["minItems"],
+            schema=schema,
+        )
+        _handle_error(err, None, compiled.schema, validation_error_handler)
+
+
+def validate_stream(
+    schema_id: Optional[str] = None,
+    filepath: Optional[str] = None,
+    root: Optional[str] = None,
+    definition: Optional[str] = None,
+    specs: Optional[Dict] = None,
+    validation_function: Optional[Callable] = None,
+    validation_error_handler: Optional[Callable] = None,
+    openapi_version: Optional[Union[str, int]] = None,
+    ndjson: Optional[bool] = None,
+) -> Iterator[Any]:
+    """
+    Streaming counterpart of `validate` for bulk request bodies: a JSON
+    array, validated against the `items` of an array schema, or NDJSON
+    (`application/x-ndjson`), each line validated against the schema or
+    its `items`. Nothing is read until the returned iterator is used.
+
+    example:
+        for pet in validate_stream('Pets', 'defs.yml', root=__file__):
+            db.insert(pet)
+
+    Parameters are the same as `validate`, plus:
+
+    :param ndjson: one JSON document per line? by default guessed from
+        the request mimetype
+    :type ndjson: Optional[bool]
+
+    :return: iterator of valid items
+    :rtype: Iterator[Any]
+    """
+    if filepath is None and specs is None:
+        abort(Response("Filepath or specs is needed to validate", status=500))
+
+    final_filepath: Optional[str] = None
+    if filepath:
+        final_filepath = _final_filepath(
+            filepath, root, sys._getframe(1).f_code.co_filename
+        )
+
+    compiled: CompiledSchema = get_compiled_schema(
+        schema_id or definition,
+        filepath=final_filepath,
+        specs=specs,
+        openapi_version=openapi_version,
+    )
+
+    return iter_validated(
+        compiled,
+        ndjson=ndjson,
+        validation_function=validation_function,
+        validation_error_handler=validation_error_handler,
+    )
@@ -1,11 +1,25 @@
+import gzip
+import hashlib
 import json
-from typing import Optional
+from typing import Dict, NamedTuple, Optional
 
 from flask import jsonify, render_template, request, Response, url_for
 from flask.views import MethodView
 from flask_openapi import __version__
+from flask_openapi.utils.cache import LRUCache
 from werkzeug.datastructures import Authorization
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# serialized specs by spec identity, a rebuilt spec is a new dict
+SERIALIZED_SPECS_CACHE_SIZE = 32
+# brotli's default quality, 11, takes seconds on multi-megabyte specs
+BROTLI_QUALITY = 5
+_serialized_specs = LRUCache(maxsize=SERIALIZED_SPECS_CACHE_SIZE)
+
 
 class APIDocsView(MethodView):
     """
@@ -110,6 +124,56 @@ class OAuthRedirect(MethodView):
         )
 
 
+class SerializedSpec(NamedTuple):
+    """
+    JSON bytes of a spec, with their compressed variants by encoding
+    """
+
+    spec: Dict
+    etag: str
+    encodings: Dict[str, bytes]
+
+
+def serialize_spec(spec: Dict) -> SerializedSpec:
+    """
+    Serializes a spec once and compresses it with gzip and, when
+    installed, brotli; variants which aren't smaller are left out
+
+    :param spec: spec as returned by `Swagger.get_apispecs`
+    :type spec: dict
+
+    :return: serialized spec
+    :rtype: SerializedSpec
+    """
+    try:
+        body: bytes = jsonify(spec).get_data()
+    except Exception:
+        body = json.dumps(spec).encode("utf-8")
+
+    encodings: Dict[str, bytes] = {"identity": body}
+    compressed: Dict[str, bytes] = {"gzip": gzip.compress(body, mtime=0)}
+    if brotli is not None:
+        compressed["br"] = brotli.compress(body, quality=BROTLI_QUALITY)
+
+    for encoding, data in compressed.items():
+        if len(data) < len(body):
+            encodings[encoding] = data
+
+    return SerializedSpec(spec, hashlib.sha256(body).hexdigest(), encodings)
+
+
+def get_serialized_spec(spec: Dict) -> SerializedSpec:
+    """
+    Returns the serialized spec, cached until the spec is rebuilt
+    """
+    serialized: Optional[SerializedSpec] = _serialized_specs.get(id(spec))
+    # ids get reused once a spec is garbage collected
+    if serialized is None or serialized.spec is not spec:
+        serialized = serialize_spec(spec)
+        _serialized_specs.set(id(spec), serialized)
+    return serialized
+
+
 class APISpecsView(MethodView):
     """
     The /apispec_1.json and other specs
@@ -117,14 +181,39 @@ class APISpecsView(MethodView):
 
     def __init__(self, *args, **kwargs):
         self.loader = kwargs.pop("loader")
+        self.cache_control = kwargs.pop("cache_control", "no-cache")
         super(APISpecsView, self).__init__(*args, **kwargs)
 
     def get(self):
         """
         The Swagger view get method outputs to /apispecs_1.json
+
+        Serves the cached bytes in the best encoding accepted, with an ETag
+        per encoding so `If-None-Match` requests get a 304.
         """
-        try:
-            return jsonify(self.loader())
-        except Exception:
-            specs = json.dumps(self.loader())
-            return Response(specs, mimetype="application/json")
+        serialized: SerializedSpec = get_serialized_spec(self.loader())
+
+        encoding: str = "identity"
+        for candidate in ("br", "gzip"):
+            if (
+                candidate in serialized.encodings
+                and request.accept_encodings[candidate]
+            ):
+                encoding = candidate
+                break
+
+        response: Response = Response(
+            serialized.encodings[encoding], mimetype="application/json"
+        )
+        if encoding != "identity":
+            response.content_encoding = encoding
+        response.vary.add("Accept-Encoding")
+        response.set_etag(
+            serialized.etag
+            if encoding == "identity"
+            else "{0}-{1}".format(serialized.etag, encoding)
+        )
+        if self.cache_control:
+            response.headers["Cache-Control"] = self.cache_control
+
+        return response.make_conditional(request)
@@ -6,17 +6,21 @@ If a swagger yaml description is found in the docstrings for an endpoint
 we add the endpoint to swagger specification output
 
 """
-import codecs
+import gc
 import json
 import logging
 import os
 import re
+import threading
 from collections import defaultdict
+from copy import deepcopy
 from functools import partial, wraps
-from typing import Dict, List
+from itertools import islice
+from typing import Dict, List, NamedTuple
 
-import yaml
-from flask import abort, Blueprint, current_app, redirect, request, url_for
+from flask import abort, Blueprint, current_app, redirect, request, Response, url_for
+from flask_openapi.core.codegen import load_precompiled
+from flask_openapi.core.commands import iter_validation_compilers
 from flask_openapi.core.decorators import swag_annotation
 from flask_openapi.core.parser import (
     convert_responses_to_openapi3,
@@ -25,16 +29,34 @@ from flask_openapi.core.parser import (
     parse_imports,
     parse_schema,
 )
-from flask_openapi.core.specs import get_schema_specs, get_specs
-from flask_openapi.core.validation import validate
-from flask_openapi.core.views import APIDocsView, APISpecsView, OAuthRedirect
+from flask_openapi.core.request_parser import ParserMap
+from flask_openapi.core.spec_cache import (
+    load_cached_spec,
+    save_cached_spec,
+    spec_fingerprint,
+)
+from flask_openapi.core.specs import (
+    definitions_specs,
+    get_schema_registry,
+    get_specs,
+    SchemaRegistry,
+)
+from flask_openapi.core.validation import (
+    compiled_schema_for,
+    get_compiled_schema,
+    validate_compiled,
+)
+from flask_openapi.core.views import (
+    APIDocsView,
+    APISpecsView,
+    get_serialized_spec,
+    OAuthRedirect,
+)
+from flask_openapi.utils.cache import SingleFlight
+from flask_openapi.utils.files import load_yaml, read_file, recording_reads
 from flask_openapi.utils.sanitizers import BR_SANITIZER
 from flask_openapi.utils.version import is_openapi3
 
-try:
-    from flask_restful.reqparse import RequestParser
-except ImportError:
-    RequestParser = None
 import jsonschema
 from flask_openapi.utils.constants import (
     OAS3_SUB_COMPONENTS,
@@ -42,6 +64,16 @@ from flask_openapi.utils.constants import (
     OPTIONAL_OAS3_FIELDS,
 )
 from flask_openapi.utils.views import get_vendor_extension_fields
+from werkzeug.exceptions import HTTPException
+
+
+class RequestOperation(NamedTuple):
+    """
+    Parsers and schemas of a documented operation, used with `parse=True`
+    """
+
+    parsers: Dict
+    schemas: Dict
 
 
 class SwaggerDefinition(object):
@@ -81,6 +113,12 @@ class Swagger(object):
         "body": "json",
         "path": "path",
     }
+    OAS3_PARAMETER_LOCATIONS = {
+        "query": "args",
+        "header": "headers",
+        "path": "path",
+        "cookie": "cookies",
+    }
 
     def _init_config(self, config, merge):
         """Initializes self.config. If merge is set to true, then
@@ -122,20 +160,29 @@ class Swagger(object):
         self.format_checker = format_checker or jsonschema.FormatChecker()
 
         def default_validation_function(data, schema):
-            return jsonschema.validate(
-                data,
-                schema,
-                format_checker=self.format_checker,
-            )
+            return compiled_schema_for(schema).check(data, format_checker=self.format_checker)
 
         def default_error_handler(e, _, __):
             return abort(400, e.message)
 
+        self.default_validation_function = default_validation_function
         self.validation_function = validation_function or default_validation_function
 
         self.validation_error_handler = validation_error_handler or default_error_handler
         self.apispecs = {}  # cached apispecs
+        self.single_flight = SingleFlight()  # builds of apispecs and parse caches
+        self.rule_specs = {}  # id(rule): (rule, verbs from get_specs), shared by apispecs
+        self.built_rules = None  # rule count apispecs were built for
+        self.rule_generation = 0  # calls to the app's `add_url_rule`, see `rule_count`
+        self.counted_rules = (None, 0)  # (rule_generation, rule count)
+        self.extracted_apispecs = set()  # endpoints built from rule_specs, extended with new rules
+        self.source_files = set()  # files read extracting and building specs, for the disk cache
+        self.schema_registry = SchemaRegistry()
         self.parse = parse
+        self.ready = threading.Event()  # set once warmed up, see `warm_up`
+        self.warm_up_errors = []
+        self.warm_up_thread = None
+        self._warm_up_lock = threading.Lock()
         if app:
             self.init_app(app)
 
@@ -146,7 +193,17 @@ class Swagger(object):
         global auth
         self.decorators = decorators or self.decorators
         self.app = app
-        self.app.add_url_rule = swag_annotation(self.app.add_url_rule)
+        add_url_rule = swag_annotation(self.app.add_url_rule)
+
+        # blueprints and `app.route` register their rules through it too
+        @wraps(add_url_rule)
+        def counted_add_url_rule(*args, **kwargs):
+            try:
+                return add_url_rule(*args, **kwargs)
+            finally:
+                self.rule_generation += 1
+
+        self.app.add_url_rule = counted_add_url_rule
 
         self.load_config(app)
         # self.load_apispec(app)
@@ -155,40 +212,49 @@ class Swagger(object):
         self.register_views(app)
         self.add_headers(app)
 
+        # module written by `flask generate-validators`
+        if self.config.get("precompiled_validators"):
+            load_precompiled(self.config["precompiled_validators"])
+
         if self.parse:
-            if RequestParser is None:
-                raise RuntimeError("Please install flask_restful")
-            self.parsers = {}
-            self.schemas = {}
+            self.operation_index = None
+            self.indexed_rules = None
             self.parse_request(app)
 
         self._configured = True
         app.swag = self
 
+        # build specs before the first request, for apps whose routes are
+        # registered by now (factory pattern) or, in background, once they
+        # are: on first request, a health check say, or on `start_warm_up()`
+        warm_up = self.config.get("warm_up")
+        if warm_up == "background":
+
+            @app.before_request
+            def start_background_warm_up():  # noqa
+                if self.warm_up_thread is None:
+                    self.start_warm_up()
+
+        elif warm_up:
+            errors = self.warm_up()
+            if errors:
+                raise errors[0]
+        else:
+            self.ready.set()
+
     def load_swagger_file(self, filename):
         if not filename.startswith("/"):
             filename = os.path.join(self.app.root_path, filename)
 
-        if filename.endswith(".json"):
-            loader = json.load
-        elif filename.endswith(".yml") or filename.endswith(".yaml"):
+        contents = read_file(filename)
 
-            def loader(stream):  # type: ignore
-                return yaml.safe_load(parse_imports(stream.read(), filename))
-
-        else:
-            with codecs.open(filename, "r", "utf-8") as f:
-                contents = f.read()
-                contents = contents.strip()
-                if contents[0] in ["{", "["]:
-                    loader = json.load
-                else:
-
-                    def loader(stream):  # type: ignore
-                        return yaml.safe_load(parse_imports(stream.read(), filename))
+        if filename.endswith(".json"):
+            return json.loads(contents)
+        elif not (filename.endswith(".yml") or filename.endswith(".yaml")):
+            if contents.strip()[0] in ["{", "["]:
+                return json.loads(contents)
 
-        with codecs.open(filename, "r", "utf-8") as f:
-            return loader(f)
+        return load_yaml(parse_imports(contents, filename), filename)
 
     @property
     def configured(self):
@@ -212,10 +278,308 @@ class Swagger(object):
         model_filter = definition_filter or (lambda tag: True)
         return {definition.name: definition.obj for definition in self.definition_models if model_filter(definition)}
 
+    def rule_count(self):
+        """
+        Number of rules of the app, which only grows, counted again only
+        once `add_url_rule` was called since
+        """
+        generation = self.rule_generation
+        counted = self.counted_rules
+        if counted[0] != generation:
+            counted = self.counted_rules = (generation, len(list(self.app.url_map.iter_rules())))
+        return counted[1]
+
+    def specs_outdated(self):
+        """
+        Tells if rules were added to the app since apispecs were built
+        """
+        return self.built_rules != self.rule_count()
+
+    def extract_specs(self, rules=None):
+        """
+        Runs `get_specs` over rules, once for all spec endpoints and the
+        schema registry: each rule is extracted the first time one of
+        them asks for it, so rules no `rule_filter` selects never are.
+        Debug apps extract each time.
+
+        The result is shared: callers which modify it work on a copy.
+
+        :param rules: rules to extract, all those of the app by default
+
+        :return: list of (rule, [(verb, swag)])
+        """
+        if rules is None:
+            rules = list(self.app.url_map.iter_rules())
+        if self.app.debug:
+            return self.get_rule_specs(rules)
+
+        extracted = self.rule_specs
+        missing = [rule for rule in rules if extracted.get(id(rule), (None,))[0] is not rule]
+        while missing:
+            # concurrent callers wait for the running extraction, then run theirs
+            self.single_flight.do("rule_specs", partial(self.add_rule_specs, missing))
+            missing = [rule for rule in rules if extracted.get(id(rule), (None,))[0] is not rule]
+
+        return [(rule, extracted[id(rule)][1]) for rule in rules if extracted[id(rule)][1]]
+
+    def add_rule_specs(self, rules):
+        """
+        Extracts rules into `rule_specs`, see `extract_specs`
+        """
+        with recording_reads() as paths:
+            found = {id(rule): verbs for rule, verbs in self.get_rule_specs(rules)}
+        self.source_files |= paths
+        for rule in rules:
+            self.rule_specs[id(rule)] = (rule, found.get(id(rule), []))
+        # the registry indexes every rule
+        self.schema_registry.invalidate()
+
+    def extend_apispecs(self):
+        """
+        Extracts the rules registered since apispecs were built, blueprints
+        included, and merges them into those built from the rules; the
+        others, loaded from files, are dropped to be loaded again
+
+        Merged apispecs are copies, responses being served from the
+        previous ones meanwhile.
+        """
+        count = self.built_rules
+        rules = list(islice(self.app.url_map.iter_rules(), count, None))
+
+        apispecs = {}
+        for spec in self.config["specs"]:
+            endpoint = spec["endpoint"]
+            if endpoint not in self.extracted_apispecs or endpoint not in self.apispecs:
+                continue
+
+            selected = list(filter(spec.get("rule_filter") or (lambda rule: True), rules))
+            endpoint_specs = [(rule, deepcopy(verbs)) for rule, verbs in self.extract_specs(selected)]
+            data = self.apispecs[endpoint]
+            if endpoint_specs:
+                data = deepcopy(data)
+                self.merge_rule_specs(data, endpoint_specs, parse_schema(data))
+            apispecs[endpoint] = data
+
+        self.apispecs = apispecs
+        self.extracted_apispecs = set(apispecs)
+        self.built_rules = count + len(rules)
+        self.schema_registry.invalidate()
+
+    def get_rule_specs(self, rules):
+        """
+        Runs `get_specs` over rules with the configured options
+        """
+        with self.app.app_context():
+            return get_specs(
+                rules,
+                set(self.config.get("ignore_verbs", ("HEAD", "OPTIONS"))),
+                # technically only responses is non-optional
+                self.config.get("optional_fields") or OPTIONAL_FIELDS,
+                self.sanitizer,
+                openapi_version=self.config.get("openapi"),
+                doc_dir=self.config.get("doc_dir"),
+                workers=self.config.get("spec_extraction_workers", 0),
+                processes=self.config.get("spec_extraction_processes", 0),
+            )
+
+    def warm_up(self, validators=None):
+        """
+        Builds every spec, the operation index of `parse=True` and,
+        optionally, the validators of the views, so no request pays for
+        them. Sets `ready` once done, even when it fails.
+
+        :param validators: compile the validators too, defaults to the
+            `warm_up_validators` config
+        :type validators: bool
+
+        :return: the errors raised while warming up, logged
+        :rtype: list
+        """
+        if validators is None:
+            validators = self.config.get("warm_up_validators", False)
+
+        errors = []
+        try:
+            with self.app.app_context():
+                for spec in self.config["specs"]:
+                    try:
+                        self.get_apispecs(spec["endpoint"])
+                    except Exception as e:
+                        logging.exception("Warm-up failed building the {0} spec".format(spec["endpoint"]))
+                        errors.append(e)
+
+                if self.parse and not errors:
+                    self.operation_index = self.single_flight.do("operation_index", self.build_operation_index)
+
+                for compiler in iter_validation_compilers(self.app) if validators else ():
+                    try:
+                        # the validator too, built for the checker requests use
+                        compiler().get_validator(getattr(compiler, "format_checker", None))
+                    except HTTPException:
+                        # aborts on each request, that's the view's job
+                        pass
+                    except Exception as e:
+                        logging.exception("Warm-up failed compiling a validator")
+                        errors.append(e)
+        finally:
+            self.warm_up_errors = errors
+            self.ready.set()
+
+        return errors
+
+    def start_warm_up(self):
+        """
+        Runs `warm_up` in a background thread, once, for the `"background"`
+        warm-up; apps call it when their routes are registered, else the
+        first request does, as walking the rules while they're being added
+        could fail or build partial specs
+
+        :return: the warm-up thread
+        :rtype: threading.Thread
+        """
+        with self._warm_up_lock:
+            if self.warm_up_thread is None:
+                self.warm_up_thread = threading.Thread(target=self.warm_up, name="flask_openapi-warm-up", daemon=True)
+                self.warm_up_thread.start()
+        return self.warm_up_thread
+
+    def prepare_fork(self):
+        """
+        Builds everything workers would build lazily, validators included,
+        then moves it to the permanent generation with `gc.freeze()` so
+        forked workers share those pages copy-on-write instead of each
+        holding a private copy. Meant for the master of preloading servers,
+        e.g. with gunicorn's `--preload`:
+
+            import gc
+            gc.disable()  # early, so no collection frees holes in pages
+
+            def when_ready(server):
+                server.app.wsgi().swag.prepare_fork()
+
+            def post_fork(server, worker):
+                gc.enable()
+
+        Collections stay disabled from here on, in case the master didn't
+        disable them earlier, until workers enable them after fork.
+        `flask_openapi.utils.memory.workers_uss` measures the saving.
+
+        :raise Exception: the first warm-up error
+        """
+        enabled = gc.isenabled()
+        gc.disable()
+        errors = self.warm_up(validators=True)
+        if errors:
+            if enabled:
+                gc.enable()
+            raise errors[0]
+
+        with self.app.app_context():
+            # the bytes served by APISpecsView and the `validate` registry
+            for spec in self.config["specs"]:
+                get_serialized_spec(self.get_apispecs(spec["endpoint"]))
+            get_schema_registry(self)
+
+        # otherwise collections after fork touch, and copy, every page; no
+        # collection first, the holes it leaves in pages get copied too
+        gc.freeze()
+
     def get_apispecs(self, endpoint="apispec_1"):
         if not self.app.debug and endpoint in self.apispecs:
-            return self.apispecs[endpoint]
+            if not self.specs_outdated():
+                return self.apispecs[endpoint]
+            if endpoint in self.extracted_apispecs:
+                # merges the rules registered since
+                self.single_flight.do("extend_apispecs", self.extend_apispecs)
+                apispecs = self.apispecs
+                if endpoint in apispecs and not self.specs_outdated():
+                    return apispecs[endpoint]
+
+        # concurrent first requests wait for a single build
+        return self.single_flight.do(("apispecs", endpoint), partial(self.load_apispecs, endpoint))
+
+    def load_apispecs(self, endpoint):
+        """
+        Loads the apispec of a spec endpoint from its `static_file`, else
+        builds it or, with `spec_cache_dir`, loads the one cached there
+        when built from the same sources
+        """
+        for spec in self.config["specs"]:
+            if spec["endpoint"] == endpoint and spec.get("static_file"):
+                return self.store_apispecs(endpoint, self.load_swagger_file(spec["static_file"]))
+
+        cache_dir = self.config.get("spec_cache_dir")
+        if not cache_dir or self.app.debug:
+            return self.build_apispecs(endpoint)
+
+        path = os.path.join(cache_dir, "{0}.json".format(endpoint))
+        fingerprint = spec_fingerprint(self)
+        data = load_cached_spec(path, fingerprint)
 
+        if data is None:
+            # with the files read by earlier extractions of the rules it holds
+            with recording_reads() as paths:
+                data = self.build_apispecs(endpoint)
+            self.source_files |= paths
+            save_cached_spec(path, fingerprint, data, frozenset(self.source_files))
+            return data
+
+        return self.store_apispecs(endpoint, data)
+
+    def store_apispecs(self, endpoint, data, count=None, extracted=False):
+        """
+        Caches an apispec until rules are added to the first count ones,
+        all the rules by default, it was made for; those extracted from
+        the rules are then extended with them, the others loaded again
+        """
+        if count is None:
+            count = self.rule_count()
+        if self.built_rules != count:
+            self.apispecs.clear()
+            self.extracted_apispecs.clear()
+            self.built_rules = count
+        self.apispecs[endpoint] = data
+        if extracted:
+            self.extracted_apispecs.add(endpoint)
+        else:
+            self.extracted_apispecs.discard(endpoint)
+        return data
+
+    @property
+    def static(self):
+        """
+        Tells if every spec is served from a prebuilt `static_file`, the
+        rules of the app then never being introspected
+        """
+        return bool(self.config["specs"]) and all(spec.get("static_file") for spec in self.config["specs"])
+
+    def static_specs(self):
+        """
+        Lists the operations of the prebuilt spec files like
+        `extract_specs` lists those of the rules, each operation holding
+        the definitions of its file
+
+        :return: list of (path, [(verb, operation)])
+        """
+        specs = []
+        for spec in self.config["specs"]:
+            apispec = self.get_apispecs(spec["endpoint"])
+            definitions = definitions_specs(parse_schema(apispec))
+
+            for path, operations in apispec.get("paths", {}).items():
+                verbs = [
+                    (verb, dict(operation, **definitions))
+                    for verb, operation in operations.items()
+                    if isinstance(operation, dict)
+                ]
+                specs.append((path, verbs))
+
+        return specs
+
+    def build_apispecs(self, endpoint):
+        """
+        Builds the apispec of a spec endpoint and caches it in `apispecs`
+        """
         spec = None
         for _spec in self.config["specs"]:
             if _spec["endpoint"] == endpoint:
@@ -224,6 +588,9 @@ class Swagger(object):
         if not spec:
             raise RuntimeError("Can`t find specs by endpoint {}," " check your flasgger`s config".format(endpoint))
 
+        # the spec is rebuilt, so are the schemas it may hold
+        self.schema_registry.invalidate()
+
         data = {
             # try to get from config['SWAGGER']['info']
             # then config['SWAGGER']['specs'][x]
@@ -256,10 +623,6 @@ class Swagger(object):
         if top_level_extension_options:
             data.update(top_level_extension_options)
 
-        # if True schemaa ids will be prefized by function_method_{id}
-        # for backwards compatibility with <= 0.5.14
-        prefix_ids = self.config.get("prefix_ids") or False
-
         if self.config.get("host"):
             data["host"] = self.config.get("host")
         if self.config.get("basePath"):
@@ -280,21 +643,12 @@ class Swagger(object):
         if self.template is not None:
             data.update(self.template)
 
-        paths = data["paths"]
         definitions = parse_schema(data)
-        ignore_verbs = set(self.config.get("ignore_verbs", ("HEAD", "OPTIONS")))
-
-        # technically only responses is non-optional
-        optional_fields = self.config.get("optional_fields") or OPTIONAL_FIELDS
 
-        specs = get_specs(
-            self.get_url_mappings(spec.get("rule_filter")),
-            ignore_verbs,
-            optional_fields,
-            self.sanitizer,
-            openapi_version=openapi_version,
-            doc_dir=self.config.get("doc_dir"),
-        )
+        # a projection of the shared extraction, copied as it gets modified
+        rules = list(self.app.url_map.iter_rules())
+        selected = list(filter(spec.get("rule_filter") or (lambda rule: True), rules))
+        specs = [(rule, deepcopy(verbs)) for rule, verbs in self.extract_specs(selected)]
 
         for name, def_model in self.get_def_models(spec.get("definition_filter")).items():
             description, swag = parse_definition_docstring(def_model, self.sanitizer)
@@ -303,6 +657,30 @@ class Swagger(object):
                     swag.update({"description": description})
                 definitions[name].update(swag)
 
+        self.merge_rule_specs(data, specs, definitions)
+
+        # published complete, other threads read it without waiting
+        return self.store_apispecs(endpoint, data, len(rules), extracted=True)
+
+    def merge_rule_specs(self, data, specs, definitions):
+        """
+        Adds the operations and definitions of extracted rules to an
+        apispec, while it's built or to a copy of it when rules are added
+
+        :param data: apispec
+        :param specs: list of (rule, [(verb, swag)]), modified
+        :param definitions: definitions of data, see `parse_schema`
+        """
+        openapi_version = self.config.get("openapi")
+        paths = data["paths"]
+
+        # if True schemaa ids will be prefized by function_method_{id}
+        # for backwards compatibility with <= 0.5.14
+        prefix_ids = self.config.get("prefix_ids") or False
+
+        # technically only responses is non-optional
+        optional_fields = self.config.get("optional_fields") or OPTIONAL_FIELDS
+
         def merge_sub_component(dest, key, source):
             if len(source) > 0 and dest.get(key) is None:
                 dest[key] = {}
@@ -484,7 +862,6 @@ class Swagger(object):
                         paths[srule][key].update(val)
                     else:
                         paths[srule][key] = val
-        self.apispecs[endpoint] = data
 
         # if is_openapi3(openapi_version):
         #     del data['definitions']
@@ -493,8 +870,6 @@ class Swagger(object):
             if definitions:
                 data.setdefault("components", {}).setdefault("schemas", {}).update(definitions)
 
-        return data
-
     def definition(self, name, tags=None):
         """
         Decorator to add class based definitions
@@ -502,6 +877,7 @@ class Swagger(object):
 
         def wrapper(obj):
             self.definition_models.append(SwaggerDefinition(name, obj, tags=tags))
+            self.schema_registry.invalidate()
             return obj
 
         return wrapper
@@ -574,6 +950,7 @@ class Swagger(object):
                     APISpecsView.as_view(
                         spec["endpoint"],
                         loader=partial(self.get_apispecs, endpoint=spec["endpoint"]),
+                        cache_control=self.config.get("specs_cache_control", "no-cache"),
                     )
                 ),
             )
@@ -590,6 +967,75 @@ class Swagger(object):
                 response.headers[header] = value
             return response
 
+    @staticmethod
+    def rule_to_path(rule):
+        """
+        Converts a rule like "/api/items/<int:id>/" to "/api/items/{id}/"
+        """
+        subs = []
+        for sub in str(rule).split("/"):
+            if "<" in sub:
+                if ":" in sub:
+                    start = sub.index(":") + 1
+                else:
+                    start = 1
+                subs.append("{{{:s}}}".format(sub[start:-1]))
+            else:
+                subs.append(sub)
+        return "/".join(subs)
+
+    def prepare_operation(self, doc, definitions):
+        """
+        Builds the parsers and schemas used to parse and validate the
+        requests of a documented operation
+        """
+        parsers = ParserMap()
+        schemas = defaultdict(lambda: {"type": "object", "properties": defaultdict(dict)})
+        # copied, the schemas get definitions added and doc is served
+        self.update_schemas_parsers(deepcopy(doc), schemas, parsers, definitions)
+        return RequestOperation(parsers, schemas)
+
+    def build_operation_index(self, rules=None):
+        """
+        Maps every documented (rule, method) of the app to its prepared
+        operation, keyed by `id(rule)` since rules aren't hashable
+
+        :param rules: rules to index, all those of the app by default
+
+        :return: {(id(rule), method): (rule, RequestOperation)}
+        """
+        if rules is None:
+            rules = list(self.app.url_map.iter_rules())
+            self.indexed_rules = len(rules)
+
+        apispecs = [self.get_apispecs(endpoint=spec["endpoint"]) for spec in self.config["specs"]]
+        index = {}
+
+        for rule in rules:
+            path = self.rule_to_path(rule)
+            for method in rule.methods or ():
+                for apispec in apispecs:
+                    doc = apispec["paths"].get(path, {}).get(method.lower())
+                    if doc:
+                        operation = self.prepare_operation(doc, parse_schema(apispec))
+                        index[(id(rule), method)] = (rule, operation)
+                        break
+
+        return index
+
+    def extend_operation_index(self):
+        """
+        Indexes the rules registered since the operation index was built
+
+        :return: a copy of the index with the new rules
+        """
+        count = self.indexed_rules
+        rules = list(islice(self.app.url_map.iter_rules(), count, None))
+        index = dict(self.operation_index)
+        index.update(self.build_operation_index(rules))
+        self.indexed_rules = count + len(rules)
+        return index
+
     def parse_request(self, app):
         @app.before_request
         def before_request():  # noqa
@@ -597,41 +1043,16 @@ class Swagger(object):
             Parse and validate request data(query, form, header and body),
             set data to `request.parsed_data`
             """
-            # convert "/api/items/<int:id>/" to "/api/items/{id}/"
-            subs = []
-            for sub in str(request.url_rule).split("/"):
-                if "<" in sub:
-                    if ":" in sub:
-                        start = sub.index(":") + 1
-                    else:
-                        start = 1
-                    subs.append("{{{:s}}}".format(sub[start:-1]))
-                else:
-                    subs.append(sub)
-            path = "/".join(subs)
-            path_key = path + request.method.lower()
+            # built on first request, once every route is registered
+            if self.operation_index is None or self.app.debug:
+                self.operation_index = self.single_flight.do("operation_index", self.build_operation_index)
+            elif self.indexed_rules != self.rule_count():
+                self.operation_index = self.single_flight.do("operation_index", self.extend_operation_index)
 
-            if not self.app.debug and path_key in self.parsers:
-                parsers = self.parsers[path_key]
-                schemas = self.schemas[path_key]
-            else:
-                doc = None
-                definitions = None
-                for spec in self.config["specs"]:
-                    apispec = self.get_apispecs(endpoint=spec["endpoint"])
-                    if path in apispec["paths"]:
-                        if request.method.lower() in apispec["paths"][path]:
-                            doc = apispec["paths"][path][request.method.lower()]
-                            definitions = parse_schema(apispec)
-                            break
-                if not doc:
-                    return
-
-                parsers = defaultdict(RequestParser)
-                schemas = defaultdict(lambda: {"type": "object", "properties": defaultdict(dict)})
-                self.update_schemas_parsers(doc, schemas, parsers, definitions)
-                self.schemas[path_key] = schemas
-                self.parsers[path_key] = parsers
+            entry = self.operation_index.get((id(request.url_rule), request.method))
+            if entry is None or entry[0] is not request.url_rule:
+                return
+            parsers, schemas = entry[1]
 
             parsed_data = {"path": request.view_args}
             for location in parsers.keys():
@@ -640,8 +1061,7 @@ class Swagger(object):
                 parsed_data["json"] = request.json or {}
             for location, data in parsed_data.items():
                 try:
-                    ret = self.validation_function(data, schemas[location])
-                    print(ret)
+                    self.validation_function(data, schemas[location])
                 except jsonschema.ValidationError as e:
                     self.validation_error_handler(e, data, schemas[location])
 
@@ -663,22 +1083,23 @@ class Swagger(object):
                     json_schema = value.get("schema", {})
                 else:  # schema set in requesty body
                     # Since osa3 might changed, repeat openapi2's code
-                    parsers[location].add_argument(
-                        name,
-                        type=self.SCHEMA_TYPES[
-                            value["schema"].get("type", None) if "schema" in value else value.get("type", None)
-                        ],
-                        required=value.get("required", False),
-                        # Parsed in body
-                        location=self.SCHEMA_LOCATIONS["body"],
-                        store_missing=False,
-                    )
+                    # Parsed in body
+                    parsers[location].add_parameter(dict(value, name=name))
 
             # TODO support anyOf and oneOf in the future
             if json_schema and isinstance(json_schema, dict):
                 schemas[location] = json_schema
                 self.set_schemas(schemas, location, definitions)
 
+            for param in doc.get("parameters", []):
+                location = self.OAS3_PARAMETER_LOCATIONS.get(param.get("in"))
+                if location is None:
+                    continue
+
+                parsers[location].add_parameter(param, openapi3=True)
+                schemas[location]["properties"][param["name"]] = param.get("schema", {})
+                self.set_schemas(schemas, location, definitions)
+
         else:  # openapi2
             for param in doc.get("parameters", []):
                 location = self.SCHEMA_LOCATIONS[param["in"]]
@@ -688,15 +1109,7 @@ class Swagger(object):
                 else:
                     name = param["name"]
                     if location != "path":
-                        parsers[location].add_argument(
-                            name,
-                            type=self.SCHEMA_TYPES[
-                                param["schema"].get("type", None) if "schema" in param else param.get("type", None)
-                            ],
-                            required=param.get("required", False),
-                            location=self.SCHEMA_LOCATIONS[param["in"]],
-                            store_missing=False,
-                        )
+                        parsers[location].add_parameter(param)
 
                     for k in param:
                         if k != "required":
@@ -747,19 +1160,47 @@ class Swagger(object):
         if validation_error_handler is None:
             validation_error_handler = self.validation_error_handler
 
+        # the default function would look up a CompiledSchema of its own,
+        # requests use the compiled one, and its validator, directly
+        if validation_function is self.default_validation_function:
+            check_function, format_checker = None, self.format_checker
+        else:
+            check_function, format_checker = validation_function, None
+
         def decorator(func):
+            compiled = None
+
+            def compile_validation():
+                """
+                Looks up and compiles the schema once, on first call, when
+                every route is registered. Debug apps recompile each time.
+                """
+                nonlocal compiled
+                if compiled is None or self.app.debug:
+                    entry = get_schema_registry(self).lookup(schema_id)
+                    if entry is None:
+                        abort(Response("Filepath or specs is needed to validate", status=500))
+                    # the registry matches ids case insensitively, compiled by its own name
+                    compiled = get_compiled_schema(
+                        entry.name,
+                        specs=entry.specs,
+                        openapi_version=self.config.get("openapi"),
+                    )
+                return compiled
+
             @wraps(func)
             def wrapper(*args, **kwargs):
-                specs = get_schema_specs(schema_id, self)
-                validate(
-                    schema_id=schema_id,
-                    specs=specs,
-                    validation_function=validation_function,
+                validate_compiled(
+                    compile_validation(),
+                    validation_function=check_function,
                     validation_error_handler=validation_error_handler,
-                    openapi_version=self.config.get("openapi"),
+                    format_checker=format_checker,
                 )
                 return func(*args, **kwargs)
 
+            # the checker requests validate with, for `warm_up`
+            compile_validation.format_checker = format_checker
+            wrapper.compile_validation = compile_validation
             return wrapper
 
         return decorator
@@ -773,14 +1214,13 @@ class Swagger(object):
 
         :param schema_id: the id of the desired schema
         """
-        schema_specs = get_schema_specs(schema_id, self)
+        entry = get_schema_registry(self).lookup(schema_id)
 
-        if schema_specs is None:
+        if entry is None:
             raise KeyError("Specified schema_id '{0}' not found".format(schema_id))
 
-        for schema in (parameter.get("schema") for parameter in schema_specs["parameters"]):
-            if schema is not None and schema.get("id").lower() == schema_id:
-                return schema
+        # a copy, the registry's is shared by validations
+        return deepcopy(entry.schema)
 
     def is_openapi3(self):
         return is_openapi3(self.config.get("openapi"))
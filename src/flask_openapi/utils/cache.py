@@ -0,0 +1,195 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional
+
+
+class CacheInfo(NamedTuple):
+    hits: int
+    misses: int
+    maxsize: Optional[int]
+    currsize: int
+
+
+class LRUCache(object):
+    """
+    Thread-safe least recently used cache with hit and miss counters
+
+    Mirrors the `cache_info()` / `cache_clear()` interface of
+    `functools.lru_cache` so the caches used across the package can be
+    inspected the same way.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Return the cached value for key, counting a hit or a miss
+
+        :param key: cache key
+        :type key: Hashable
+
+        :param default: value returned on a miss
+        :type default: Any
+
+        :return: cached value or default
+        :rtype: Any
+        """
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return default
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """
+        Store value under key, evicting the least recently used entry
+        when the cache is full
+
+        :param key: cache key
+        :type key: Hashable
+
+        :param value: value to store
+        :type value: Any
+
+        :return: None
+        """
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if self.maxsize is not None and len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def get_or_set(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the cached value for key, building it with factory on a miss
+
+        :param key: cache key
+        :type key: Hashable
+
+        :param factory: zero argument callable building the value
+        :type factory: Callable
+
+        :return: cached value
+        :rtype: Any
+        """
+        with self._lock:
+            if key in self._data:
+                self._data.move_to_end(key)
+                self._hits += 1
+                return self._data[key]
+            self._misses += 1
+
+        value = factory()
+        self.set(key, value)
+        return value
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop a single entry from the cache
+
+        :param key: cache key
+        :type key: Hashable
+
+        :return: None
+        """
+        with self._lock:
+            self._data.pop(key, None)
+
+    def cache_clear(self) -> None:
+        """
+        Drop every entry and reset the counters
+        """
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """
+        Report hits, misses, maxsize and current size
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._data
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._data)
+
+
+class _Flight(object):
+    """
+    A build in progress, awaited by the callers of the same key
+    """
+
+    def __init__(self) -> None:
+        self.owner: int = threading.get_ident()
+        self.done = threading.Event()
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight(object):
+    """
+    Runs at most one build per key at a time: callers arriving while a
+    build of the key is in progress wait for it and share its outcome,
+    value or exception, instead of building the same thing in parallel
+
+    Values aren't kept once handed out, caching them is left to the caller.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """
+        Return the value built by factory, or by the build of key already
+        in progress
+
+        :param key: build key
+        :type key: Hashable
+
+        :param factory: zero argument callable building the value
+        :type factory: Callable
+
+        :return: built value
+        :rtype: Any
+        """
+        with self._lock:
+            flight: Optional[_Flight] = self._flights.get(key)
+            leader: bool = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            # a factory needing its own key builds again rather than deadlock
+            if flight.owner == threading.get_ident():
+                return factory()
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            flight.value = factory()
+            return flight.value
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._flights[key]
+            flight.done.set()
@@ -1,8 +1,43 @@
 import codecs
+import copy
 import importlib
 import logging
 import os
-from typing import Any, Literal, Optional, List, Tuple
+import threading
+from concurrent.futures import Executor
+from contextlib import contextmanager
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+    List,
+    Set,
+    Tuple,
+)
+
+import yaml
+from flask_openapi.utils.cache import LRUCache
+
+YAML_CACHE_SIZE: int = 1024
+MAX_DOCUMENTS_PER_FILE: int = 16
+
+
+class CachedFile(NamedTuple):
+    signature: Tuple[int, int]
+    text: str
+    documents: Dict[str, Any]
+
+
+_file_cache: Dict[str, CachedFile] = {}
+_file_cache_lock = threading.Lock()
+_yaml_cache: LRUCache = LRUCache(maxsize=YAML_CACHE_SIZE)
+# paths read by each active `recording_reads` block
+_read_recorders: List[Set[str]] = []
+_MISSING: Any = object()
 
 
 def detect_by_bom(path: str, default: str = "utf-8") -> str:
@@ -34,13 +69,225 @@ def detect_by_bom(path: str, default: str = "utf-8") -> str:
     return default
 
 
+def file_signature(path: str) -> Tuple[int, int]:
+    """
+    Returns the (mtime, size) pair used to detect changes to a file
+
+    :param path: path to file
+    :type path: str
+
+    :return: modification time in nanoseconds and size in bytes
+    :rtype: Tuple[int, int]
+    """
+    stat: os.stat_result = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+@contextmanager
+def recording_reads() -> Iterator[Set[str]]:
+    """
+    Collects the absolute paths of the files read by `read_file`, from
+    any thread, while in the block
+
+    :return: paths read, filled as they are
+    :rtype: Set[str]
+    """
+    paths: Set[str] = set()
+    with _file_cache_lock:
+        _read_recorders.append(paths)
+    try:
+        yield paths
+    finally:
+        with _file_cache_lock:
+            # sets compare by content, remove this very one
+            for index, recorder in enumerate(_read_recorders):
+                if recorder is paths:
+                    del _read_recorders[index]
+                    break
+
+
+def note_reads(paths: Iterable[str]) -> None:
+    """
+    Reports files read without `read_file`, from results cached by
+    callers, to the `recording_reads` blocks
+    """
+    if not _read_recorders:
+        return
+    absolute: List[str] = [os.path.abspath(path) for path in paths]
+    for recorder in list(_read_recorders):
+        recorder.update(absolute)
+
+
+def read_file(path: str) -> str:
+    """
+    Read a text file, detecting its encoding by BOM
+
+    The content is cached per absolute path and read again only when the
+    mtime or the size of the file changes.
+
+    :param path: path to file
+    :type path: str
+
+    :return: file content
+    :rtype: str
+    """
+    path = os.path.abspath(path)
+    signature: Tuple[int, int] = file_signature(path)
+    cached: Optional[CachedFile] = _file_cache.get(path)
+    note_reads((path,))
+
+    if cached is not None and cached.signature == signature:
+        return cached.text
+
+    with codecs.open(path, encoding=detect_by_bom(path)) as file:
+        text: str = file.read()
+
+    with _file_cache_lock:
+        _file_cache[path] = CachedFile(signature, text, {})
+
+    return text
+
+
+def load_yaml(
+    content: str,
+    path: Optional[str] = None,
+    shared: bool = False,
+    preloaded: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """
+    Parse YAML content, reusing earlier results for the same content
+
+    When the content comes from a file, pass its path: the parsed
+    documents are then kept with the cached file and dropped as soon as
+    the file changes. Other content (docstrings) goes to a bounded cache.
+    Callers receive their own copy and are free to mutate it, unless
+    they ask for the shared cached object.
+
+    :param content: YAML content
+    :type content: str
+
+    :param path: file the content was read from
+    :type path: Optional[str]
+
+    :param shared: return the cached object itself, which must not be
+        mutated, instead of a copy
+    :type shared: bool
+
+    :param preloaded: contents parsed by `preload_yaml`, looked up first
+        and left out of the caches
+    :type preloaded: Optional[Dict[str, Any]]
+
+    :return: parsed content
+    :rtype: Any
+    """
+    if preloaded is not None and content in preloaded:
+        parsed: Any = preloaded[content]
+        return parsed if shared else copy.deepcopy(parsed)
+
+    if path is None:
+        parsed = _yaml_cache.get_or_set(content, lambda: yaml.safe_load(content))
+        return parsed if shared else copy.deepcopy(parsed)
+
+    path = os.path.abspath(path)
+    cached: Optional[CachedFile] = _file_cache.get(path)
+
+    try:
+        if cached is None or cached.signature != file_signature(path):
+            read_file(path)
+            cached = _file_cache[path]
+    except (OSError, KeyError):
+        return yaml.safe_load(content)
+
+    parsed = cached.documents.get(content, _MISSING)
+
+    if parsed is _MISSING:
+        parsed = yaml.safe_load(content)
+        with _file_cache_lock:
+            if len(cached.documents) >= MAX_DOCUMENTS_PER_FILE:
+                cached.documents.clear()
+            cached.documents[content] = parsed
+
+    return parsed if shared else copy.deepcopy(parsed)
+
+
+def safe_load_or_error(content: str) -> Tuple[bool, Any]:
+    """
+    `yaml.safe_load` returning (False, None) instead of raising, module
+    level so process pools can pickle it
+    """
+    try:
+        return True, yaml.safe_load(content)
+    except yaml.YAMLError:
+        return False, None
+
+
+def preload_yaml(
+    contents: Iterable[Tuple[str, Optional[str]]], executor: Optional[Executor] = None
+) -> Dict[str, Any]:
+    """
+    Parses YAML contents ahead of `load_yaml`, returning them for its
+    `preloaded` argument rather than through the bounded docstring cache,
+    which would evict the first results before they are read back when
+    there are more than it holds. Contents already cached are skipped,
+    and invalid ones too, `load_yaml` raising for them.
+
+    :param contents: (content, path of its file or None) pairs
+    :type contents: Iterable[Tuple[str, Optional[str]]]
+
+    :param executor: parses in this executor, e.g. a process pool,
+        instead of the current thread
+    :type executor: Optional[Executor]
+
+    :return: parsed documents by content
+    :rtype: Dict[str, Any]
+    """
+    missing: Dict[str, None] = {}
+
+    for content, path in contents:
+        if content in missing:
+            continue
+        if path is None:
+            if content not in _yaml_cache:
+                missing[content] = None
+            continue
+
+        path = os.path.abspath(path)
+        try:
+            read_file(path)
+        except OSError:
+            continue
+        if content not in _file_cache[path].documents:
+            missing[content] = None
+
+    texts: List[str] = list(missing)
+    if executor is not None:
+        results: Iterable = executor.map(
+            safe_load_or_error, texts, chunksize=max(1, len(texts) // 64)
+        )
+    else:
+        results = map(safe_load_or_error, texts)
+
+    return {
+        content: parsed for content, (loaded, parsed) in zip(texts, results) if loaded
+    }
+
+
+def clear_file_cache() -> None:
+    """
+    Drop every cached file and parsed YAML document
+    """
+    with _file_cache_lock:
+        _file_cache.clear()
+    _yaml_cache.cache_clear()
+
+
 def load_from_file(
     path: str,
     file_type: Literal["yml", "yaml"] = "yml",
     root_path: Optional[str] = None,
 ) -> str:
     """
-    Load swagger file from path
+    Load swagger file from path, through the `read_file` cache
 
     :param path: path to swagger file
     :type path: str
@@ -59,19 +306,13 @@ def load_from_file(
         raise AttributeError("Currently only yaml or yml supported")
 
     try:
-        encoding: str = detect_by_bom(path)
-
-        with codecs.open(path, encoding=encoding) as yaml_file:
-            return yaml_file.read()
+        return read_file(path)
 
     except IOError:
         path = os.path.join(root_path or os.path.dirname(__file__), path)
 
         try:
-            encoding = detect_by_bom(path)
-
-            with codecs.open(path, encoding=encoding) as yaml_file:
-                return yaml_file.read()
+            return read_file(path)
 
         except IOError:
             path = path.replace("/", os.sep).replace("\\", os.sep)
@@ -88,8 +329,7 @@ def load_from_file(
 
             path = os.path.join(site_package, os.sep.join(split_path[1:]))
 
-            with open(path) as yaml_file:
-                return yaml_file.read()
+            return read_file(path)
     except TypeError:
         logging.warning(f"File path {path} either doesnt exist or is in the wrong type")
 
@@ -0,0 +1,64 @@
+import os
+from typing import Dict, Iterable, Optional
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# private pages of smaps_rollup, in kB
+USS_FIELDS = ("Private_Clean", "Private_Dirty", "Private_Hugetlb")
+
+
+def process_uss(pid: Optional[int] = None) -> Optional[int]:
+    """
+    Returns the unique set size of a process: the memory only it holds,
+    which is what each worker adds once pages shared copy-on-write with
+    the master are left out
+
+    Read from `/proc/<pid>/smaps_rollup` on Linux, else from psutil when
+    installed.
+
+    :param pid: process id, the current process by default
+    :type pid: Optional[int]
+
+    :return: USS in bytes, None when it can't be measured
+    :rtype: Optional[int]
+    """
+    pid = os.getpid() if pid is None else pid
+
+    try:
+        with open("/proc/{0}/smaps_rollup".format(pid)) as f:
+            lines = f.readlines()
+    except OSError:
+        lines = []
+
+    if lines:
+        total: int = 0
+        for line in lines:
+            field, _, value = line.partition(":")
+            if field in USS_FIELDS:
+                total += int(value.split()[0]) * 1024
+        return total
+
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_full_info().uss
+        except (psutil.Error, AttributeError):
+            return None
+
+    return None
+
+
+def workers_uss(pids: Iterable[int]) -> Dict[int, Optional[int]]:
+    """
+    Returns the USS of each worker, like those of gunicorn's
+    `server.WORKERS`, to compare them with and without preloading
+
+    :param pids: worker process ids
+    :type pids: Iterable[int]
+
+    :return: USS in bytes by pid
+    :rtype: Dict[int, Optional[int]]
+    """
+    return {pid: process_uss(pid) for pid in pids}
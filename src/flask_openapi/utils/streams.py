@@ -0,0 +1,171 @@
+import codecs
+import json
+from typing import Any, BinaryIO, Iterator
+
+STREAM_CHUNK_SIZE: int = 64 * 1024
+# characters an item (or NDJSON line) may span, bounding the buffer
+MAX_ITEM_SIZE: int = 16 * 1024 * 1024
+
+JSON_WHITESPACE: str = " \t\n\r"
+JSON_NUMBER_CHARS: str = "0123456789+-.eE"
+
+
+class _ChunkReader(object):
+    """
+    Text buffer filled chunk by chunk from a binary stream
+    """
+
+    def __init__(self, stream: BinaryIO, chunk_size: int, encoding: str):
+        self.stream = stream
+        self.chunk_size = chunk_size
+        self.decoder = codecs.getincrementaldecoder(encoding)()
+        self.buffer: str = ""
+        self.position: int = 0
+        self.eof: bool = False
+
+    def fill(self) -> None:
+        """
+        Drops the consumed text and appends the next chunk
+        """
+        chunk: bytes = self.stream.read(self.chunk_size)
+        self.eof = not chunk
+        text: str = self.decoder.decode(chunk, final=self.eof)
+        self.buffer = self.buffer[self.position :] + text
+        self.position = 0
+
+    def peek(self) -> str:
+        """
+        Returns the next non whitespace character, "" at the end of data
+        """
+        while True:
+            while (
+                self.position < len(self.buffer)
+                and self.buffer[self.position] in JSON_WHITESPACE
+            ):
+                self.position += 1
+            if self.position < len(self.buffer) or self.eof:
+                return self.buffer[self.position : self.position + 1]
+            self.fill()
+
+    def check_size(self, max_size: int) -> None:
+        """
+        Raises when the unconsumed text grew over max_size characters
+        """
+        if len(self.buffer) - self.position > max_size:
+            raise ValueError("JSON item larger than {0} characters".format(max_size))
+
+
+def iter_json_array(
+    stream: BinaryIO,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    max_item_size: int = MAX_ITEM_SIZE,
+) -> Iterator[Any]:
+    """
+    Yields the items of a JSON array read incrementally from a stream,
+    so only one item (and a chunk) is held in memory at a time
+
+    :param stream: binary stream holding a JSON array
+    :type stream: BinaryIO
+
+    :param chunk_size: bytes read at a time
+    :type chunk_size: int
+
+    :param encoding: encoding of the stream
+    :type encoding: str
+
+    :param max_item_size: characters an item may span
+    :type max_item_size: int
+
+    :raise ValueError: when the data isn't a well formed JSON array or
+        an item is larger than max_item_size
+
+    :return: iterator of items
+    :rtype: Iterator[Any]
+    """
+    decoder: json.JSONDecoder = json.JSONDecoder()
+    reader: _ChunkReader = _ChunkReader(stream, chunk_size, encoding)
+
+    if reader.peek() != "[":
+        raise ValueError("Expected a JSON array")
+    reader.position += 1
+
+    if reader.peek() == "]":
+        reader.position += 1
+    else:
+        while True:
+            reader.peek()
+            try:
+                item, end = decoder.raw_decode(reader.buffer, reader.position)
+            except json.JSONDecodeError:
+                item, end = None, None
+
+            # a number at the end of the buffer may go on in the next chunk
+            if end is None or (
+                not reader.eof
+                and isinstance(item, (int, float))
+                and not isinstance(item, bool)
+                and not reader.buffer[end:].strip(JSON_NUMBER_CHARS)
+            ):
+                if reader.eof:
+                    raise ValueError("Malformed JSON array item")
+                reader.check_size(max_item_size)
+                reader.fill()
+                continue
+
+            reader.position = end
+            yield item
+
+            separator: str = reader.peek()
+            reader.position += 1
+            if separator == "]":
+                break
+            if separator != ",":
+                raise ValueError("Expected ',' or ']' in JSON array")
+
+    if reader.peek() != "":
+        raise ValueError("Extra data after JSON array")
+
+
+def iter_ndjson(
+    stream: BinaryIO,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    encoding: str = "utf-8",
+    max_item_size: int = MAX_ITEM_SIZE,
+) -> Iterator[Any]:
+    """
+    Yields the documents of a newline delimited JSON stream, skipping
+    blank lines
+
+    :param stream: binary stream holding one JSON document per line
+    :type stream: BinaryIO
+
+    :param chunk_size: bytes read at a time
+    :type chunk_size: int
+
+    :param encoding: encoding of the stream
+    :type encoding: str
+
+    :param max_item_size: characters a line may span
+    :type max_item_size: int
+
+    :raise ValueError: when a line isn't valid JSON or is larger than
+        max_item_size
+
+    :return: iterator of documents
+    :rtype: Iterator[Any]
+    """
+    reader: _ChunkReader = _ChunkReader(stream, chunk_size, encoding)
+
+    while not reader.eof:
+        reader.fill()
+        lines = reader.buffer.split("\n")
+        reader.buffer, reader.position = lines.pop(), 0
+
+        for line in lines:
+            if line.strip():
+                yield json.loads(line)
+        reader.check_size(max_item_size)
+
+    if reader.buffer.strip():
+        yield json.loads(reader.buffer)